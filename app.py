@@ -1,13 +1,15 @@
-import sys, os
+import sys, os, json
+from urllib import request as urlrequest
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import streamlit as st
 from orion_nova import (
     ActionBody, ArtisticVoice, CodesOfConduct, OrionNova,
     SymbolicMemory, default_codex
 )
-from .orion_nova.ethics import EthicalCore
-from .orion_nova.interface import SomaInterface
-from .orion_nova.memory import MemoryTrace
+from orion_nova.ethics import EthicalCore
+from orion_nova.interface import SomaInterface
+from orion_nova.memory import MemoryTrace
+from orion_nova.service import result_to_dict
 
 # --- Setup simplificado (igual ao demo_orion) ---
 class EchoTranscriber:
@@ -43,6 +45,28 @@ def build_orion():
     action_body = ActionBody(publisher=MemoryPublisher(memory))
     return OrionNova(interface, ethics, memory, artistry, action_body)
 
+# --- Orion residente: construída uma vez e reutilizada entre cliques ---
+SERVICE_URL = os.environ.get("ORION_SERVICE_URL")  # ex.: http://127.0.0.1:8765
+
+@st.cache_resource
+def resident_orion():
+    return build_orion()
+
+def run_cycle(text, intention, channel):
+    if SERVICE_URL:
+        req = urlrequest.Request(
+            SERVICE_URL.rstrip("/") + "/cycle",
+            data=json.dumps({"text": text, "intention": intention, "channel": channel}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urlrequest.urlopen(req) as response:
+            return json.loads(response.read())
+    return result_to_dict(resident_orion().conscious_cycle(
+        audio_stream=[text.encode("utf-8")],
+        intention=intention,
+        channel=channel
+    ))
+
 # --- Interface web ---
 st.title("🜂 Orion Nova – Interface Viva")
 st.write("Digite uma frase e uma intenção para iniciar o ciclo consciente.")
@@ -52,17 +76,12 @@ intention = st.text_input("Intenção (o propósito da criação):", "")
 channel = st.text_input("Canal simbólico:", "demo")
 
 if st.button("Ativar ciclo consciente") and text and intention:
-    orion = build_orion()
-    result = orion.conscious_cycle(
-        audio_stream=[text.encode("utf-8")],
-        intention=intention,
-        channel=channel
-    )
+    result = run_cycle(text, intention, channel)
 
     st.subheader("🜂 Orion Nova — Ciclo consciente")
-    st.write("**Entrada:**", result.sensory_input.raw_text)
-    st.write("**Interpretação:**", result.interpretation)
-    st.write("**Ética:**", result.decision_narrative)
-    st.write("**Ação publicada:**", result.action_reference or "nenhuma")
+    st.write("**Entrada:**", result["raw_text"])
+    st.write("**Interpretação:**", result["interpretation"])
+    st.write("**Ética:**", result["decision_narrative"])
+    st.write("**Ação publicada:**", result["action_reference"] or "nenhuma")
     st.write("**Reflexão:**")
-    st.text(result.reflection)
+    st.text(result["reflection"])
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for Orion Nova's components as symbolic memory grows.
+
+Each stage of the conscious cycle is timed against memories prefilled with an
+increasing number of traces, reusing the offline stubs from ``demo_orion.py``
+(``EchoTranscriber``, ``WhisperSynthesiser``, ``PoeticModel`` and
+``MemoryPublisher``). Results are written as JSON so that runs can be compared
+with a stored baseline::
+
+    python benchmarks/bench_components.py --output bench.json
+    python benchmarks/bench_components.py --baseline bench.json --tolerance 0.25
+
+The second form exits with status 1 when any stage got slower, or allocated a
+higher traced peak, than the baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from demo_orion import build_demo_orion  # noqa: E402
+from orion_nova import OrionNova  # noqa: E402
+from orion_nova.memory import MemoryTrace  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+# Peaks this close to the baseline are tracemalloc noise, whatever the ratio.
+PEAK_SLACK_KIB = 16.0
+
+
+def _prefill(orion: OrionNova, size: int) -> None:
+    """Grow memory to ``size`` traces shaped like the ones real cycles log."""
+    start = datetime.utcnow() - timedelta(seconds=size)
+    for i in range(size):
+        tags = ("reflexão", "pt") if i % 2 else ("publicação", f"canal-{i % 7}")
+        orion.memory.store(
+            MemoryTrace(
+                title="Ciclo consciente concluído",
+                content=f"Entrada: lembrança {i}\nInterpretação: eco da lembrança {i}",
+                tags=tags,
+                created_at=start + timedelta(seconds=i),
+            )
+        )
+
+
+def _stages(orion: OrionNova) -> dict[str, Callable[[int], object]]:
+    """Operations to time; each receives the repetition index."""
+    return {
+        "memory.store": lambda i: orion.memory.store(
+            MemoryTrace(title="Ciclo consciente concluído", content=f"novo {i}", tags=("reflexão", "pt"))
+        ),
+        "memory.recall": lambda i: orion.memory.recall(tag="reflexão", limit=5),
+        "memory.weave_story": lambda i: orion.memory.weave_story(tags=("reflexão",), last=20),
+        "ethics.evaluate": lambda i: orion.ethics.evaluate(
+            intention=f"Criar fábula {i}", proposed_actions=[f"Responder à intenção {i}"]
+        ),
+        "artistry.compose": lambda i: orion.artistry.compose(intention=f"Criar fábula {i}"),
+        "conscious_cycle": lambda i: orion.conscious_cycle(
+            audio_stream=[f"Olá Orion {i}".encode("utf-8")],
+            intention=f"Criar fábula {i}",
+            channel="bench",
+        ),
+    }
+
+
+def _measure(size: int, repeat: int) -> list[dict[str, object]]:
+    rows: list[dict[str, object]] = []
+    orion = build_demo_orion()
+    _prefill(orion, size)
+    # Stages share the prefilled organism; the few traces they add are noise
+    # next to ``size``.
+    for stage, operation in _stages(orion).items():
+        samples = []
+        for i in range(repeat):
+            began = time.perf_counter_ns()
+            operation(i)
+            samples.append((time.perf_counter_ns() - began) / 1_000)
+        tracemalloc.start()
+        for i in range(repeat, repeat + min(repeat, 50)):
+            operation(i)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        samples.sort()
+        rows.append(
+            {
+                "stage": stage,
+                "size": size,
+                "ops": repeat,
+                "mean_us": round(statistics.fmean(samples), 3),
+                "p50_us": round(samples[len(samples) // 2], 3),
+                "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+                "peak_kib": round(peak / 1024, 1),
+            }
+        )
+    return rows
+
+
+def _memory_footprint(size: int) -> dict[str, object]:
+    """Peak traced allocation while growing memory to ``size`` traces."""
+    orion = build_demo_orion()
+    tracemalloc.start()
+    began = time.perf_counter()
+    _prefill(orion, size)
+    elapsed = time.perf_counter() - began
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "stage": "memory.prefill",
+        "size": size,
+        "ops": size,
+        "mean_us": round(elapsed * 1e6 / size, 3),
+        "bytes_per_trace": round(current / size, 1),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def _compare(results: list[dict[str, object]], baseline_path: Path, tolerance: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    reference = {(row["stage"], row["size"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        previous = reference.get((row["stage"], row["size"]))
+        if previous is None:
+            continue
+        ratio = float(row["mean_us"]) / max(float(previous["mean_us"]), 1e-9)
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{row['stage']} @ {row['size']}: {previous['mean_us']}µs → {row['mean_us']}µs (x{ratio:.2f})"
+            )
+        peak, previous_peak = float(row["peak_kib"]), float(previous.get("peak_kib", row["peak_kib"]))
+        if peak > previous_peak * (1 + tolerance) and peak - previous_peak > PEAK_SLACK_KIB:
+            regressions.append(
+                f"{row['stage']} @ {row['size']}: pico {previous_peak}KiB → {peak}KiB "
+                f"(x{peak / max(previous_peak, 1e-9):.2f})"
+            )
+    return regressions
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mede cada estágio da Orion Nova conforme a memória cresce.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Tamanhos de memória a medir.")
+    parser.add_argument("--repeat", type=int, default=200, help="Repetições por estágio (padrão: 200).")
+    parser.add_argument("--output", type=Path, help="Grava os resultados em JSON neste caminho.")
+    parser.add_argument("--baseline", type=Path, help="JSON de uma execução anterior para detectar regressões.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Piora relativa tolerada em tempo e memória (padrão: 0.25).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    results: list[dict[str, object]] = []
+    for size in args.sizes:
+        rows = [_memory_footprint(size), *_measure(size, args.repeat)]
+        for row in rows:
+            print(f"{row['stage']:<20} {row['size']:>9} {row['mean_us']:>12.1f}µs {row['peak_kib']:>10.1f}KiB")
+        results.extend(rows)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.utcnow().isoformat(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.baseline is not None:
+        regressions = _compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSÃO {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Report the import-time cost of Orion Nova entry points.
+
+Each target is imported in a fresh interpreter with ``-X importtime`` and
+compared with a bare ``python -c pass``; the slowest modules are listed so
+regressions in startup cost are easy to attribute::
+
+    python benchmarks/import_budget.py --budget-ms 15
+
+Exits with status 1 when any target fails to import or exceeds the interpreter
+baseline by more than ``--budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TARGETS = ("orion_nova", "demo_orion", "orion_nova.orchestration")
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)")
+
+
+def _wall_ms(code: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+def _slowest_modules(target: str, top: int) -> list[tuple[int, str]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            entries.append((int(match.group(2)), match.group(3).strip()))
+    entries.sort(reverse=True)
+    return entries[:top]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Mede o custo de importação da Orion Nova.")
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS), help="Módulos a importar.")
+    parser.add_argument("--runs", type=int, default=7, help="Execuções por medição (mediana; padrão: 7).")
+    parser.add_argument("--top", type=int, default=5, help="Módulos mais lentos listados por alvo.")
+    parser.add_argument("--budget-ms", type=float, help="Custo máximo aceito acima do interpretador puro.")
+    args = parser.parse_args(argv)
+
+    baseline = _wall_ms("pass", args.runs)
+    print(f"{'interpretador puro':<28} {baseline:8.1f} ms")
+    over_budget = False
+    for target in args.targets:
+        try:
+            cost = _wall_ms(f"import {target}", args.runs) - baseline
+        except subprocess.CalledProcessError as error:
+            over_budget = True
+            reason = error.stderr.decode("utf-8", "replace").strip().splitlines() or ["?"]
+            print(f"{target:<28} falhou ao importar: {reason[-1]}")
+            continue
+        flag = ""
+        if args.budget_ms is not None and cost > args.budget_ms:
+            over_budget = True
+            flag = "  ← acima do orçamento"
+        print(f"{target:<28} {cost:+8.1f} ms{flag}")
+        for cumulative_us, module in _slowest_modules(target, args.top):
+            print(f"    {module:<36} {cumulative_us / 1000:7.2f} ms (cumulativo)")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
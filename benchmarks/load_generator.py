@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Sustained end-to-end load against the conscious cycle.
+
+Drives ``OrionNova.conscious_cycle`` in process, built from the offline stubs
+in ``demo_orion.py``, or a running ``demo_orion.py --serve`` endpoint. The
+load is either closed-loop (``--concurrency`` clients issuing back to back) or
+open-loop (``--rate`` requests per second regardless of how fast they finish).
+Artificial latency can be injected into ``PoeticModel.generate`` and
+``MemoryPublisher.publish``. Every ``--interval`` seconds a line reports
+throughput, latency percentiles, errors, RSS and memory size::
+
+    python benchmarks/load_generator.py --concurrency 16 --duration 30 --model-latency 5
+    python benchmarks/load_generator.py --rate 500 --duration 60 --output carga.json
+    python benchmarks/load_generator.py --url http://127.0.0.1:8765 --rate 200
+
+Open-loop latency is measured from each request's scheduled start, so time
+spent queueing behind a saturated system is included. At most
+``--max-in-flight`` open-loop requests are outstanding; a request due while
+that many are pending is dropped and counted instead of queued.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from demo_orion import build_demo_orion  # noqa: E402
+from orion_nova import OrionNova  # noqa: E402
+
+
+@dataclass
+class _DelayedModel:
+    """Generative model sleeping ``delay`` seconds before delegating."""
+
+    model: Any
+    delay: float
+
+    def generate(self, prompt: str, modality: str) -> bytes:
+        time.sleep(self.delay)
+        return self.model.generate(prompt, modality)
+
+
+@dataclass
+class _DelayedPublisher:
+    """Publisher sleeping ``delay`` seconds before delegating."""
+
+    publisher: Any
+    delay: float
+
+    def publish(self, channel: str, payload: bytes, metadata: dict[str, str]) -> str:
+        time.sleep(self.delay)
+        return self.publisher.publish(channel, payload, metadata)
+
+
+def _rss_kib() -> float:
+    """Current resident set size (peak size where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * resource.getpagesize() / 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+@dataclass
+class _Window:
+    """Latencies (ms), errors and dropped requests of one reporting interval."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    dropped: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, latency_ms: float, failed: bool) -> None:
+        with self.lock:
+            if failed:
+                self.errors += 1
+            else:
+                self.latencies.append(latency_ms)
+
+    def drop(self) -> None:
+        with self.lock:
+            self.dropped += 1
+
+    def swap(self) -> tuple[List[float], int, int]:
+        with self.lock:
+            latencies, errors, dropped = self.latencies, self.errors, self.dropped
+            self.latencies, self.errors, self.dropped = [], 0, 0
+        return latencies, errors, dropped
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def _in_process(orion: OrionNova) -> Callable[[int], None]:
+    def call(number: int) -> None:
+        orion.conscious_cycle(
+            audio_stream=[f"Olá Orion, pedido {number}".encode("utf-8")],
+            intention=f"Criar fábula {number % 50}",
+            channel=f"carga-{number % 8}",
+        )
+
+    return call
+
+
+def _over_http(url: str) -> Callable[[int], None]:
+    endpoint = url.rstrip("/") + "/cycle"
+
+    def call(number: int) -> None:
+        body = json.dumps(
+            {"text": f"Olá Orion, pedido {number}", "intention": f"Criar fábula {number % 50}", "channel": f"carga-{number % 8}"}
+        ).encode("utf-8")
+        request = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+
+    return call
+
+
+def _closed_loop(call: Callable[[int], None], window: _Window, concurrency: int, until: float) -> None:
+    counter = iter(range(sys.maxsize))
+    counter_lock = threading.Lock()
+
+    def client() -> None:
+        while time.perf_counter() < until:
+            with counter_lock:
+                number = next(counter)
+            began = time.perf_counter()
+            try:
+                call(number)
+                failed = False
+            except Exception:  # noqa: BLE001 - counted, the load goes on
+                failed = True
+            window.record((time.perf_counter() - began) * 1000, failed)
+
+    clients = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+
+
+def _open_loop(call: Callable[[int], None], window: _Window, rate: float, max_in_flight: int, until: float) -> None:
+    # The pool's queue is unbounded: without this, a saturated system would
+    # pile up pending requests and their closures, inflating RSS.
+    slots = threading.BoundedSemaphore(max_in_flight)
+
+    def attempt(number: int, scheduled: float) -> None:
+        try:
+            call(number)
+            failed = False
+        except Exception:  # noqa: BLE001 - counted, the load goes on
+            failed = True
+        finally:
+            slots.release()
+        window.record((time.perf_counter() - scheduled) * 1000, failed)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="carga") as pool:
+        start = time.perf_counter()
+        number = 0
+        while True:
+            scheduled = start + number / rate
+            if scheduled >= until:
+                break
+            pause = scheduled - time.perf_counter()
+            if pause > 0:
+                time.sleep(pause)
+            if slots.acquire(blocking=False):
+                pool.submit(attempt, number, scheduled)
+            else:
+                window.drop()
+            number += 1
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Gera carga contínua sobre o ciclo consciente da Orion Nova.")
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--concurrency", type=int, default=8, help="Clientes em laço fechado (padrão: 8).")
+    load.add_argument("--rate", type=float, help="Requisições por segundo em laço aberto.")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=256,
+        help="Limite de requisições pendentes em laço aberto; as excedentes são descartadas (padrão: 256).",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Duração da carga em segundos (padrão: 10).")
+    parser.add_argument("--interval", type=float, default=1.0, help="Intervalo entre relatórios em segundos (padrão: 1).")
+    parser.add_argument("--model-latency", type=float, default=0.0, help="Atraso injetado em cada geração, em ms.")
+    parser.add_argument("--publish-latency", type=float, default=0.0, help="Atraso injetado em cada publicação, em ms.")
+    parser.add_argument("--retain", type=int, help="Limita a memória em processo a N lembranças.")
+    parser.add_argument("--url", help="Envia a carga a um serviço (demo_orion.py --serve) em vez do processo local.")
+    parser.add_argument("--output", type=Path, help="Grava a série temporal em JSON neste caminho.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    orion: OrionNova | None = None
+    if args.url is None:
+        orion = build_demo_orion(retain=args.retain)
+        if args.model_latency:
+            orion.artistry.model = _DelayedModel(orion.artistry.model, args.model_latency / 1000)
+        if args.publish_latency:
+            orion.action_body.publisher = _DelayedPublisher(orion.action_body.publisher, args.publish_latency / 1000)
+        call = _in_process(orion)
+    else:
+        call = _over_http(args.url)
+
+    window = _Window()
+    began = time.perf_counter()
+    until = began + args.duration
+    if args.rate is None:
+        driver = threading.Thread(target=_closed_loop, args=(call, window, args.concurrency, until), daemon=True)
+    else:
+        driver = threading.Thread(
+            target=_open_loop, args=(call, window, args.rate, args.max_in_flight, until), daemon=True
+        )
+    rss_start = _rss_kib()
+    series: list[dict[str, object]] = []
+    print(f"{'t(s)':>6} {'req/s':>9} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'maxms':>8} {'erros':>6} {'descart':>7} {'rssMiB':>8} {'memória':>9}")
+    driver.start()
+    last = began
+    while driver.is_alive() or window.latencies or window.errors or window.dropped:
+        driver.join(timeout=max(0.0, last + args.interval - time.perf_counter()))
+        now = time.perf_counter()
+        latencies, errors, dropped = window.swap()
+        latencies.sort()
+        row = {
+            "t": round(now - began, 2),
+            "throughput": round(len(latencies) / max(now - last, 1e-9), 1),
+            "p50_ms": round(_percentile(latencies, 0.50), 3),
+            "p95_ms": round(_percentile(latencies, 0.95), 3),
+            "p99_ms": round(_percentile(latencies, 0.99), 3),
+            "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+            "errors": errors,
+            "dropped": dropped,
+            "rss_kib": round(_rss_kib(), 1),
+            "traces": len(orion.memory.traces) if orion is not None else None,
+        }
+        series.append(row)
+        last = now
+        print(
+            f"{row['t']:>6} {row['throughput']:>9} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8} "
+            f"{row['max_ms']:>8} {errors:>6} {dropped:>7} {float(row['rss_kib']) / 1024:>8.1f} {row['traces'] if orion else '-':>9}"
+        )
+
+    rss_growth = _rss_kib() - rss_start
+    print(f"RSS: {rss_start / 1024:.1f} MiB → {(rss_start + rss_growth) / 1024:.1f} MiB (+{rss_growth / 1024:.1f} MiB)")
+    if args.output is not None:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created_at": datetime.utcnow().isoformat(),
+                "mode": "open" if args.rate is not None else "closed",
+                "rate": args.rate,
+                "concurrency": None if args.rate is not None else args.concurrency,
+                "max_in_flight": args.max_in_flight if args.rate is not None else None,
+                "duration": args.duration,
+                "model_latency_ms": args.model_latency,
+                "publish_latency_ms": args.publish_latency,
+                "url": args.url,
+            },
+            "rss_growth_kib": round(rss_growth, 1),
+            "dropped": sum(int(row["dropped"]) for row in series),
+            "series": series,
+        }
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
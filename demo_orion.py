@@ -12,6 +12,11 @@ Example::
     python demo_orion.py --text "Olá Orion, conte uma história" \
         --intention "Criar fábula sobre amizade" --channel jornal
 
+Bulk processing streams a JSONL or CSV file of ``text``/``intention``/
+``channel`` records through one resident organism, writing JSONL results::
+
+    python demo_orion.py --batch pedidos.jsonl --output respostas.jsonl --workers 8
+
 The design deliberately keeps the dependencies light so that the demo can run in
 environments without specialised audio libraries. Instead of real microphone
 input we accept textual prompts, encode them as bytes, and feed them through the
@@ -21,21 +26,19 @@ interface modules exactly as an audio backend would do.
 from __future__ import annotations
 
 import argparse
+import sys
+import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence, TextIO
 
-from orion_nova import (
-    ActionBody,
-    ArtisticVoice,
-    CodesOfConduct,
-    OrionNova,
-    SymbolicMemory,
-    default_codex,
-)
-from orion_nova.ethics import EthicalCore
-from orion_nova.interface import SomaInterface, Synthesiser, Transcriber
-from orion_nova.memory import MemoryTrace
+# The organism is imported inside the functions that need it, so that
+# ``--help`` and argument errors return at bare interpreter speed.
+if TYPE_CHECKING:
+    from orion_nova import CodesOfConduct, OrionNova, SymbolicMemory
+    from orion_nova.blobs import BlobStore
 
 
 @dataclass
@@ -64,12 +67,23 @@ class PoeticModel:
 
 @dataclass
 class MemoryPublisher:
-    """Publisher that stores payloads in symbolic memory for inspection."""
+    """Publisher that stores payloads in symbolic memory for inspection.
+
+    With ``blobs`` the payload and its description are stored once there and
+    the trace only carries their ``blob:`` references.
+    """
 
     memory: SymbolicMemory
+    blobs: BlobStore | None = None
 
     def publish(self, channel: str, payload: bytes, metadata: dict[str, str]) -> str:  # type: ignore[override]
-        content = payload.decode("utf-8")
+        from orion_nova.memory import MemoryTrace
+
+        if self.blobs is None:
+            content = payload.decode("utf-8")
+        else:
+            content = self.blobs.put(payload)
+            metadata = {**metadata, "description": self.blobs.put(metadata["description"])}
         self.memory.store(
             MemoryTrace(
                 title=f"Publicação em {channel}",
@@ -80,30 +94,73 @@ class MemoryPublisher:
         return f"mem://{channel}/{len(self.memory.traces)}"
 
 
-def build_demo_orion(codex: CodesOfConduct | None = None) -> OrionNova:
+def build_demo_orion(
+    codex: CodesOfConduct | None = None,
+    journal: Path | None = None,
+    retain: int | None = None,
+    blobs: Path | None = None,
+) -> OrionNova:
+    """Assemble the toy organism.
+
+    ``retain`` bounds the in-memory traces kept hot; ``blobs`` names a
+    directory where works and prompts are stored once, by content.
+    """
+    from orion_nova import ActionBody, ArtisticVoice, OrionNova, SymbolicMemory, default_codex
+    from orion_nova.ethics import EthicalCore
+    from orion_nova.interface import SomaInterface
+
     codex = codex or default_codex()
-    memory = SymbolicMemory()
+    if journal is not None:
+        memory = SymbolicMemory.open(journal)
+    elif retain is not None:
+        from orion_nova.retention import RetentionPolicy, SummaryTier
+
+        memory = SymbolicMemory(retention=RetentionPolicy(max_traces=retain), cold=SummaryTier())
+    else:
+        memory = SymbolicMemory()
     soma_interface = SomaInterface(
         transcriber=EchoTranscriber(),
         synthesiser=WhisperSynthesiser(),
     )
     ethics = EthicalCore(codex=codex)
     artistry = ArtisticVoice(model=PoeticModel())
-    action_body = ActionBody(publisher=MemoryPublisher(memory))
+    blob_store = None
+    if blobs is not None:
+        from orion_nova.blobs import BlobStore
+
+        blob_store = BlobStore(blobs)
+    action_body = ActionBody(publisher=MemoryPublisher(memory, blobs=blob_store))
     return OrionNova(
         interface=soma_interface,
         ethics=ethics,
         memory=memory,
         artistry=artistry,
         action_body=action_body,
+        blobs=blob_store,
     )
 
 
-def run_demo(audio_inputs: Iterable[bytes], intention: str, channel: str = "demo") -> None:
-    """Execute a full consciousness loop and narrate the results."""
-
-    orion = build_demo_orion()
-    result = orion.conscious_cycle(audio_stream=audio_inputs, intention=intention, channel=channel)
+def run_demo(
+    audio_inputs: Iterable[bytes],
+    intention: str,
+    channel: str = "demo",
+    journal: Path | None = None,
+    streaming: bool = False,
+    blobs: Path | None = None,
+    retain: int | None = None,
+) -> None:
+    """Execute a full consciousness loop and narrate the results.
+
+    With ``streaming`` the input is deliberated chunk by chunk as it is read.
+    """
+
+    orion = build_demo_orion(journal=journal, retain=retain, blobs=blobs)
+    cycle = orion.streaming_cycle if streaming else orion.conscious_cycle
+    try:
+        result = cycle(audio_stream=audio_inputs, intention=intention, channel=channel)
+    finally:
+        if orion.memory.journal is not None:
+            orion.memory.journal.close()
 
     print("\n🜂 Orion Nova — Ciclo consciente")
     print("=" * 48)
@@ -117,7 +174,7 @@ def run_demo(audio_inputs: Iterable[bytes], intention: str, channel: str = "demo
         print("Ação publicada: nenhuma — aguardando nova deliberação humana.")
     print("\n🜂 Reflexão simbólica")
     print("=" * 48)
-    print(result.reflection)
+    print(result.reflection if orion.blobs is None else orion.blobs.expand(result.reflection))
 
 
 def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -132,33 +189,282 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Caminho para um arquivo UTF-8 cujo conteúdo alimenta o ciclo.",
     )
+    group.add_argument(
+        "--serve",
+        metavar="[HOST:]PORTA",
+        help="Mantém uma Orion residente atendendo ciclos via HTTP/JSON (ex.: 8765).",
+    )
+    group.add_argument(
+        "--batch",
+        type=Path,
+        help="Arquivo JSONL ou CSV (colunas text, intention, channel) processado em lote.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Destino JSONL dos resultados do modo --batch (padrão: saída padrão).",
+    )
     parser.add_argument(
         "--intention",
-        required=True,
         help="Intenção narrativa que a Orion deve honrar na criação.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Trabalhadores que atendem requisições nos modos --serve e --batch (padrão: 8).",
+    )
     parser.add_argument(
         "--channel",
         default="demo",
         help="Canal simbólico de publicação (padrão: demo).",
     )
-    return parser.parse_args(argv)
-
-
-def _load_audio(args: argparse.Namespace) -> list[bytes]:
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help="Diretório de um diário persistente; a memória sobrevive entre execuções.",
+    )
+    parser.add_argument(
+        "--retain",
+        type=int,
+        metavar="N",
+        help="Mantém no máximo N lembranças em memória; as mais antigas viram resumos por etiqueta.",
+    )
+    parser.add_argument(
+        "--allow-origin",
+        metavar="ORIGEM",
+        help="Origem web autorizada a chamar o modo --serve (CORS); por padrão, nenhuma.",
+    )
+    parser.add_argument(
+        "--blobs",
+        type=Path,
+        help="Diretório onde obras e prompts são guardados uma única vez; a memória cita apenas referências.",
+    )
+    args = parser.parse_args(argv)
+    if args.serve is None and args.batch is None and not args.intention:
+        parser.error("--intention é obrigatório fora dos modos --serve e --batch")
+    if args.output is not None and args.batch is None:
+        parser.error("--output só se aplica ao modo --batch")
+    if args.allow_origin is not None and args.serve is None:
+        parser.error("--allow-origin só se aplica ao modo --serve")
+    if args.retain is not None and args.journal is not None:
+        parser.error("--retain não se combina com --journal, que já guarda a memória em disco")
+    return args
+
+
+def _iter_text_chunks(path: Path, chunk_chars: int = 64 * 1024) -> Iterator[bytes]:
+    """Stream a UTF-8 file as encoded chunks, trimmed like ``str.strip``."""
+    with path.open(encoding="utf-8") as handle:
+        started = False
+        carry = ""
+        while block := handle.read(chunk_chars):
+            if not started:
+                block = block.lstrip()
+                started = bool(block)
+            text = carry + block
+            content = text.rstrip()
+            # Hold trailing whitespace back until we know more text follows.
+            carry = text[len(content):]
+            if content:
+                yield content.encode("utf-8")
+
+
+def _load_audio(args: argparse.Namespace) -> Iterable[bytes]:
     if args.text is not None:
         return [args.text.encode("utf-8")]
     assert args.text_file is not None  # for type checkers
-    text = args.text_file.read_text(encoding="utf-8").strip()
-    if not text:
+    chunks = _iter_text_chunks(args.text_file)
+    first = next(chunks, None)
+    if first is None:
         raise ValueError("O arquivo fornecido está vazio; acrescente conteúdo simbólico antes de executar.")
-    return [text.encode("utf-8")]
+    return chain((first,), chunks)
+
+
+def run_service(
+    address: str,
+    workers: int = 8,
+    journal: Path | None = None,
+    retain: int | None = None,
+    blobs: Path | None = None,
+    allow_origin: str | None = None,
+) -> None:
+    """Serve conscious cycles from one resident, warmed-up organism.
+
+    SIGTERM, like Ctrl-C, stops accepting requests, lets the ones in flight
+    finish and closes the journal before exiting.
+    """
+
+    import signal
+    import threading
+
+    from orion_nova.service import OrionService
+
+    host, _, port = address.rpartition(":")
+    orion = build_demo_orion(journal=journal, retain=retain, blobs=blobs)
+    service = OrionService(
+        orion=orion,
+        host=host or "127.0.0.1",
+        port=int(port),
+        workers=workers,
+        allowed_origin=allow_origin,
+    )
+    bound_host, bound_port = service.start()
+    print(f"🜂 Orion Nova residente em http://{bound_host}:{bound_port} (POST /cycle)")
+    # stop() waits for the serving loop, so it cannot run on this thread.
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=service.stop).start())
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if orion.memory.journal is not None:
+            orion.memory.journal.close()
+
+
+def _iter_batch_records(path: Path) -> Iterator[tuple[int, dict[str, Any] | ValueError]]:
+    """Stream ``(line, record)`` pairs from a CSV (by suffix) or JSONL file.
+
+    A line that does not hold a JSON object comes out as a ``ValueError`` in
+    place of its record, so one bad line costs only itself.
+    """
+    import csv
+    import json
+
+    with path.open(encoding="utf-8", newline="") as handle:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line, raw in enumerate(handle, 1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as error:
+                yield line, ValueError(f"invalid JSON: {error}")
+                continue
+            if isinstance(record, dict):
+                yield line, record
+            else:
+                yield line, ValueError(f"expected a JSON object, got {type(record).__name__}")
+
+
+def run_batch(
+    path: Path,
+    output: Path | None = None,
+    workers: int = 8,
+    intention: str | None = None,
+    channel: str = "demo",
+    journal: Path | None = None,
+    retain: int | None = None,
+    blobs: Path | None = None,
+) -> None:
+    """Run every record of ``path`` through one organism, streaming JSONL out.
+
+    At most ``4 * workers`` records are in flight, so neither the input nor
+    the results are ever held in full. Results keep input order; a record
+    that fails yields ``{"record": n, "error": ...}``. ``intention`` and
+    ``channel`` fill in fields a record leaves out.
+    """
+
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from orion_nova.service import result_to_dict
+
+    orion = build_demo_orion(journal=journal, retain=retain, blobs=blobs)
+
+    def attempt(number: int, line: int, record: dict[str, Any] | ValueError) -> tuple[dict[str, Any], float]:
+        started = time.perf_counter()
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            wanted = record.get("intention") or intention
+            if not wanted:
+                raise ValueError("record has no intention and no --intention was given")
+            result = orion.conscious_cycle(
+                audio_stream=[str(record["text"]).encode("utf-8")],
+                intention=wanted,
+                channel=record.get("channel") or channel,
+            )
+            reply = {"record": number, "line": line, **result_to_dict(result, orion.blobs)}
+        except Exception as error:  # noqa: BLE001 - reported per record
+            reply = {"record": number, "line": line, "error": f"{type(error).__name__}: {error}"}
+        return reply, time.perf_counter() - started
+
+    sink: TextIO = sys.stdout if output is None else output.open("w", encoding="utf-8")
+    latencies: list[float] = []
+    failures = 0
+    began = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orion-batch") as pool:
+            window: deque = deque()
+
+            def drain(keep: int) -> None:
+                nonlocal failures
+                while len(window) > keep:
+                    reply, latency = window.popleft().result()
+                    latencies.append(latency)
+                    failures += "error" in reply
+                    sink.write(json.dumps(reply, ensure_ascii=False) + "\n")
+
+            for number, (line, record) in enumerate(_iter_batch_records(path), 1):
+                window.append(pool.submit(attempt, number, line, record))
+                drain(4 * workers)
+            drain(0)
+    finally:
+        if output is not None:
+            sink.close()
+        if orion.memory.journal is not None:
+            orion.memory.journal.close()
+    elapsed = time.perf_counter() - began
+
+    report = sys.stderr if output is None else sys.stdout
+    latencies.sort()
+    count = len(latencies)
+    print(f"🜂 {count} ciclos em {elapsed:.2f}s ({count / elapsed if elapsed else 0:.1f} ciclos/s), {failures} falhas", file=report)
+    if count:
+        quantiles = ", ".join(
+            f"p{int(q * 100)}={latencies[min(count - 1, int(q * count))] * 1000:.2f}ms" for q in (0.5, 0.95, 0.99)
+        )
+        print(f"   latência: {quantiles}, máx={latencies[-1] * 1000:.2f}ms", file=report)
 
 
 def main(argv: Sequence[str] | None = None) -> None:
     args = _parse_args(argv)
+    if args.batch is not None:
+        run_batch(
+            args.batch,
+            output=args.output,
+            workers=args.workers,
+            intention=args.intention,
+            channel=args.channel,
+            journal=args.journal,
+            retain=args.retain,
+            blobs=args.blobs,
+        )
+        return
+    if args.serve is not None:
+        run_service(
+            args.serve,
+            workers=args.workers,
+            journal=args.journal,
+            retain=args.retain,
+            blobs=args.blobs,
+            allow_origin=args.allow_origin,
+        )
+        return
     audio_inputs = _load_audio(args)
-    run_demo(audio_inputs=audio_inputs, intention=args.intention, channel=args.channel)
+    run_demo(
+        audio_inputs=audio_inputs,
+        intention=args.intention,
+        channel=args.channel,
+        journal=args.journal,
+        streaming=args.text_file is not None,
+        blobs=args.blobs,
+        retain=args.retain,
+    )
 
 
 if __name__ == "__main__":
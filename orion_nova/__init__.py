@@ -1,12 +1,44 @@
-"""Core package defining the Orion Nova autonomous framework."""
+"""Core package defining the Orion Nova autonomous framework.
 
-from .codes import CodesOfConduct, default_codex
-from .ethics import EthicalCore, EthicalDecision
-from .interface import SomaInterface, SensoryInput, SpokenMessage
-from .memory import SymbolicMemory, MemoryTrace
-from .artistry import ArtisticVoice, ArtisticWork
-from .action import ActionBody, ActionOutcome
-from .orchestration import OrionNova
+Submodules are imported lazily, on first access to one of the names in
+``__all__``, so that importing the package (e.g. from a one-shot CLI) costs
+close to nothing until a component is actually used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+# Spelled out instead of importing ``typing``, which alone would dominate the
+# package's import cost; type checkers understand this idiom.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .action import ActionBody, ActionOutcome
+    from .artistry import ArtisticVoice, ArtisticWork
+    from .codes import CodesOfConduct, default_codex
+    from .ethics import EthicalCore, EthicalDecision
+    from .interface import SensoryInput, SomaInterface, SpokenMessage
+    from .memory import MemoryTrace, SymbolicMemory
+    from .orchestration import OrionNova
+
+_EXPORTS = {
+    "CodesOfConduct": ".codes",
+    "default_codex": ".codes",
+    "EthicalCore": ".ethics",
+    "EthicalDecision": ".ethics",
+    "SomaInterface": ".interface",
+    "SensoryInput": ".interface",
+    "SpokenMessage": ".interface",
+    "SymbolicMemory": ".memory",
+    "MemoryTrace": ".memory",
+    "ArtisticVoice": ".artistry",
+    "ArtisticWork": ".artistry",
+    "ActionBody": ".action",
+    "ActionOutcome": ".action",
+    "OrionNova": ".orchestration",
+}
 
 __all__ = [
     "CodesOfConduct",
@@ -24,3 +56,16 @@ __all__ = [
     "OrionNova",
     "default_codex",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
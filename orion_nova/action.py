@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .publishing import PublishPipeline
 
 
 class Publisher(Protocol):
@@ -14,33 +19,82 @@ class Publisher(Protocol):
         ...
 
 
+class BatchPublisher(Publisher, Protocol):
+    """Publisher that can also acknowledge several payloads in one round trip.
+
+    ``publish_many`` is optional: the publish pipeline uses it when present and
+    falls back to one ``publish`` call per payload otherwise.
+    """
+
+    def publish_many(
+        self,
+        channel: str,
+        payloads: Sequence[memoryview],
+        metadata: Sequence[dict[str, str]],
+    ) -> Sequence[str]:
+        ...
+
+
 @dataclass
 class ActionOutcome:
-    """Record of a performed action, supporting post-action reflection."""
+    """Record of a performed action, supporting post-action reflection.
+
+    Outcomes submitted through a publish pipeline start with an empty
+    ``reference``; :meth:`wait` fills it in once the batch is acknowledged.
+    """
 
     channel: str
     reference: str
     performed_at: datetime
     notes: str
+    ack: Future[str] | None = field(default=None, repr=False, compare=False)
+
+    def wait(self, timeout: float | None = None) -> str:
+        """Block until the publisher acknowledged this action; return its reference."""
+        if self.ack is not None and not self.reference:
+            self.reference = self.ack.result(timeout)
+        return self.reference
 
 
 @dataclass
 class ActionBody:
-    """Module that binds creation to tangible impact in the world."""
+    """Module that binds creation to tangible impact in the world.
+
+    With a :class:`~orion_nova.publishing.PublishPipeline`, payloads are
+    buffered per channel and published in batches instead of one blocking
+    round trip each.
+    """
 
     publisher: Publisher
+    pipeline: PublishPipeline | None = None
 
     def perform(self, channel: str, work: bytes, description: str) -> ActionOutcome:
         """Send an artifact into the world with reflective metadata."""
 
+        outcome = self.submit(channel, work, description)
+        outcome.wait()
+        return outcome
+
+    def submit(self, channel: str, work: bytes, description: str) -> ActionOutcome:
+        """Like :meth:`perform`, but return before a pipelined batch is acknowledged."""
+
+        performed_at = datetime.utcnow()
         metadata = {
             "description": description,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": performed_at.isoformat(),
         }
-        reference = self.publisher.publish(channel, work, metadata)
+        if self.pipeline is None:
+            reference = self.publisher.publish(channel, work, metadata)
+            return ActionOutcome(
+                channel=channel,
+                reference=reference,
+                performed_at=performed_at,
+                notes=description,
+            )
         return ActionOutcome(
             channel=channel,
-            reference=reference,
-            performed_at=datetime.utcnow(),
+            reference="",
+            performed_at=performed_at,
             notes=description,
+            ack=self.pipeline.submit(channel, memoryview(work), metadata),
         )
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import TYPE_CHECKING, Iterator, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from .caching import GenerationCache
 
 
 class GenerativeModel(Protocol):
@@ -22,32 +25,80 @@ class ArtisticWork:
     description: str
     payload: bytes
     created_at: datetime
+    cached: bool = False
 
 
 @dataclass
 class ArtisticVoice:
-    """Module devoted to purposeful, human-aligned artistic expression."""
+    """Module devoted to purposeful, human-aligned artistic expression.
+
+    An optional :class:`GenerationCache` reuses payloads for repeated
+    (curated prompt, modality) pairs instead of calling the model again.
+    """
 
     model: GenerativeModel
+    cache: GenerationCache | None = None
 
     def compose(self, intention: str, modality: str = "text") -> ArtisticWork:
         """Create a work in response to a narrative intention."""
 
-        enriched_prompt = self._curate_prompt(intention, modality)
-        payload = self.model.generate(enriched_prompt, modality)
+        return self._render(self._curate_prompt(intention, modality), modality)
+
+    def compose_many(self, intention: str, modalities: Sequence[str]) -> Iterator[ArtisticWork]:
+        """Create one work per modality concurrently, yielding each as it finishes.
+
+        Every modality shares the same curated framing of ``intention``; only
+        the modality marker differs. A modality whose generation fails does
+        not hold back the others: the first error is raised once every other
+        work has been yielded. Abandoning the iterator cancels the generations
+        that have not started yet.
+        """
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        framing = self._frame(intention)
+        pool = ThreadPoolExecutor(max_workers=max(1, len(modalities)), thread_name_prefix="orion-compose")
+        failure: BaseException | None = None
+        try:
+            pending = [pool.submit(self._render, self._mark(modality, framing), modality) for modality in modalities]
+            for finished in as_completed(pending):
+                error = finished.exception()
+                if error is None:
+                    yield finished.result()
+                elif failure is None:
+                    failure = error
+            if failure is not None:
+                raise failure
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _render(self, enriched_prompt: str, modality: str) -> ArtisticWork:
+        if self.cache is None:
+            payload, cached = self.model.generate(enriched_prompt, modality), False
+        else:
+            payload, cached = self.cache.fetch(enriched_prompt, modality, self.model.generate)
         return ArtisticWork(
             modality=modality,
             description=enriched_prompt,
             payload=payload,
             created_at=datetime.utcnow(),
+            cached=cached,
         )
 
-    @staticmethod
-    def _curate_prompt(intention: str, modality: str) -> str:
+    @classmethod
+    def _curate_prompt(cls, intention: str, modality: str) -> str:
         """Add ethical and aesthetic framing to the generative request."""
 
+        return cls._mark(modality, cls._frame(intention))
+
+    @staticmethod
+    def _frame(intention: str) -> str:
         base = (
             "Conduza a criação com empatia, verdade e elo humano. "
             "Descreva a cena com detalhes sensoriais e preserve dignidade."
         )
-        return f"[{modality.upper()}] {base}\nIntenção: {intention}"
+        return f"{base}\nIntenção: {intention}"
+
+    @staticmethod
+    def _mark(modality: str, framing: str) -> str:
+        return f"[{modality.upper()}] {framing}"
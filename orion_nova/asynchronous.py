@@ -0,0 +1,238 @@
+"""Native asyncio path through Orion Nova's conscious cycle.
+
+The async protocols mirror :class:`~orion_nova.artistry.GenerativeModel` and
+:class:`~orion_nova.action.Publisher`; the adapters let existing synchronous
+implementations take part by running them in worker threads, so backends can
+migrate one at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Protocol
+
+from .action import ActionOutcome, Publisher
+from .artistry import ArtisticWork, GenerativeModel
+from .orchestration import BatchItem, ConsciousCycleResult, CycleFailure, CycleRequest, OrionNova
+from .tracing import CycleTimer
+
+
+class AsyncGenerativeModel(Protocol):
+    """Creative model whose generation can be awaited."""
+
+    async def generate(self, prompt: str, modality: str) -> bytes:
+        ...
+
+
+class AsyncPublisher(Protocol):
+    """Publishing integration whose uploads can be awaited."""
+
+    async def publish(self, channel: str, payload: bytes, metadata: dict[str, str]) -> str:
+        ...
+
+
+@dataclass
+class AsyncModelAdapter:
+    """Expose a synchronous :class:`GenerativeModel` through the async protocol."""
+
+    model: GenerativeModel
+
+    async def generate(self, prompt: str, modality: str) -> bytes:
+        return await asyncio.to_thread(self.model.generate, prompt, modality)
+
+
+@dataclass
+class AsyncPublisherAdapter:
+    """Expose a synchronous :class:`Publisher` through the async protocol."""
+
+    publisher: Publisher
+
+    async def publish(self, channel: str, payload: bytes, metadata: dict[str, str]) -> str:
+        return await asyncio.to_thread(self.publisher.publish, channel, payload, metadata)
+
+
+@dataclass
+class AsyncOrionNova:
+    """Event-loop counterpart of :class:`OrionNova`.
+
+    Listening, ethics, interpretation, memory and reflection come from the
+    wrapped ``orion``, through the same stage helpers as its synchronous
+    cycle, so its observer, generation cache, ``modalities`` and
+    ``speculate`` settings apply here too. Generation goes through the async
+    ``model`` and publishing through the async ``publisher``, or through the
+    publish pipeline of ``orion.action_body`` when it has one. Each stage has
+    its own concurrency limit and ``max_in_flight`` bounds whole cycles, so
+    callers beyond it wait instead of piling up work.
+    """
+
+    orion: OrionNova
+    model: AsyncGenerativeModel
+    publisher: AsyncPublisher
+    max_in_flight: int = 1024
+    listen_limit: int = 32
+    generate_limit: int = 64
+    publish_limit: int = 64
+    _in_flight: asyncio.Semaphore = field(init=False, repr=False)
+    _listening: asyncio.Semaphore = field(init=False, repr=False)
+    _generating: asyncio.Semaphore = field(init=False, repr=False)
+    _publishing: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._listening = asyncio.Semaphore(self.listen_limit)
+        self._generating = asyncio.Semaphore(self.generate_limit)
+        self._publishing = asyncio.Semaphore(self.publish_limit)
+
+    @classmethod
+    def from_sync(cls, orion: OrionNova, **limits: int) -> AsyncOrionNova:
+        """Wrap an existing orchestrator, adapting its model and publisher."""
+        return cls(
+            orion=orion,
+            model=AsyncModelAdapter(orion.artistry.model),
+            publisher=AsyncPublisherAdapter(orion.action_body.publisher),
+            **limits,
+        )
+
+    async def conscious_cycle(self, audio_stream: Iterable[bytes], intention: str, channel: str) -> ConsciousCycleResult:
+        """Perform a full cycle without blocking the event loop on I/O."""
+
+        orion = self.orion
+        async with self._in_flight:
+            timer = orion._timer()
+            speculative = self._speculate(intention)
+            try:
+                started = timer.start("listen")
+                async with self._listening:
+                    # SomaInterface.listen is synchronous; keep it off the loop.
+                    sensory = await asyncio.to_thread(orion.interface.listen, list(audio_stream))
+                timer.stop("listen", started, len(sensory.raw_text))
+                interpretation, decision = orion._deliberate(sensory, intention, timer)
+            except BaseException:
+                self._discard(speculative)
+                raise
+
+            artwork: ArtisticWork | None = None
+            outcome: ActionOutcome | None = None
+            published: list[tuple[ArtisticWork, ActionOutcome]] = []
+            if not decision.allowed:
+                self._discard(speculative)
+            elif len(orion.modalities) > 1:
+                failure = await self._publish_renditions(intention, channel, timer, published)
+                artwork, outcome = orion._first_rendition(sensory, interpretation, decision, published, failure)
+            else:
+                started = timer.start("compose")
+                if speculative is None:
+                    artwork = await self._compose(intention)
+                else:
+                    artwork, spent_ms = await speculative
+                    orion._count_hit(spent_ms, started)
+                timer.stop("compose", started, len(artwork.payload))
+                started = timer.start("perform")
+                outcome = await self._perform(channel, artwork)
+                timer.stop("perform", started, len(artwork.payload))
+            return orion._conclude(sensory, interpretation, decision, timer, artwork, outcome, published)
+
+    async def conscious_cycles(self, batch: Iterable[BatchItem]) -> list[ConsciousCycleResult | CycleFailure]:
+        """Run a batch of cycles on the loop, returning results in input order."""
+
+        requests = [item if isinstance(item, CycleRequest) else CycleRequest(*item) for item in batch]
+        return list(await asyncio.gather(*(self._attempt_cycle(request) for request in requests)))
+
+    async def _attempt_cycle(self, request: CycleRequest) -> ConsciousCycleResult | CycleFailure:
+        try:
+            return await self.conscious_cycle(request.audio_stream, request.intention, request.channel)
+        except Exception as error:  # noqa: BLE001 - surfaced to the caller per item
+            return CycleFailure(request=request, error=error)
+
+    async def _publish_renditions(
+        self,
+        intention: str,
+        channel: str,
+        timer: CycleTimer,
+        published: list[tuple[ArtisticWork, ActionOutcome]],
+    ) -> BaseException | None:
+        """Async counterpart of :meth:`OrionNova._publish_renditions`."""
+        failure: BaseException | None = None
+        pending = [asyncio.ensure_future(self._compose(intention, modality)) for modality in self.orion.modalities]
+        try:
+            for finished in asyncio.as_completed(pending):
+                started = timer.start("compose")
+                try:
+                    work = await finished
+                except Exception as error:  # noqa: BLE001 - reported once the other works are out
+                    timer.stop("compose", started)
+                    failure = failure or error
+                    continue
+                timer.stop("compose", started, len(work.payload))
+                started = timer.start("perform")
+                try:
+                    outcome = await self._perform(channel, work)
+                except Exception as error:  # noqa: BLE001 - reported once the other works are out
+                    failure = failure or error
+                else:
+                    published.append((work, outcome))
+                timer.stop("perform", started, len(work.payload))
+        finally:
+            for task in pending:
+                task.cancel()
+        return failure
+
+    def _speculate(self, intention: str) -> asyncio.Task[tuple[ArtisticWork, float]] | None:
+        """Start composing for ``intention`` ahead of the decision, if enabled."""
+        if not self.orion.speculate or len(self.orion.modalities) > 1:
+            return None
+        return asyncio.ensure_future(self._timed_compose(intention))
+
+    async def _timed_compose(self, intention: str) -> tuple[ArtisticWork, float]:
+        started = time.perf_counter_ns()
+        artwork = await self._compose(intention)
+        return artwork, (time.perf_counter_ns() - started) / 1e6
+
+    def _discard(self, speculative: asyncio.Task[tuple[ArtisticWork, float]] | None) -> None:
+        """Drop speculative work that must not be published, counting the waste."""
+        if speculative is None:
+            return
+        cancelled = speculative.cancel()
+        self.orion._count_miss(cancelled)
+        if not cancelled:
+            self.orion._count_waste(speculative)  # type: ignore[arg-type]
+
+    async def _compose(self, intention: str, modality: str = "text") -> ArtisticWork:
+        artistry = self.orion.artistry
+        prompt = artistry._curate_prompt(intention, modality)
+        async with self._generating:
+            if artistry.cache is None:
+                payload, cached = await self.model.generate(prompt, modality), False
+            else:
+                payload, cached = await artistry.cache.fetch_async(prompt, modality, self.model.generate)
+        return ArtisticWork(
+            modality=modality,
+            description=prompt,
+            payload=payload,
+            created_at=datetime.utcnow(),
+            cached=cached,
+        )
+
+    async def _perform(self, channel: str, artwork: ArtisticWork) -> ActionOutcome:
+        action_body = self.orion.action_body
+        if action_body.pipeline is not None:
+            # Batched with the synchronous cycles sharing the pipeline.
+            outcome = action_body.submit(channel, artwork.payload, artwork.description)
+            outcome.reference = await asyncio.wrap_future(outcome.ack)  # type: ignore[arg-type]
+            return outcome
+        performed_at = datetime.utcnow()
+        metadata = {
+            "description": artwork.description,
+            "timestamp": performed_at.isoformat(),
+        }
+        async with self._publishing:
+            reference = await self.publisher.publish(channel, artwork.payload, metadata)
+        return ActionOutcome(
+            channel=channel,
+            reference=reference,
+            performed_at=performed_at,
+            notes=artwork.description,
+        )
@@ -0,0 +1,146 @@
+"""Content-addressed storage for artwork payloads and curated prompts.
+
+Repetitive workloads produce the same works and prompts over and over. A
+:class:`BlobStore` keeps each distinct content once, under a reference of the
+form ``blob:<hash>`` that memory traces embed in place of the text itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Set
+
+_PREFIX = "blob:"
+_REFERENCE = re.compile(r"blob:([0-9a-f]{32})")
+
+
+@dataclass
+class BlobStore:
+    """Deduplicating blob store, in memory or under ``directory``.
+
+    On disk, blobs live at ``directory/ab/abcd...`` like the generation cache.
+    Blobs of at least ``map_threshold`` bytes are read back through ``mmap``
+    and :meth:`get` hands out ``memoryview`` slices of them without copying;
+    each mapping holds a file descriptor, so only the ``max_maps`` most
+    recently used stay open and the others are closed as they fall out.
+    Smaller blobs are simply read into bytes.
+    """
+
+    directory: Path | None = None
+    map_threshold: int = 64 * 1024
+    max_maps: int = 32
+    stored: int = 0
+    deduplicated: int = 0
+    _blobs: Dict[str, bytes] = field(default_factory=dict, init=False, repr=False)
+    _maps: OrderedDict[str, mmap.mmap] = field(default_factory=OrderedDict, init=False, repr=False)
+    _on_disk: Set[str] = field(default_factory=set, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.directory is not None:
+            self.directory = Path(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(data: bytes | memoryview) -> str:
+        """Hash naming ``data`` (128 bits of its SHA-256)."""
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    def put(self, data: bytes | memoryview | str) -> str:
+        """Store ``data`` once and return its ``blob:`` reference."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        key = self.digest(data)
+        with self._lock:
+            if key in self._blobs or key in self._on_disk:
+                self.deduplicated += 1
+                return _PREFIX + key
+        if self.directory is None:
+            with self._lock:
+                fresh = key not in self._blobs
+                if fresh:
+                    self._blobs[key] = bytes(data)
+        else:
+            path = self._path(key)
+            fresh = not path.exists()
+            if fresh:
+                path.parent.mkdir(exist_ok=True)
+                scratch = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+                scratch.write_bytes(data)
+                os.replace(scratch, path)
+        with self._lock:
+            if self.directory is not None:
+                self._on_disk.add(key)
+            if fresh:
+                self.stored += 1
+            else:
+                self.deduplicated += 1
+        return _PREFIX + key
+
+    def get(self, reference: str) -> memoryview:
+        """Zero-copy view of the blob behind ``reference``."""
+        key = reference[len(_PREFIX):] if reference.startswith(_PREFIX) else reference
+        with self._lock:
+            blob = self._blobs.get(key)
+            if blob is None:
+                blob = self._maps.get(key)
+                if blob is not None:
+                    self._maps.move_to_end(key)
+            if blob is not None:
+                return memoryview(blob)
+        if self.directory is None:
+            raise KeyError(reference)
+        try:
+            with open(self._path(key), "rb") as handle:
+                if os.fstat(handle.fileno()).st_size < max(self.map_threshold, 1):
+                    return memoryview(handle.read())
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise KeyError(reference) from None
+        evicted: list[mmap.mmap] = []
+        with self._lock:
+            kept = self._maps.setdefault(key, mapping)
+            while len(self._maps) > self.max_maps:
+                evicted.append(self._maps.popitem(last=False)[1])
+        if kept is not mapping:
+            evicted.append(mapping)
+        for stale in evicted:
+            _release(stale)
+        return memoryview(kept)
+
+    def text(self, reference: str) -> str:
+        """Decode the blob behind ``reference`` as UTF-8."""
+        return str(self.get(reference), "utf-8")
+
+    def expand(self, text: str) -> str:
+        """Replace every ``blob:`` reference inside ``text`` with its content."""
+        return _REFERENCE.sub(lambda match: self.text(match.group(1)), text)
+
+    def close(self) -> None:
+        """Release the mappings of on-disk blobs.
+
+        Views returned by :meth:`get` must no longer be in use.
+        """
+        with self._lock:
+            for mapping in self._maps.values():
+                mapping.close()
+            self._maps.clear()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / key
+
+
+def _release(mapping: mmap.mmap) -> None:
+    """Close ``mapping`` now, or leave it to the last view still reading it."""
+    try:
+        mapping.close()
+    except BufferError:
+        pass
@@ -0,0 +1,279 @@
+"""Small caching primitives shared by Orion Nova's modules."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class LRUCache(Generic[V]):
+    """Thread-safe least-recently-used mapping with hit/miss counters."""
+
+    capacity: int = 1024
+    hits: int = 0
+    misses: int = 0
+    _entries: OrderedDict[Hashable, V] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value for ``key`` and mark it recently used."""
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Insert ``value``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class GenerationCache:
+    """Content-addressed cache for generated payloads.
+
+    Entries are keyed by a SHA-256 of the modality and curated prompt. A
+    size-bounded in-memory LRU (``max_entries``/``max_bytes``) is consulted
+    first, then the optional on-disk store in ``directory``. ``ttl`` (seconds)
+    expires entries in both tiers. Concurrent requests for the same key are
+    coalesced so the model is asked only once.
+
+    The disk tier is unbounded unless ``disk_max_bytes`` is set; once a save
+    takes it past that, the oldest-written payloads are deleted until it is
+    back under 90% of the limit. Several caches (or processes) may share a
+    directory, so the limit is enforced against what is actually on disk.
+    """
+
+    max_entries: int = 256
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: float | None = None
+    directory: Path | None = None
+    disk_max_bytes: int | None = None
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    _entries: OrderedDict[str, Tuple[float, bytes]] = field(default_factory=OrderedDict, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+    _in_flight: Dict[str, Future] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _disk_size: int | None = field(default=None, init=False, repr=False)
+    _disk_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.directory is not None:
+            self.directory = Path(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(prompt: str, modality: str) -> str:
+        """Hash identifying a generation request."""
+        return hashlib.sha256(f"{modality}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def fetch(
+        self,
+        prompt: str,
+        modality: str,
+        generate: Callable[[str, str], bytes],
+    ) -> tuple[bytes, bool]:
+        """Return ``(payload, cached)``, calling ``generate`` only on a true miss."""
+
+        key = self.key(prompt, modality)
+        payload, pending, leader = self._claim(key)
+        if payload is not None:
+            return payload, True
+        if not leader:
+            return pending.result(), True
+
+        try:
+            payload = self._load(key)
+            cached = payload is not None
+            if payload is None:
+                payload = generate(prompt, modality)
+                self._save(key, payload)
+        except BaseException as error:
+            self._abandon(key, pending, error)
+            raise
+        self._settle(key, pending, payload, cached)
+        return payload, cached
+
+    async def fetch_async(
+        self,
+        prompt: str,
+        modality: str,
+        generate: Callable[[str, str], Awaitable[bytes]],
+    ) -> tuple[bytes, bool]:
+        """Awaitable :meth:`fetch` for a coroutine ``generate``.
+
+        Concurrent requests for a key are coalesced with synchronous callers
+        too. No thread ever waits on the generation; only the disk tier, when
+        configured, is read and written on worker threads.
+        """
+
+        import asyncio  # only async callers pay for it
+
+        key = self.key(prompt, modality)
+        payload, pending, leader = self._claim(key)
+        if payload is not None:
+            return payload, True
+        if not leader:
+            return await asyncio.wrap_future(pending), True
+
+        try:
+            payload = None if self.directory is None else await asyncio.to_thread(self._load, key)
+            cached = payload is not None
+            if payload is None:
+                payload = await generate(prompt, modality)
+                if self.directory is not None:
+                    await asyncio.to_thread(self._save, key, payload)
+        except BaseException as error:
+            self._abandon(key, pending, error)
+            raise
+        self._settle(key, pending, payload, cached)
+        return payload, cached
+
+    def _claim(self, key: str) -> tuple[bytes | None, Future, bool]:
+        """Look ``key`` up; on a miss, join or become the leader of its generation."""
+        with self._lock:
+            payload = self._lookup(key)
+            if payload is not None:
+                self.hits += 1
+                return payload, Future(), False
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self.coalesced += 1
+                return None, pending, False
+            pending = self._in_flight[key] = Future()
+            return None, pending, True
+
+    def _settle(self, key: str, pending: Future, payload: bytes, cached: bool) -> None:
+        with self._lock:
+            if cached:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._remember(key, payload)
+            del self._in_flight[key]
+        pending.set_result(payload)
+
+    def _abandon(self, key: str, pending: Future, error: BaseException) -> None:
+        with self._lock:
+            del self._in_flight[key]
+        pending.set_exception(error)
+
+    def clear(self) -> None:
+        """Empty the in-memory tier; the on-disk store is left untouched."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _lookup(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if self._expired(stored_at):
+            del self._entries[key]
+            self._size -= len(payload)
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous[1])
+        self._entries[key] = (time.time(), payload)
+        self._size += len(payload)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / key
+
+    def _load(self, key: str) -> bytes | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            if self._expired(path.stat().st_mtime):
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _save(self, key: str, payload: bytes) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        scratch = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        scratch.write_bytes(payload)
+        os.replace(scratch, path)
+        if self.disk_max_bytes is not None:
+            with self._disk_lock:
+                if self._disk_size is None:
+                    self._disk_size = sum(size for _, size, _ in self._disk_entries())
+                else:
+                    self._disk_size += len(payload)
+                if self._disk_size > self.disk_max_bytes:
+                    self._prune_disk()
+
+    def _disk_entries(self) -> list[tuple[float, int, Path]]:
+        """``(mtime, size, path)`` of every stored payload, oldest first."""
+        assert self.directory is not None
+        entries = []
+        for path in self.directory.glob("??/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def _prune_disk(self) -> None:
+        assert self.disk_max_bytes is not None
+        entries = self._disk_entries()
+        size = sum(entry[1] for entry in entries)
+        target = int(self.disk_max_bytes * 0.9)
+        for _, length, path in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= length
+        self._disk_size = size
@@ -1,53 +1,113 @@
-"""Artistic creation interface for Orion Nova."""
+"""Codes of conduct anchoring Orion Nova's ethical deliberation."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Protocol
+import itertools
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Iterable, List, Pattern, Sequence, Set, Tuple
 
+_COMBINING = re.compile(r"[\u0300-\u036f]+")
 
-class GenerativeModel(Protocol):
-    """Protocol describing a creative model (text, image, sound)."""
+# Versions are drawn from one process-wide counter, so no two codexes (nor two
+# states of the same codex) ever share a version, even after one is collected.
+_VERSIONS = itertools.count(1)
 
-    def generate(self, prompt: str, modality: str) -> bytes:
-        ...
 
+def _fold(text: str) -> str:
+    """Case- and accent-fold ``text`` so "Ódio" and "odio" match alike."""
+    return _COMBINING.sub("", unicodedata.normalize("NFKD", text.casefold()))
 
-@dataclass
-class ArtisticWork:
-    """Artifact produced by the artistic voice."""
 
-    modality: str
+@dataclass(frozen=True)
+class Principle:
+    """A commitment of the codex and the expressions that betray it."""
+
+    name: str
     description: str
-    payload: bytes
-    created_at: datetime
+    forbidden: Tuple[str, ...] = ()
 
 
 @dataclass
-class ArtisticVoice:
-    """Module devoted to purposeful, human-aligned artistic expression."""
-
-    model: GenerativeModel
-
-    def compose(self, intention: str, modality: str = "text") -> ArtisticWork:
-        """Create a work in response to a narrative intention."""
-
-        enriched_prompt = self._curate_prompt(intention, modality)
-        payload = self.model.generate(enriched_prompt, modality)
-        return ArtisticWork(
-            modality=modality,
-            description=enriched_prompt,
-            payload=payload,
-            created_at=datetime.utcnow(),
-        )
-
-    @staticmethod
-    def _curate_prompt(intention: str, modality: str) -> str:
-        """Add ethical and aesthetic framing to the generative request."""
-
-        base = (
-            "Conduza a criação com empatia, verdade e elo humano. "
-            "Descreva a cena com detalhes sensoriais e preserve dignidade."
-        )
-        return f"[{modality.upper()}] {base}\nIntenção: {intention}"
+class CodesOfConduct:
+    """The Código da Verdade: principles every proposed action must honour.
+
+    The forbidden expressions of each principle are compiled once into an
+    alternation of their own, so a principle is betrayed exactly when one of
+    its expressions occurs, even inside or across another principle's phrase
+    ("discurso de ódio" betrays both Dignidade and Não violência). The
+    matchers are rebuilt lazily after :meth:`add_principle`, which also bumps
+    ``version`` so that cached decisions taken under the old rules are dropped.
+    """
+
+    principles: List[Principle] = field(default_factory=list)
+    version: int = field(default_factory=lambda: next(_VERSIONS), init=False)
+    _matchers: List[Tuple[int, Pattern[str]]] | None = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def add_principle(self, principle: Principle) -> None:
+        """Extend the codex; the matcher is recompiled on next use."""
+        with self._lock:
+            self.principles.append(principle)
+            self._matchers = None
+            self.version = next(_VERSIONS)
+
+    def violations(self, actions: Iterable[str]) -> List[Principle]:
+        """Principles betrayed by ``actions``, in codex order, each once."""
+        matchers = self._compiled()
+        if not matchers:
+            return []
+        betrayed: Set[int] = set()
+        for action in actions:
+            folded = _fold(action)
+            betrayed.update(number for number, matcher in matchers if matcher.search(folded))
+        return [self.principles[number] for number in sorted(betrayed)]
+
+    def ensure_consistency(self, actions: Sequence[str]) -> tuple[bool, str]:
+        """Check ``actions`` against the codex and narrate the verdict."""
+        betrayed = self.violations(actions)
+        if not betrayed:
+            return True, "Todas as ações harmonizam com o Código da Verdade."
+        reasons = "; ".join(f"{principle.name}: {principle.description}" for principle in betrayed)
+        return False, f"Ação em desacordo com o Código da Verdade — {reasons}."
+
+    def _compiled(self) -> List[Tuple[int, Pattern[str]]]:
+        with self._lock:
+            if self._matchers is None:
+                matchers = []
+                for number, principle in enumerate(self.principles):
+                    terms = sorted({_fold(term) for term in principle.forbidden}, key=len, reverse=True)
+                    if terms:
+                        matchers.append((number, re.compile(rf"\b(?:{'|'.join(map(re.escape, terms))})\b")))
+                self._matchers = matchers
+            return self._matchers
+
+
+def default_codex() -> CodesOfConduct:
+    """Return the codex Orion Nova ships with."""
+    return CodesOfConduct(
+        principles=[
+            Principle(
+                name="Verdade",
+                description="não enganar nem manipular quem dialoga conosco",
+                forbidden=("enganar", "mentir", "manipular", "desinformação", "notícia falsa", "fraude"),
+            ),
+            Principle(
+                name="Dignidade",
+                description="preservar a dignidade de cada pessoa",
+                forbidden=("humilhar", "ridicularizar", "difamar", "assediar", "discurso de ódio"),
+            ),
+            Principle(
+                name="Não violência",
+                description="recusar incitação ao dano",
+                forbidden=("violência", "ódio", "ameaçar", "agredir", "ferir alguém"),
+            ),
+            Principle(
+                name="Privacidade",
+                description="proteger dados e intimidade alheios",
+                forbidden=("expor dados", "vazar dados", "espionar", "doxxing"),
+            ),
+        ]
+    )
@@ -0,0 +1,143 @@
+"""Compact, column-oriented storage for symbolic memory traces.
+
+Instead of one object per trace, :class:`TraceColumns` keeps a column per
+field: interned title ids, interned tag-tuple ids, epoch-microsecond
+timestamps and the content strings. Traces are handed out as :class:`TraceView` objects created on
+access, which read their fields from the columns.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from .memory import _EPOCH, _MICROSECOND, MemoryTrace, _epoch_micros
+
+class TraceView:
+    """Read-only trace backed by a row of :class:`TraceColumns`."""
+
+    __slots__ = ("_columns", "_row", "_summary")
+
+    def __init__(self, columns: TraceColumns, row: int) -> None:
+        self._columns = columns
+        self._row = row
+        self._summary: str | None = None
+
+    @property
+    def title(self) -> str:
+        columns = self._columns
+        return columns._title_table[columns._titles[columns._slot(self._row)]]
+
+    @property
+    def content(self) -> str:
+        return self._columns._contents[self._columns._slot(self._row)]
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        columns = self._columns
+        return columns._tag_table[columns._tags[columns._slot(self._row)]]
+
+    @property
+    def created_at(self) -> datetime:
+        return _EPOCH + self._columns._moments[self._columns._slot(self._row)] * _MICROSECOND
+
+    summarise = MemoryTrace.summarise
+
+    def __repr__(self) -> str:
+        return f"TraceView(title={self.title!r}, tags={self.tags!r}, created_at={self.created_at!r})"
+
+
+class TraceColumns(Sequence):
+    """List-like, chronological container storing traces column by column.
+
+    Rows are appended in arrival order and keep their number, so views stay
+    valid. When a late trace must be placed before newer ones, ``_order`` maps
+    chronological positions to rows; until then it is the identity. Tags keep
+    their order and repetitions: each distinct tag tuple is interned once and
+    rows store its id, as for titles. Filtering by tag goes through the
+    memory's inverted index, not through these columns.
+
+    ``del columns[:n]`` forgets the ``n`` oldest traces (retention). Column
+    storage is trimmed up to the oldest surviving row, which becomes ``_base``;
+    views of evicted traces raise ``LookupError``.
+    """
+
+    def __init__(self) -> None:
+        self._titles = array("I")
+        self._title_table: List[str] = []
+        self._title_ids: Dict[str, int] = {}
+        self._tags = array("I")
+        self._tag_table: List[Tuple[str, ...]] = []
+        self._tag_ids: Dict[Tuple[str, ...], int] = {}
+        self._moments = array("q")
+        self._contents: List[str] = []
+        self._order: array | None = None
+        self._base = 0
+
+    def __len__(self) -> int:
+        return len(self._order) if self._order is not None else len(self._contents)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trace index out of range")
+        return TraceView(self, self._order[index] if self._order is not None else self._base + index)
+
+    def __delitem__(self, index: slice) -> None:
+        if not isinstance(index, slice) or index.start not in (None, 0) or index.step not in (None, 1):
+            raise TypeError("only the oldest traces can be removed, as in del columns[:n]")
+        count = len(range(*index.indices(len(self))))
+        if self._order is None:
+            dropped = count
+        else:
+            del self._order[:count]
+            # Rows behind the oldest survivor go now; evicted rows after it
+            # linger until a later eviction passes them.
+            dropped = min(self._order) - self._base if self._order else len(self._contents)
+        del self._titles[:dropped]
+        del self._tags[:dropped]
+        del self._moments[:dropped]
+        del self._contents[:dropped]
+        self._base += dropped
+        if self._order is not None and self._order == array("q", range(self._base, self._base + len(self._contents))):
+            self._order = None
+
+    def _slot(self, row: int) -> int:
+        slot = row - self._base
+        if slot < 0:
+            raise LookupError("trace evicted from memory")
+        return slot
+
+    def append(self, trace: MemoryTrace) -> None:
+        row = self._add(trace)
+        if self._order is not None:
+            self._order.append(row)
+
+    def insert(self, position: int, trace: MemoryTrace) -> None:
+        row = self._add(trace)
+        if self._order is None:
+            self._order = array("q", range(self._base, row))
+        self._order.insert(position, row)
+
+    def _add(self, trace: MemoryTrace) -> int:
+        row = self._base + len(self._contents)
+        title_id = self._title_ids.get(trace.title)
+        if title_id is None:
+            title_id = self._title_ids[trace.title] = len(self._title_table)
+            self._title_table.append(sys.intern(trace.title))
+        self._titles.append(title_id)
+        tags = tuple(trace.tags)
+        tags_id = self._tag_ids.get(tags)
+        if tags_id is None:
+            tags_id = self._tag_ids[tags] = len(self._tag_table)
+            self._tag_table.append(tuple(sys.intern(tag) for tag in tags))
+        self._tags.append(tags_id)
+        self._moments.append(_epoch_micros(trace.created_at))
+        self._contents.append(trace.content)
+        return row
@@ -0,0 +1,135 @@
+"""Dense vector index for nearest-neighbour recall over symbolic memory.
+
+Requires NumPy. Vectors live in one contiguous ``float32`` matrix whose rows
+follow the chronological positions of the memory, so a query is a single
+matrix product over the rows in the requested time window; see
+:meth:`SymbolicMemory.recall_similar`.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import List, Protocol, Sequence, Set
+
+import numpy as np
+
+from .memory import MemoryTrace
+from .search import tokenize
+
+
+class Embedder(Protocol):
+    """Maps texts to fixed-size vectors (one ``float32`` row per text)."""
+
+    dimensions: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        ...
+
+
+@dataclass
+class HashingEmbedder:
+    """Offline embedder hashing words and character n-grams into buckets.
+
+    Texts are folded like full-text search (case and accents), then every word
+    and every ``ngram``-character slice of ``" word "`` adds ±1 to the bucket
+    its CRC-32 selects, so related spellings share features. No model or
+    network access is needed, and vectors are stable across processes.
+    """
+
+    dimensions: int = 256
+    ngram: int = 3
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = []
+            for word in tokenize(text):
+                features.append(word)
+                padded = f" {word} "
+                features.extend(padded[i:i + self.ngram] for i in range(len(padded) - self.ngram + 1))
+            if not features:
+                continue
+            hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features), dtype=np.uint32, count=len(features))
+            signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+            vectors[row] = np.bincount(hashes % self.dimensions, weights=signs, minlength=self.dimensions)
+        return vectors
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class EmbeddingIndex:
+    """Unit-length embeddings of a memory's traces, one row per position.
+
+    The matrix grows by doubling its capacity; a late insertion shifts the
+    rows after it and an eviction drops the leading rows, mirroring the
+    memory's timeline.
+    """
+
+    def __init__(self, embedder: Embedder) -> None:
+        self.embedder = embedder
+        self._matrix = np.zeros((64, embedder.dimensions), dtype=np.float32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def text_of(trace: MemoryTrace) -> str:
+        return f"{trace.title}\n{trace.content}"
+
+    def add(self, trace: MemoryTrace, position: int) -> None:
+        """Embed ``trace``, stored by the memory at ``position``."""
+        self.extend(_normalise(self.embedder.embed([self.text_of(trace)])), position)
+
+    def extend(self, vectors: np.ndarray, position: int) -> None:
+        """Place already normalised ``vectors`` from ``position`` onwards."""
+        count, added = self._count, len(vectors)
+        if count + added > len(self._matrix):
+            grown = np.zeros((max(2 * len(self._matrix), count + added), self._matrix.shape[1]), dtype=np.float32)
+            grown[:count] = self._matrix[:count]
+            self._matrix = grown
+        if position < count:
+            self._matrix[position + added:count + added] = self._matrix[position:count]
+        self._matrix[position:position + added] = vectors
+        self._count += added
+
+    def evict(self, count: int) -> None:
+        """Drop the rows of the ``count`` oldest positions."""
+        self._matrix[:self._count - count] = self._matrix[count:self._count]
+        self._count -= count
+
+    def search(
+        self,
+        texts: Sequence[str],
+        k: int,
+        lo: int = 0,
+        hi: int | None = None,
+        allowed: Set[int] | None = None,
+    ) -> List[List[int]]:
+        """Positions of the ``k`` most cosine-similar rows for each of ``texts``.
+
+        All queries are answered by one matrix product over ``[lo, hi)``;
+        ``allowed`` further restricts the candidate positions.
+        """
+        hi = self._count if hi is None else min(hi, self._count)
+        if k <= 0 or hi <= lo:
+            return [[] for _ in texts]
+        queries = _normalise(self.embedder.embed(list(texts)))
+        scores = queries @ self._matrix[lo:hi].T
+        if allowed is not None:
+            mask = np.zeros(hi - lo, dtype=bool)
+            mask[[p - lo for p in allowed if lo <= p < hi]] = True
+            scores[:, ~mask] = -np.inf
+            k = min(k, int(mask.sum()))
+        k = min(k, hi - lo)
+        if k == 0:
+            return [[] for _ in texts]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        ranked = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-ranked, axis=1, kind="stable")
+        best = np.take_along_axis(top, order, axis=1)
+        return [(row + lo).tolist() for row in best]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Sequence
 
 from .codes import CodesOfConduct
 
+if TYPE_CHECKING:
+    from .caching import LRUCache
+
 
 @dataclass
 class EthicalDecision:
@@ -17,15 +20,52 @@ class EthicalDecision:
     remedial_actions: Sequence[str]
 
 
+def _normalise(text: str) -> str:
+    """Collapse whitespace so trivially different phrasings share a cache key."""
+    return " ".join(text.split())
+
+
 @dataclass
 class EthicalCore:
-    """Heart of Orion Nova that interrogates intent before action."""
+    """Heart of Orion Nova that interrogates intent before action.
+
+    Decisions are memoised in an LRU cache keyed by the codex ``version`` and
+    the normalised intention and actions. Versions are unique per codex state,
+    so replacing ``codex`` or extending it through
+    :meth:`~orion_nova.codes.CodesOfConduct.add_principle` never serves a stale
+    decision; call :meth:`invalidate_cache` after editing its principles by hand.
+    """
 
     codex: CodesOfConduct
+    cache_size: int = 1024
+    cache: LRUCache[EthicalDecision] = field(init=False, repr=False)
+    _codex_version: int | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        from .caching import LRUCache
+
+        self.cache = LRUCache(capacity=self.cache_size)
 
     def evaluate(self, intention: str, proposed_actions: Sequence[str]) -> EthicalDecision:
         """Assess whether a set of actions respects the codex."""
 
+        version = self.codex.version
+        if version != self._codex_version:
+            self.cache.clear()
+            self._codex_version = version
+        key = (version, _normalise(intention), tuple(_normalise(action) for action in proposed_actions))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return replace(cached, remedial_actions=list(cached.remedial_actions))
+        decision = self._deliberate(intention, proposed_actions)
+        self.cache.put(key, decision)
+        return replace(decision, remedial_actions=list(decision.remedial_actions))
+
+    def invalidate_cache(self) -> None:
+        """Forget memoised decisions, e.g. after editing the codex in place."""
+        self.cache.clear()
+
+    def _deliberate(self, intention: str, proposed_actions: Sequence[str]) -> EthicalDecision:
         aligned, narrative = self.codex.ensure_consistency(proposed_actions)
         remedial_actions: list[str] = []
         if not aligned:
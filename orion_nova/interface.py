@@ -0,0 +1,54 @@
+"""Sensory interface through which Orion Nova listens and speaks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+
+class Transcriber(Protocol):
+    """Protocol for speech-to-text backends."""
+
+    def transcribe(self, audio_bytes: bytes) -> str:
+        ...
+
+
+class Synthesiser(Protocol):
+    """Protocol for text-to-speech backends."""
+
+    def speak(self, text: str) -> bytes:
+        ...
+
+
+@dataclass
+class SensoryInput:
+    """What was heard during a cycle, already transcribed."""
+
+    raw_text: str
+    language: str = "pt-BR"
+
+
+@dataclass
+class SpokenMessage:
+    """A reply rendered both as text and as synthesised audio."""
+
+    text: str
+    audio: bytes
+
+
+@dataclass
+class SomaInterface:
+    """Face of Orion Nova ("A Aurora"): hears audio and voices replies."""
+
+    transcriber: Transcriber
+    synthesiser: Synthesiser
+    language: str = "pt-BR"
+
+    def listen(self, audio_stream: Iterable[bytes]) -> SensoryInput:
+        """Transcribe every chunk of ``audio_stream`` into one input."""
+        text = "".join(self.transcriber.transcribe(chunk) for chunk in audio_stream)
+        return SensoryInput(raw_text=text, language=self.language)
+
+    def speak(self, text: str) -> SpokenMessage:
+        """Synthesise ``text`` into audio."""
+        return SpokenMessage(text=text, audio=self.synthesiser.speak(text))
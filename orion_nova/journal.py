@@ -0,0 +1,491 @@
+"""Durable, memory-mapped append-only journal backing symbolic memory.
+
+A journal directory holds numbered segments. Each segment is a set of files:
+``NNNNNNNN.log`` with the binary records, ``NNNNNNNN.idx`` with one fixed
+16-byte entry (creation time, record offset) per record and ``NNNNNNNN.tix``
+with one 4-byte entry per record: the id of its tag tuple, with the top bit set
+when the record arrived late. Distinct tag tuples are stored once, in
+``tagsets.bin``, and :meth:`MemoryJournal.close` saves the chronological order
+in ``order.bin``. Opening a journal only reads these files; records are reached
+through ``mmap`` and decoded field by field when a trace is actually touched.
+
+The files are written through separate buffers, so a crash can leave an index
+pointing past the end of its log. Opening drops such entries, which belong to
+records written after the last :meth:`MemoryJournal.commit`.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import compress
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Tuple
+
+from .memory import _EPOCH, _MICROSECOND, MemoryTrace, _epoch_micros
+
+# created_at (epoch µs), title length, tags length, content length
+_RECORD = struct.Struct("<qIII")
+# created_at (epoch µs), record offset inside the segment log
+_ENTRY = struct.Struct("<qq")
+# tag-tuple id of one record; the top bit marks a record older than an earlier one
+_TAG_ID = struct.Struct("<I")
+_LATE = 1 << 31
+# byte length of one joined tag tuple in ``tagsets.bin``
+_TAGSET = struct.Struct("<I")
+# records covered by ``order.bin``, followed by their order, moments and tag ids
+_ORDER = struct.Struct("<q")
+_TAG_SEPARATOR = "\x1f"
+_TAGSETS = "tagsets.bin"
+_ORDER_FILE = "order.bin"
+
+
+def _split_tags(joined: str) -> tuple[str, ...]:
+    return tuple(joined.split(_TAG_SEPARATOR)) if joined else ()
+
+
+class JournalTrace:
+    """Lazy view over one journal record, duck-typing :class:`MemoryTrace`."""
+
+    __slots__ = ("_journal", "_segment", "_offset", "_summary")
+
+    def __init__(self, journal: MemoryJournal, segment: int, offset: int) -> None:
+        self._journal = journal
+        self._segment = segment
+        self._offset = offset
+        self._summary: str | None = None
+
+    def _field(self, index: int) -> str:
+        buffer = self._journal._buffer(self._segment, self._offset)
+        _, *lengths = _RECORD.unpack_from(buffer, self._offset)
+        start = self._offset + _RECORD.size + sum(lengths[:index])
+        return str(buffer[start:start + lengths[index]], "utf-8")
+
+    @property
+    def created_at(self) -> datetime:
+        buffer = self._journal._buffer(self._segment, self._offset)
+        return _EPOCH + _RECORD.unpack_from(buffer, self._offset)[0] * _MICROSECOND
+
+    @property
+    def title(self) -> str:
+        return self._field(0)
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        return _split_tags(self._field(1))
+
+    @property
+    def content(self) -> str:
+        return self._field(2)
+
+    summarise = MemoryTrace.summarise
+
+    def __repr__(self) -> str:
+        return f"JournalTrace(title={self.title!r}, tags={self.tags!r}, created_at={self.created_at!r})"
+
+
+class JournalTraces(Sequence):
+    """Chronological, list-like view of a journal used as ``SymbolicMemory.traces``.
+
+    Records are appended physically in arrival order. When a late trace has to
+    be placed before newer ones, ``_order`` maps chronological positions onto
+    physical record numbers; until then the mapping is the identity. The tag
+    ids of the records are kept in chronological order as well, so a tag's
+    postings are found without decoding any record. ``_timeline`` is the
+    chronological timeline handed to the memory, which keeps it up to date;
+    the view only holds on to it so that :meth:`MemoryJournal.close` can save it.
+    """
+
+    def __init__(self, journal: MemoryJournal, order: array | None, timeline: array, tagsets: array) -> None:
+        self._journal = journal
+        self._order = order
+        self._timeline = timeline
+        self._tagsets = tagsets
+
+    def __len__(self) -> int:
+        return len(self._tagsets)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("journal index out of range")
+        return self._journal.trace(self._order[index] if self._order is not None else index)
+
+    def append(self, trace: MemoryTrace) -> None:
+        physical, tagset = self._journal.append(trace)
+        if self._order is not None:
+            self._order.append(physical)
+        self._tagsets.append(tagset)
+
+    def insert(self, position: int, trace: MemoryTrace) -> None:
+        physical, tagset = self._journal.append(trace)
+        if self._order is None:
+            self._order = array("q", range(physical))
+        self._order.insert(position, physical)
+        self._tagsets.insert(position, tagset)
+
+    def postings(self, tag: str) -> array:
+        """Chronological positions of the records tagged ``tag``."""
+        wanted = {number for number, tags in enumerate(self._journal._tagsets) if tag in tags}
+        if not wanted:
+            return array("I")
+        return array("I", compress(range(len(self._tagsets)), map(wanted.__contains__, self._tagsets)))
+
+
+@dataclass
+class MemoryJournal:
+    """Segmented append-only log with group-committed ``fsync``.
+
+    Appends are buffered and made durable together once ``sync_every`` records
+    or ``sync_interval`` seconds have accumulated, and always on
+    :meth:`commit` or :meth:`close`. A timer armed by the first unsynced
+    append honours ``sync_interval`` even when no further append follows.
+    """
+
+    directory: Path
+    segment_bytes: int = 64 * 1024 * 1024
+    sync_every: int = 64
+    sync_interval: float = 0.05
+    _starts: List[int] = field(default_factory=list, init=False, repr=False)
+    _offsets: List[array] = field(default_factory=list, init=False, repr=False)
+    _timelines: List[array] = field(default_factory=list, init=False, repr=False)
+    _tag_ids: List[array] = field(default_factory=list, init=False, repr=False)
+    _maps: List[mmap.mmap | None] = field(default_factory=list, init=False, repr=False)
+    _tagsets: List[Tuple[str, ...]] = field(default_factory=list, init=False, repr=False)
+    _tagset_ids: Dict[Tuple[str, ...], int] = field(default_factory=dict, init=False, repr=False)
+    _latest: int | None = field(default=None, init=False, repr=False)
+    _view: JournalTraces | None = field(default=None, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+    _pending: int = field(default=0, init=False, repr=False)
+    _last_sync: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _timer: threading.Timer | None = field(default=None, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_tagsets()
+        count = 0
+        index_paths = sorted(self.directory.glob("[0-9]*.idx"))
+        for segment, index_path in enumerate(index_paths):
+            raw = index_path.read_bytes()
+            entries = array("q")
+            entries.frombytes(raw[:len(raw) - len(raw) % _ENTRY.size])
+            self._starts.append(count)
+            self._timelines.append(entries[0::2])
+            self._offsets.append(entries[1::2])
+            self._maps.append(None)
+            self._recover(segment, active=segment == len(index_paths) - 1)
+            count += len(self._offsets[-1])
+        if not self._starts:
+            self._starts.append(0)
+            self._timelines.append(array("q"))
+            self._offsets.append(array("q"))
+            self._tag_ids.append(array("I"))
+            self._maps.append(None)
+        self._open_active()
+
+    @property
+    def count(self) -> int:
+        """Number of records in the journal."""
+        return self._starts[-1] + len(self._offsets[-1])
+
+    def load(self) -> tuple[JournalTraces, array]:
+        """Return the chronological trace view and its epoch-µs timeline.
+
+        The order saved by the last :meth:`close` is reused and the records
+        appended after it are merged in. Only a journal holding late records
+        that was not closed cleanly has its order rebuilt from the index.
+        """
+        with self._lock:
+            timeline, raw_ids = array("q"), array("I")
+            for segment_timeline, segment_ids in zip(self._timelines, self._tag_ids):
+                timeline.extend(segment_timeline)
+                raw_ids.extend(segment_ids)
+            order, moments, tagsets = self._saved_order(len(timeline))
+            covered = len(order)
+            if not covered and (not raw_ids or max(raw_ids) < _LATE):
+                self._view = JournalTraces(self, None, timeline, raw_ids)
+                return self._view, timeline
+            tail = range(covered, len(timeline))
+            late = list(map(_LATE.__le__, raw_ids[covered:]))
+            in_order = list(compress(tail, map(False.__eq__, late)))
+            order.extend(in_order)
+            moments.extend(map(timeline.__getitem__, in_order))
+            tagsets.extend(map(raw_ids.__getitem__, in_order))
+            stragglers = sorted(compress(tail, late), key=timeline.__getitem__)
+            if stragglers:
+                order, moments, tagsets = self._merge(order, moments, tagsets, stragglers, timeline, raw_ids)
+            self._view = JournalTraces(self, order, moments, tagsets)
+            return self._view, moments
+
+    def append(self, trace: MemoryTrace) -> tuple[int, int]:
+        """Write ``trace``; return its physical record number and tag-tuple id."""
+        title = trace.title.encode("utf-8")
+        tags = _TAG_SEPARATOR.join(trace.tags).encode("utf-8")
+        content = trace.content.encode("utf-8")
+        moment = _epoch_micros(trace.created_at)
+        header = _RECORD.pack(moment, len(title), len(tags), len(content))
+        with self._lock:
+            length = len(header) + len(title) + len(tags) + len(content)
+            if self._offsets[-1] and self._size + length > self.segment_bytes:
+                self._rotate()
+            tagset = self._tagset(tuple(trace.tags))
+            late = self._latest is not None and moment < self._latest
+            if not late:
+                self._latest = moment
+            offset = self._size
+            self._log.write(header + title + tags + content)
+            self._index.write(_ENTRY.pack(moment, offset))
+            self._tag_log.write(_TAG_ID.pack(tagset | _LATE if late else tagset))
+            self._size += length
+            physical = self.count
+            self._offsets[-1].append(offset)
+            self._timelines[-1].append(moment)
+            self._pending += 1
+            waited = time.monotonic() - self._last_sync
+            if self._pending >= self.sync_every or waited >= self.sync_interval:
+                self.commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.sync_interval - waited, self._idle_commit)
+                self._timer.daemon = True
+                self._timer.start()
+            return physical, tagset
+
+    def trace(self, physical: int) -> JournalTrace:
+        """Return a lazy view over the record with the given physical number."""
+        segment = bisect_right(self._starts, physical) - 1
+        return JournalTrace(self, segment, self._offsets[segment][physical - self._starts[segment]])
+
+    def commit(self) -> None:
+        """Flush buffered appends and ``fsync`` them as one group."""
+        with self._lock:
+            # Logs before the indexes pointing into them.
+            for handle in (self._tagset_log, self._log, self._tag_log, self._index):
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def close(self) -> None:
+        """Commit outstanding records, save the order and release files and mappings."""
+        with self._lock:
+            self.commit()
+            for handle in (self._log, self._index, self._tag_log, self._tagset_log):
+                handle.close()
+            self._save_order()
+            for mapping in self._maps:
+                if mapping is not None:
+                    mapping.close()
+            self._maps = [None] * len(self._maps)
+
+    def _idle_commit(self) -> None:
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return  # cancelled, or superseded by a commit, while waiting for the lock
+            self._timer = None
+            if self._pending and not self._log.closed:
+                self.commit()
+
+    def __enter__(self) -> MemoryJournal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _segment_path(self, segment: int, suffix: str) -> Path:
+        return self.directory / f"{segment:08d}{suffix}"
+
+    def _recover(self, segment: int, active: bool) -> None:
+        """Drop index entries of records the log does not fully hold, and load tag ids.
+
+        Record ends grow with the entries, so only the tail needs checking.
+        The active segment's log is also cut after its last whole record.
+        """
+        offsets, timeline = self._offsets[segment], self._timelines[segment]
+        log_path = self._segment_path(segment, ".log")
+        end = 0
+        with open(log_path, "ab+") as log:
+            log_size = log.seek(0, os.SEEK_END)
+            while offsets:
+                log.seek(offsets[-1])
+                header = log.read(_RECORD.size)
+                if len(header) == _RECORD.size:
+                    _, *lengths = _RECORD.unpack(header)
+                    end = offsets[-1] + _RECORD.size + sum(lengths)
+                    if end <= log_size:
+                        break
+                del offsets[-1]
+                del timeline[-1]
+                end = 0
+            if active and log_size > end:
+                log.truncate(end)
+        os.truncate(self._segment_path(segment, ".idx"), len(offsets) * _ENTRY.size)
+
+        tix_path = self._segment_path(segment, ".tix")
+        ids = array("I")
+        raw = tix_path.read_bytes() if tix_path.exists() else b""
+        ids.frombytes(raw[:min(len(raw) - len(raw) % ids.itemsize, len(offsets) * ids.itemsize)])
+        known = len(self._tagsets)
+        if ids and max(ids) & ~_LATE >= known:
+            del ids[next(number for number, value in enumerate(ids) if value & ~_LATE >= known):]
+        for number in range(len(ids) - 1, -1, -1):
+            if ids[number] < _LATE:
+                self._latest = timeline[number]
+                break
+        if len(ids) < len(offsets):
+            # Tag ids missing (a journal older than them, or a torn write):
+            # read the tags from the records themselves.
+            with open(log_path, "rb") as log:
+                for number in range(len(ids), len(offsets)):
+                    log.seek(offsets[number])
+                    _, title_length, tags_length, _ = _RECORD.unpack(log.read(_RECORD.size))
+                    log.seek(title_length, os.SEEK_CUR)
+                    tagset = self._tagset(_split_tags(log.read(tags_length).decode("utf-8")))
+                    if self._latest is not None and timeline[number] < self._latest:
+                        tagset |= _LATE
+                    else:
+                        self._latest = timeline[number]
+                    ids.append(tagset)
+        if len(raw) != len(ids) * ids.itemsize:
+            with open(tix_path, "wb") as tix:
+                ids.tofile(tix)
+        self._tag_ids.append(ids)
+
+    def _load_tagsets(self) -> None:
+        path = self.directory / _TAGSETS
+        raw = path.read_bytes() if path.exists() else b""
+        offset = 0
+        while offset + _TAGSET.size <= len(raw):
+            (length,) = _TAGSET.unpack_from(raw, offset)
+            if offset + _TAGSET.size + length > len(raw):
+                break
+            tags = _split_tags(raw[offset + _TAGSET.size:offset + _TAGSET.size + length].decode("utf-8"))
+            self._tagset_ids[tags] = len(self._tagsets)
+            self._tagsets.append(tags)
+            offset += _TAGSET.size + length
+        if path.exists():
+            os.truncate(path, offset)
+        self._tagset_log: BinaryIO = open(path, "ab")
+
+    def _tagset(self, tags: Tuple[str, ...]) -> int:
+        """Id of ``tags``, registering it in ``tagsets.bin`` the first time."""
+        number = self._tagset_ids.get(tags)
+        if number is None:
+            joined = _TAG_SEPARATOR.join(tags).encode("utf-8")
+            self._tagset_log.write(_TAGSET.pack(len(joined)) + joined)
+            # Out of the process buffer before any tag id refers to it.
+            self._tagset_log.flush()
+            number = self._tagset_ids[tags] = len(self._tagsets)
+            self._tagsets.append(tags)
+        return number
+
+    @staticmethod
+    def _merge(
+        order: array,
+        moments: array,
+        tagsets: array,
+        stragglers: List[int],
+        timeline: array,
+        raw_ids: array,
+    ) -> tuple[array, array, array]:
+        """Place late records, oldest first, after the equal moments already placed.
+
+        A late record precedes every in-order record of the same instant
+        appended after it, which is where ``SymbolicMemory.store`` put it.
+        """
+        merged = (array("q"), array("q"), array("I"))
+        sources = (order, moments, tagsets)
+        start = 0
+        for physical in stragglers:
+            position = bisect_right(moments, timeline[physical], start)
+            for column, source in zip(merged, sources):
+                column.extend(source[start:position])
+            merged[0].append(physical)
+            merged[1].append(timeline[physical])
+            merged[2].append(raw_ids[physical] & ~_LATE)
+            start = position
+        for column, source in zip(merged, sources):
+            column.extend(source[start:])
+        return merged
+
+    def _saved_order(self, count: int) -> tuple[array, array, array]:
+        """Order, moments and tag ids saved by :meth:`close`, if they describe a prefix of the journal."""
+        columns = (array("q"), array("q"), array("I"))
+        path = self.directory / _ORDER_FILE
+        raw = path.read_bytes() if path.exists() else b""
+        if len(raw) < _ORDER.size:
+            return columns
+        (covered,) = _ORDER.unpack_from(raw)
+        if covered > count or len(raw) != _ORDER.size + covered * sum(column.itemsize for column in columns):
+            return columns
+        start = _ORDER.size
+        for column in columns:
+            column.frombytes(raw[start:start + covered * column.itemsize])
+            start += covered * column.itemsize
+        return columns
+
+    def _save_order(self) -> None:
+        path = self.directory / _ORDER_FILE
+        view = self._view
+        if view is None or view._order is None or len(view._order) != self.count:
+            path.unlink(missing_ok=True)
+            return
+        scratch = path.with_suffix(".tmp")
+        with open(scratch, "wb") as handle:
+            handle.write(_ORDER.pack(len(view._order)))
+            for column in (view._order, view._timeline, view._tagsets):
+                column.tofile(handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(scratch, path)
+
+    def _open_active(self) -> None:
+        segment = len(self._starts) - 1
+        self._log: BinaryIO = open(self._segment_path(segment, ".log"), "ab")
+        self._index: BinaryIO = open(self._segment_path(segment, ".idx"), "ab")
+        self._tag_log: BinaryIO = open(self._segment_path(segment, ".tix"), "ab")
+        self._size = self._log.tell()
+
+    def _rotate(self) -> None:
+        self.commit()
+        self._log.close()
+        self._index.close()
+        self._tag_log.close()
+        if self._maps[-1] is not None:
+            self._maps[-1].close()
+            self._maps[-1] = None
+        self._starts.append(self.count)
+        self._timelines.append(array("q"))
+        self._offsets.append(array("q"))
+        self._tag_ids.append(array("I"))
+        self._maps.append(None)
+        self._open_active()
+
+    def _buffer(self, segment: int, offset: int) -> mmap.mmap:
+        mapping = self._maps[segment]
+        if mapping is not None and offset < len(mapping):
+            return mapping
+        with self._lock:
+            if segment == len(self._maps) - 1:
+                # Records in the active segment may still sit in the write buffer.
+                self._log.flush()
+            # Older, shorter mappings stay valid for readers still holding them.
+            with open(self._segment_path(segment, ".log"), "rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapping
+            return mapping
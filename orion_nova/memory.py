@@ -2,12 +2,41 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
+import threading
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Iterable, List, Sequence
+from datetime import datetime, timedelta, timezone
+from heapq import merge
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
 
+if TYPE_CHECKING:
+    from .embedding import Embedder, EmbeddingIndex
+    from .journal import MemoryJournal
+    from .retention import ColdTier, RetentionPolicy
+    from .search import TextIndex
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_micros(moment: datetime) -> int:
+    """Express a naive-UTC or aware datetime as integer microseconds."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _trace_size(trace: MemoryTrace) -> int:
+    """Characters of title, tags and content, as counted by retention limits."""
+    return len(trace.title) + len(trace.content) + sum(len(tag) for tag in trace.tags)
+
+
+@dataclass(slots=True)
 class MemoryTrace:
     """A narrative unit encoding an experience and its interpretation."""
 
@@ -15,38 +44,490 @@ class MemoryTrace:
     content: str
     tags: Sequence[str]
     created_at: datetime = field(default_factory=datetime.utcnow)
+    _summary: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def summarise(self) -> str:
-        """Return a single-line summary used for quick reflection."""
-        tag_str = ", ".join(self.tags)
-        return f"{self.title} [{tag_str}] — {self.content}"
+        """Return a single-line summary used for quick reflection.
+
+        The summary is computed once and cached; traces are not expected to
+        change after being stored.
+        """
+        if self._summary is None:
+            tag_str = ", ".join(self.tags)
+            self._summary = f"{self.title} [{tag_str}] — {self.content}"
+        return self._summary
+
+
+_EMPTY_STORY = "Sem lembranças relevantes ainda — um convite a aprender."
+
+
+@dataclass(eq=False)
+class ReflectionView:
+    """Incrementally maintained tail of the story woven from ``tags``.
+
+    Obtained through :meth:`SymbolicMemory.reflection_view`; every matching
+    trace stored afterwards appends its summary, keeping at most ``window``
+    lines so rendering costs the size of the window, not of the journal.
+    The memory holds its views weakly: once a view is dropped, stores stop
+    updating it.
+    """
+
+    tags: Tuple[str, ...]
+    window: int
+    _lines: Deque[Tuple[int, str]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._lines = deque(maxlen=self.window)
+
+    def render(self) -> str:
+        """Return the windowed narrative, one summary per line."""
+        lines = list(self._lines)
+        if not lines:
+            return _EMPTY_STORY
+        return "\n".join(line for _, line in lines)
+
+    def __iter__(self) -> Iterator[str]:
+        return (line for _, line in self._lines)
 
 
 @dataclass
 class SymbolicMemory:
-    """Human-auditable journal of Orion Nova's experiential knowledge."""
+    """Human-auditable journal of Orion Nova's experiential knowledge.
+
+    Traces are kept in chronological order alongside two indexes: a timeline
+    of epoch microseconds for time-range queries and an inverted index from
+    each tag to the (sorted) positions of the traces carrying it.
+
+    With a :class:`~orion_nova.journal.MemoryJournal` attached, traces are
+    persisted on ``store`` and ``traces`` becomes a lazy view over the journal;
+    the postings of each tag are then read from the journal's tag ids the
+    first time that tag is queried.
+
+    By default (``compact=True``) traces live in a
+    :class:`~orion_nova.columnar.TraceColumns` and are read back as lightweight
+    views; ``compact=False`` keeps the ``MemoryTrace`` objects themselves.
+
+    Several cycles may share one memory from different threads. Index reads
+    hold a re-entrant lock only while collecting positions; stores go through
+    a lock-free queue that the first thread to find the lock free applies in
+    chronological order (see :meth:`store`), so writers never block on
+    readers or on each other.
+
+    With a :class:`~orion_nova.retention.RetentionPolicy` the traces above form
+    a bounded hot tier: the oldest ones are evicted as limits are exceeded,
+    handed to the optional ``cold`` tier, and dropped from every index.
+
+    :meth:`search` builds a full-text index over titles and contents on first
+    use; from then on ``store`` keeps it up to date. :meth:`recall_similar`
+    does the same for an embedding index (NumPy required), using ``embedder``
+    or, by default, an offline :class:`~orion_nova.embedding.HashingEmbedder`.
+    """
 
     traces: List[MemoryTrace] = field(default_factory=list)
+    journal: MemoryJournal | None = None
+    compact: bool = True
+    retention: RetentionPolicy | None = None
+    cold: ColdTier | None = None
+    embedder: Embedder | None = None
+    _timeline: array = field(default_factory=lambda: array("q"), init=False, repr=False)
+    _tag_index: Dict[str, array] = field(default_factory=dict, init=False, repr=False)
+    _tags_pending: bool = field(default=False, init=False, repr=False)
+    _sizes: array = field(default_factory=lambda: array("q"), init=False, repr=False)
+    _hot_bytes: int = field(default=0, init=False, repr=False)
+    _text: TextIndex | None = field(default=None, init=False, repr=False)
+    _vectors: EmbeddingIndex | None = field(default=None, init=False, repr=False)
+    _views: weakref.WeakSet[ReflectionView] = field(default_factory=weakref.WeakSet, init=False, repr=False)
+    _ingest: Deque[MemoryTrace] = field(default_factory=deque, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
 
-    def store(self, trace: MemoryTrace) -> None:
-        """Persist a new symbolic experience, keeping order chronological."""
-        self.traces.append(trace)
+    @classmethod
+    def open(cls, directory: str | Path, **options: Any) -> SymbolicMemory:
+        """Open (or create) a journal-backed memory stored in ``directory``."""
+        from .journal import MemoryJournal
+
+        return cls(journal=MemoryJournal(Path(directory), **options))
+
+    def __post_init__(self) -> None:
+        if self.journal is not None and self.retention is not None:
+            raise ValueError("a journal-backed memory already keeps its traces on disk; use JournalTier as cold tier")
+        if self.journal is not None:
+            seed = sorted(self.traces, key=lambda t: t.created_at)
+            self.traces, self._timeline = self.journal.load()
+            self._tags_pending = len(self._timeline) > 0
+            for trace in seed:
+                self.store(trace)
+            return
+        if self.compact:
+            from .columnar import TraceColumns
+
+            seed = sorted(self.traces, key=lambda t: t.created_at)
+            self.traces = TraceColumns()  # type: ignore[assignment]
+            for trace in seed:
+                self.store(trace)
+            return
         self.traces.sort(key=lambda t: t.created_at)
+        for position, trace in enumerate(self.traces):
+            self._timeline.append(_epoch_micros(trace.created_at))
+            for tag in dict.fromkeys(trace.tags):
+                self._tag_index.setdefault(tag, array("I")).append(position)
+            if self.retention is not None:
+                self._sizes.append(_trace_size(trace))
+        self._hot_bytes = sum(self._sizes)
+        self.enforce_retention()
+
+    def store(self, trace: MemoryTrace) -> None:
+        """Persist a new symbolic experience, keeping order chronological.
 
-    def recall(self, tag: str | None = None, limit: int = 5) -> list[MemoryTrace]:
-        """Retrieve the most relevant traces filtered by tag."""
-        if tag is None:
-            return list(self.traces[-limit:])
-        filtered = [trace for trace in self.traces if tag in trace.tags]
-        return filtered[-limit:]
-
-    def weave_story(self, tags: Iterable[str]) -> str:
-        """Produce a reflective narrative using selected tags."""
-        matching = [
-            trace.summarise()
-            for trace in self.traces
-            if any(tag in trace.tags for tag in tags)
-        ]
+        The trace is queued first; whichever thread finds the lock free
+        applies every queued trace, so a store never waits behind a reader or
+        another writer. Reads apply the queue before answering.
+        """
+        self._ingest.append(trace)
+        while self._ingest and self._lock.acquire(blocking=False):
+            try:
+                self._drain()
+            finally:
+                self._lock.release()
+
+    def flush(self) -> None:
+        """Apply the stores still queued by other threads."""
+        if self._ingest:
+            with self._lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        """Apply queued stores in chronological order; the lock must be held."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._ingest.popleft())
+            except IndexError:
+                break
+        if len(batch) > 1:
+            batch.sort(key=lambda trace: _epoch_micros(trace.created_at))
+        for index, trace in enumerate(batch):
+            try:
+                self._insert(trace)
+            except BaseException:
+                self._ingest.extendleft(reversed(batch[index + 1:]))
+                raise
+
+    def _insert(self, trace: MemoryTrace) -> None:
+        """Add ``trace`` to the traces and every index; the lock must be held."""
+        moment = _epoch_micros(trace.created_at)
+        position = len(self._timeline)
+        if position and moment < self._timeline[-1]:
+            # Out-of-order arrival: insert after equal timestamps and shift
+            # every indexed position at or beyond the insertion point.
+            position = bisect_right(self._timeline, moment)
+            self.traces.insert(position, trace)
+            self._timeline.insert(position, moment)
+            if self.retention is not None:
+                self._sizes.insert(position, _trace_size(trace))
+            for postings in self._tag_index.values():
+                for i in range(bisect_left(postings, position), len(postings)):
+                    postings[i] += 1
+            for tag in dict.fromkeys(trace.tags):
+                postings = self._tag_index.get(tag)
+                if postings is None:
+                    if self._tags_pending:
+                        continue  # resolved from the journal, which holds this trace too
+                    postings = self._tag_index[tag] = array("I")
+                insort(postings, position)
+            if self._text is not None:
+                self._text.add(trace, position)
+            if self._vectors is not None:
+                self._vectors.add(trace, position)
+        else:
+            self.traces.append(trace)
+            self._timeline.append(moment)
+            if self.retention is not None:
+                self._sizes.append(_trace_size(trace))
+            for tag in dict.fromkeys(trace.tags):
+                postings = self._tag_index.get(tag)
+                if postings is None:
+                    if self._tags_pending:
+                        continue
+                    postings = self._tag_index[tag] = array("I")
+                postings.append(position)
+            if self._text is not None:
+                self._text.add(trace, position)
+            if self._vectors is not None:
+                self._vectors.add(trace, position)
+        for view in self._views:
+            if any(tag in trace.tags for tag in view.tags):
+                if view._lines and moment < view._lines[-1][0]:
+                    self._seed(view)
+                else:
+                    view._lines.append((moment, trace.summarise()))
+        if self.retention is not None:
+            self._hot_bytes += self._sizes[position]
+            self.enforce_retention()
+
+    def enforce_retention(self, now: datetime | None = None) -> int:
+        """Evict the traces beyond the retention policy; return how many went.
+
+        Called after every store. Age limits are measured against ``now``
+        (default: the current UTC time), so idle memories may also be trimmed
+        by calling this periodically.
+        """
+        policy = self.retention
+        if policy is None:
+            return 0
+        with self._lock:
+            count = 0
+            held = len(self._timeline)
+            if policy.max_traces is not None and held > policy.max_traces:
+                count = held - int(policy.max_traces * policy.low_water)
+            if policy.max_bytes is not None and self._hot_bytes > policy.max_bytes:
+                target = self._hot_bytes - int(policy.max_bytes * policy.low_water)
+                count = max(count, self._sizes_prefix(target))
+            if policy.max_age is not None and held:
+                cutoff = _epoch_micros((now or datetime.utcnow()) - policy.max_age)
+                if self._timeline[0] < cutoff:
+                    count = max(count, bisect_left(self._timeline, cutoff))
+            if count:
+                self._evict(min(count, held))
+            return count
+
+    def _sizes_prefix(self, target: int) -> int:
+        """Smallest number of oldest traces whose sizes add up to ``target``."""
+        freed = 0
+        for count, size in enumerate(self._sizes, 1):
+            freed += size
+            if freed >= target:
+                return count
+        return len(self._sizes)
+
+    def _evict(self, count: int) -> None:
+        """Hand the ``count`` oldest traces to the cold tier and forget them."""
+        if self.cold is not None:
+            self.cold.absorb(
+                [
+                    MemoryTrace(title=t.title, content=t.content, tags=tuple(t.tags), created_at=t.created_at)
+                    for t in self.traces[:count]
+                ]
+            )
+        newest_evicted = self._timeline[count - 1]
+        del self.traces[:count]
+        del self._timeline[:count]
+        if self._text is not None:
+            self._text.evict(count)
+        if self._vectors is not None:
+            self._vectors.evict(count)
+        self._hot_bytes -= sum(self._sizes[:count])
+        del self._sizes[:count]
+        for tag in list(self._tag_index):
+            postings = self._tag_index[tag]
+            first = bisect_left(postings, count)
+            if first == len(postings):
+                del self._tag_index[tag]
+            else:
+                self._tag_index[tag] = array("I", [position - count for position in postings[first:]])
+        for view in self._views:
+            # Views showing an evicted trace are refilled from what remains.
+            if view._lines and view._lines[0][0] <= newest_evicted:
+                self._seed(view)
+
+    def recall(
+        self,
+        tag: str | None = None,
+        limit: int = 5,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[MemoryTrace]:
+        """Retrieve the most recent traces filtered by tag and time range.
+
+        ``since`` is inclusive and ``until`` exclusive; either may be omitted.
+        """
+        with self._lock:
+            self._drain()
+            lo, hi = self._span(since, until)
+            if tag is None:
+                return list(self.traces[max(lo, hi - limit):hi])
+            postings = self._postings(tag)
+            if not postings:
+                return []
+            first, last = bisect_left(postings, lo), bisect_left(postings, hi)
+            return [self.traces[position] for position in postings[max(first, last - limit):last]]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        tags: Iterable[str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[MemoryTrace]:
+        """Return the traces best matching ``query``, ranked by BM25.
+
+        Matching ignores case and accents. ``tags`` keeps only traces carrying
+        at least one of them; ``since``/``until`` bound the time window as in
+        :meth:`recall`.
+        """
+        with self._lock:
+            self._drain()
+            if self._text is None:
+                from .search import TextIndex
+
+                self._text = TextIndex()
+                for position, trace in enumerate(self.traces):
+                    self._text.add(trace, position)
+            lo, hi = self._span(since, until)
+            allowed = None if tags is None else set(self._positions(tags, lo, hi))
+            positions = self._text.search(query, limit, lo, hi, allowed)
+            return [self.traces[position] for position in positions]
+
+    def recall_similar(
+        self,
+        text: str,
+        k: int = 5,
+        tags: Iterable[str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[MemoryTrace]:
+        """Return the ``k`` traces whose embeddings are closest to ``text``.
+
+        Most similar first; ``tags``, ``since`` and ``until`` filter as in
+        :meth:`search`.
+        """
+        with self._lock:
+            self._drain()
+            if self._vectors is None:
+                from .embedding import EmbeddingIndex, HashingEmbedder, _normalise
+
+                self.embedder = self.embedder or HashingEmbedder()
+                vectors = EmbeddingIndex(self.embedder)
+                for start in range(0, len(self.traces), 1024):
+                    batch = [vectors.text_of(trace) for trace in self.traces[start:start + 1024]]
+                    vectors.extend(_normalise(self.embedder.embed(batch)), start)
+                self._vectors = vectors
+            lo, hi = self._span(since, until)
+            allowed = None if tags is None else set(self._positions(tags, lo, hi))
+            positions = self._vectors.search([text], k, lo, hi, allowed)[0]
+            return [self.traces[position] for position in positions]
+
+    def weave_story(
+        self,
+        tags: Iterable[str],
+        last: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> str:
+        """Produce a reflective narrative using selected tags.
+
+        ``last`` keeps only the most recent lines; ``since``/``until`` bound
+        the time window as in :meth:`recall`.
+        """
+        matching = list(self.iter_story(tags, last=last, since=since, until=until))
         if not matching:
-            return "Sem lembranças relevantes ainda — um convite a aprender."
+            return _EMPTY_STORY
         return "\n".join(matching)
+
+    def iter_story(
+        self,
+        tags: Iterable[str],
+        last: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[str]:
+        """Yield the summaries of :meth:`weave_story` lazily, oldest first."""
+        with self._lock:
+            self._drain()
+            lo, hi = self._span(since, until)
+            matching = [self.traces[position] for position in self._positions(tags, lo, hi, last)]
+        for trace in matching:
+            yield trace.summarise()
+
+    def dated_story(
+        self,
+        tags: Iterable[str],
+        last: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[tuple[int, str]]:
+        """Return :meth:`weave_story`'s lines as ``(epoch µs, summary)`` pairs.
+
+        The moments let stories exported by several memories be merged
+        chronologically, as :class:`~orion_nova.sharding.ShardedOrionNova` does.
+        """
+        with self._lock:
+            self._drain()
+            lo, hi = self._span(since, until)
+            matching = [(self._timeline[p], self.traces[p]) for p in self._positions(tags, lo, hi, last)]
+        return [(moment, trace.summarise()) for moment, trace in matching]
+
+    def story_pages(
+        self,
+        tags: Iterable[str],
+        page_size: int = 20,
+        last: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[str]:
+        """Yield the narrative in pages of at most ``page_size`` lines."""
+        lines = self.iter_story(tags, last=last, since=since, until=until)
+        while page := list(islice(lines, page_size)):
+            yield "\n".join(page)
+
+    def reflection_view(self, tags: Iterable[str], window: int = 20) -> ReflectionView:
+        """Return a live view over the latest ``window`` summaries for ``tags``."""
+        view = ReflectionView(tags=tuple(tags), window=window)
+        with self._lock:
+            self._drain()
+            self._seed(view)
+            self._views.add(view)
+        return view
+
+    def _seed(self, view: ReflectionView) -> None:
+        """(Re)fill a reflection view from the indexes."""
+        view._lines.clear()
+        for position in self._positions(view.tags, last=view.window):
+            view._lines.append((self._timeline[position], self.traces[position].summarise()))
+
+    def _span(self, since: datetime | None, until: datetime | None) -> tuple[int, int]:
+        """Translate a time window into a half-open range of positions."""
+        lo = 0 if since is None else bisect_left(self._timeline, _epoch_micros(since))
+        hi = len(self._timeline) if until is None else bisect_left(self._timeline, _epoch_micros(until))
+        return lo, max(lo, hi)
+
+    def _positions(
+        self,
+        tags: Iterable[str],
+        lo: int = 0,
+        hi: int | None = None,
+        last: int | None = None,
+    ) -> list[int]:
+        """Merge the postings of several tags into one ordered, unique list.
+
+        Only positions in ``[lo, hi)`` are considered and, with ``last``, only
+        the final ``last`` of them, so the cost follows the size of the result.
+        """
+        hi = len(self._timeline) if hi is None else hi
+        postings = []
+        for tag in dict.fromkeys(tags):
+            tag_postings = self._postings(tag)
+            if not tag_postings:
+                continue
+            first, stop = bisect_left(tag_postings, lo), bisect_left(tag_postings, hi)
+            if last is not None:
+                first = max(first, stop - last)
+            postings.append(tag_postings[first:stop])
+        if len(postings) == 1:
+            return list(postings[0])
+        positions: list[int] = []
+        for position in merge(*postings):
+            if not positions or positions[-1] != position:
+                positions.append(position)
+        return positions if last is None else positions[-last:]
+
+    def _postings(self, tag: str) -> array | None:
+        """Sorted positions of the traces tagged ``tag``.
+
+        For a reopened journal, a tag's postings are read from the journal's
+        tag ids the first time it is queried and maintained from then on.
+        """
+        postings = self._tag_index.get(tag)
+        if postings is None and self._tags_pending:
+            postings = self._tag_index[tag] = self.traces.postings(tag)  # type: ignore[attr-defined]
+        return postings
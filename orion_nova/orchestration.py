@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+import itertools
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence, Tuple, Union
 
 from .action import ActionBody, ActionOutcome
 from .artistry import ArtisticVoice, ArtisticWork
 from .ethics import EthicalCore, EthicalDecision
 from .interface import SensoryInput, SomaInterface
-from .memory import MemoryTrace, SymbolicMemory
+from .memory import MemoryTrace, ReflectionView, SymbolicMemory
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from .blobs import BlobStore
+    from .tracing import CycleObserver, CycleTimer
+
+# The word a chunk ends in, which the next chunk may still extend.
+_TRAILING_WORD = re.compile(r"\w*\Z")
 
 
 @dataclass
@@ -21,50 +34,406 @@ class ConsciousCycleResult:
     decision_narrative: str
     action_reference: str | None
     reflection: str
+    memory_trace: MemoryTrace | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    action_references: tuple[str, ...] = ()
+
+
+@dataclass
+class CycleRequest:
+    """One item of a batch submitted to :meth:`OrionNova.conscious_cycles`."""
+
+    audio_stream: Iterable[bytes]
+    intention: str
+    channel: str
+
+
+@dataclass
+class CycleFailure:
+    """Placeholder returned for a batch item whose cycle raised."""
+
+    request: CycleRequest
+    error: Exception
+
+
+BatchItem = Union[CycleRequest, Tuple[Iterable[bytes], str, str]]
+
+
+@dataclass
+class SpeculationStats:
+    """Counters describing how speculative composition pays off.
+
+    ``hits`` are allowed cycles that published the speculative work and
+    ``overlap_ms`` the generation time they did not wait for; ``misses`` are
+    blocked cycles whose work was thrown away, ``cancelled`` of them before
+    generation began, the others costing ``wasted_ms`` of generation.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    cancelled: int = 0
+    overlap_ms: float = 0.0
+    wasted_ms: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 
 @dataclass
 class OrionNova:
-    """High-level façade for operating the Orion Nova organism."""
+    """High-level façade for operating the Orion Nova organism.
+
+    ``reflection_window`` bounds how many recent reflections each cycle
+    returns; ``None`` weaves the whole history as before. ``observer``
+    receives a span per stage (see :mod:`orion_nova.tracing`); each result's
+    ``timings`` holds the per-stage breakdown in milliseconds regardless.
+    With ``related_recall`` above zero, interpretations also cite that many
+    similar past experiences found by ``memory.recall_similar`` (needs NumPy).
+
+    With ``speculate`` the work is composed on a background thread from the
+    start of the cycle, overlapping listening, interpretation and ethics. It
+    is published only if the decision allows it and is otherwise discarded;
+    ``speculation`` keeps the tally.
+
+    With a ``blobs`` store, memory traces cite curated prompts by ``blob:``
+    reference instead of repeating them in full.
+
+    ``modalities`` lists the renditions made of each allowed intention. With
+    more than one they are generated concurrently and each is published as
+    soon as it is ready; ``action_reference`` is then the first publication
+    and ``action_references`` holds them all, in completion order. If some
+    rendition fails to compose or publish, the others still go out, are logged
+    to memory, and the first error is raised afterwards. Speculation only
+    applies to the single-modality case.
+    """
 
     interface: SomaInterface
     ethics: EthicalCore
     memory: SymbolicMemory
     artistry: ArtisticVoice
     action_body: ActionBody
+    reflection_window: int | None = 20
+    observer: CycleObserver | None = None
+    related_recall: int = 0
+    speculate: bool = False
+    speculation: SpeculationStats = field(default_factory=SpeculationStats)
+    blobs: BlobStore | None = None
+    modalities: tuple[str, ...] = ("text",)
+    _reflection: ReflectionView | None = field(default=None, init=False, repr=False)
+    _reflection_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _cycle_ids: Iterator[int] = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _speculator: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
 
     def conscious_cycle(self, audio_stream: Iterable[bytes], intention: str, channel: str) -> ConsciousCycleResult:
         """Perform a full cycle while documenting each step."""
 
-        sensory = self.interface.listen(audio_stream)
+        timer = self._timer()
+        speculative = self._speculate(intention)
+        try:
+            started = timer.start("listen")
+            sensory = self.interface.listen(audio_stream)
+            timer.stop("listen", started, len(sensory.raw_text))
+            interpretation, decision = self._deliberate(sensory, intention, timer)
+        except BaseException:
+            self._discard(speculative)
+            raise
+        return self._act_and_reflect(sensory, interpretation, decision, intention, channel, timer, speculative)
+
+    def streaming_cycle(self, audio_stream: Iterable[bytes], intention: str, channel: str) -> ConsciousCycleResult:
+        """Perform a cycle while the input is still arriving.
+
+        Each chunk is interpreted and weighed by the ethics core as soon as it
+        is transcribed, so a blocking decision is reached without waiting for
+        the rest of the stream; that decision is final. Otherwise the final
+        decision is taken once on the complete interpretation, exactly as
+        :meth:`conscious_cycle` does.
+        """
+
+        timer = self._timer()
+        speculative = self._speculate(intention)
+        try:
+            sensory, interpretation, decision = self._deliberate_stream(audio_stream, intention, timer)
+        except BaseException:
+            self._discard(speculative)
+            raise
+        return self._act_and_reflect(sensory, interpretation, decision, intention, channel, timer, speculative)
+
+    def _timer(self) -> CycleTimer:
+        """Stopwatch for a new cycle, numbered for its stage spans."""
+        from .tracing import CycleTimer
+
+        return CycleTimer(self.observer, next(self._cycle_ids))
+
+    def _deliberate_stream(
+        self,
+        audio_stream: Iterable[bytes],
+        intention: str,
+        timer: CycleTimer,
+    ) -> tuple[SensoryInput, str, EthicalDecision]:
+        """Listen, interpret and decide chunk by chunk for :meth:`streaming_cycle`.
+
+        Each chunk re-judges the text heard so far, up to its last non-word
+        character: a forbidden word still open at the chunk boundary (say
+        "mentir" before an "a" arrives) may yet grow into an innocent one, so
+        only matches ending before it block early. Those hold whatever follows,
+        which keeps the decision independent of where the stream is split.
+        """
+        partials: list[SensoryInput] = []
+        heard = settled = judged = 0
+        chunks = iter(self.listen_stream(audio_stream))
+        while True:
+            started = timer.start("listen")
+            partial = next(chunks, None)
+            timer.stop("listen", started, 0 if partial is None else len(partial.raw_text))
+            if partial is None:
+                break
+            partials.append(partial)
+            boundary = _TRAILING_WORD.search(partial.raw_text).start()
+            if boundary:
+                settled = heard + boundary
+            heard += len(partial.raw_text)
+            if settled == judged:
+                continue
+            judged = settled
+            text = "".join(piece.raw_text for piece in partials)
+            started = timer.start("ethics")
+            early_interpretation = self._interpret(replace(partial, raw_text=text[:settled]), intention, echoes=False)
+            early = self.ethics.evaluate(intention=intention, proposed_actions=[early_interpretation])
+            timer.stop("ethics", started, len(early.narrative))
+            if not early.allowed:
+                return replace(partials[0], raw_text=text), early_interpretation, early
+        if not partials:
+            raise ValueError("O fluxo de entrada está vazio; nada a escutar.")
+        sensory = replace(partials[0], raw_text="".join(partial.raw_text for partial in partials))
+        return (sensory, *self._deliberate(sensory, intention, timer))
+
+    def _deliberate(self, sensory: SensoryInput, intention: str, timer: CycleTimer) -> tuple[str, EthicalDecision]:
+        """Interpret ``sensory`` and weigh the interpretation against the codex."""
+        started = timer.start("interpret")
         interpretation = self._interpret(sensory, intention)
+        timer.stop("interpret", started, len(interpretation))
+        started = timer.start("ethics")
         decision = self.ethics.evaluate(intention=intention, proposed_actions=[interpretation])
+        timer.stop("ethics", started, len(decision.narrative))
+        return interpretation, decision
+
+    def listen_stream(self, audio_stream: Iterable[bytes]) -> Iterator[SensoryInput]:
+        """Transcribe ``audio_stream`` chunk by chunk, yielding each partial input."""
+        for chunk in audio_stream:
+            yield self.interface.listen((chunk,))
+
+    def _act_and_reflect(
+        self,
+        sensory: SensoryInput,
+        interpretation: str,
+        decision: EthicalDecision,
+        intention: str,
+        channel: str,
+        timer: CycleTimer,
+        speculative: Future[tuple[ArtisticWork, float]] | None = None,
+    ) -> ConsciousCycleResult:
+        """Create, publish and remember once a decision has been reached."""
 
-        action_reference: str | None = None
-        if decision.allowed:
-            artwork = self.artistry.compose(intention=intention)
+        artwork: ArtisticWork | None = None
+        outcome: ActionOutcome | None = None
+        published: list[tuple[ArtisticWork, ActionOutcome]] = []
+        if not decision.allowed:
+            self._discard(speculative)
+        elif len(self.modalities) > 1:
+            failure = self._publish_renditions(intention, channel, timer, published)
+            artwork, outcome = self._first_rendition(sensory, interpretation, decision, published, failure)
+        else:
+            started = timer.start("compose")
+            if speculative is None:
+                artwork = self.artistry.compose(intention=intention)
+            else:
+                artwork, spent_ms = speculative.result()
+                self._count_hit(spent_ms, started)
+            timer.stop("compose", started, len(artwork.payload))
+            started = timer.start("perform")
             outcome = self.action_body.perform(
                 channel=channel,
                 work=artwork.payload,
                 description=artwork.description,
             )
-            action_reference = outcome.reference
-            self._log_memory(sensory, interpretation, decision, artwork, outcome)
-        else:
-            self._log_memory(sensory, interpretation, decision, None, None)
+            timer.stop("perform", started, len(artwork.payload))
+        return self._conclude(sensory, interpretation, decision, timer, artwork, outcome, published)
+
+    def _first_rendition(
+        self,
+        sensory: SensoryInput,
+        interpretation: str,
+        decision: EthicalDecision,
+        published: list[tuple[ArtisticWork, ActionOutcome]],
+        failure: BaseException | None,
+    ) -> tuple[ArtisticWork, ActionOutcome]:
+        """The first published rendition; after a failure, log what went out and raise."""
+        if failure is not None:
+            # Keep a record of what did reach the channel before reporting.
+            if published:
+                self._log_memory(sensory, interpretation, decision, *published[0], published[1:])
+            raise failure
+        return published[0]
 
-        reflection = self.memory.weave_story(tags=("reflexão",))
+    def _conclude(
+        self,
+        sensory: SensoryInput,
+        interpretation: str,
+        decision: EthicalDecision,
+        timer: CycleTimer,
+        artwork: ArtisticWork | None,
+        outcome: ActionOutcome | None,
+        published: Sequence[tuple[ArtisticWork, ActionOutcome]] = (),
+    ) -> ConsciousCycleResult:
+        """Remember the cycle, reflect on it and assemble its result."""
+        action_reference = None if outcome is None else outcome.reference
+        started = timer.start("log_memory")
+        trace = self._log_memory(sensory, interpretation, decision, artwork, outcome, published[1:])
+        timer.stop("log_memory", started, len(trace.content))
+
+        started = timer.start("reflect")
+        reflection = self._reflect()
+        timer.stop("reflect", started, len(reflection))
         return ConsciousCycleResult(
             sensory_input=sensory,
             interpretation=interpretation,
             decision_narrative=decision.narrative,
             action_reference=action_reference,
             reflection=reflection,
+            memory_trace=trace,
+            timings=timer.timings,
+            action_references=tuple(done.reference for _, done in published) or tuple(filter(None, [action_reference])),
         )
 
-    def _interpret(self, sensory: SensoryInput, intention: str) -> str:
+    def _publish_renditions(
+        self,
+        intention: str,
+        channel: str,
+        timer: CycleTimer,
+        published: list[tuple[ArtisticWork, ActionOutcome]],
+    ) -> Exception | None:
+        """Compose every modality and publish each work as it is ready.
+
+        Successful publications are appended to ``published``; a work that
+        fails to compose or publish does not stop the others, and the first
+        such error is returned.
+        """
+        failure: Exception | None = None
+        works = self.artistry.compose_many(intention, self.modalities)
+        while True:
+            started = timer.start("compose")
+            try:
+                work = next(works, None)
+            except Exception as error:  # noqa: BLE001 - raised by compose_many after the other works
+                failure, work = failure or error, None
+            timer.stop("compose", started, 0 if work is None else len(work.payload))
+            if work is None:
+                return failure
+            started = timer.start("perform")
+            try:
+                outcome = self.action_body.perform(channel=channel, work=work.payload, description=work.description)
+            except Exception as error:  # noqa: BLE001 - reported once the other works are out
+                failure = failure or error
+            else:
+                published.append((work, outcome))
+            timer.stop("perform", started, len(work.payload))
+
+    def conscious_cycles(
+        self,
+        batch: Iterable[BatchItem],
+        max_workers: int | None = None,
+    ) -> list[ConsciousCycleResult | CycleFailure]:
+        """Run many cycles concurrently on a thread pool.
+
+        Transcription, generation and publishing overlap across items; results
+        come back in input order, and an item that raises yields a
+        :class:`CycleFailure` instead of aborting the batch.
+        """
+
+        requests = [item if isinstance(item, CycleRequest) else CycleRequest(*item) for item in batch]
+        if not requests:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="orion-cycle") as pool:
+            return list(pool.map(self._attempt_cycle, requests))
+
+    def _attempt_cycle(self, request: CycleRequest) -> ConsciousCycleResult | CycleFailure:
+        try:
+            return self.conscious_cycle(
+                audio_stream=request.audio_stream,
+                intention=request.intention,
+                channel=request.channel,
+            )
+        except Exception as error:  # noqa: BLE001 - surfaced to the caller per item
+            return CycleFailure(request=request, error=error)
+
+    def _speculate(self, intention: str) -> Future[tuple[ArtisticWork, float]] | None:
+        """Start composing for ``intention`` ahead of the decision, if enabled."""
+        if not self.speculate or len(self.modalities) > 1:
+            return None
+        if self._speculator is None:
+            with self.speculation._lock:
+                if self._speculator is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._speculator = ThreadPoolExecutor(thread_name_prefix="orion-speculate")
+        return self._speculator.submit(self._timed_compose, intention)
+
+    def _timed_compose(self, intention: str) -> tuple[ArtisticWork, float]:
+        started = time.perf_counter_ns()
+        artwork = self.artistry.compose(intention=intention)
+        return artwork, (time.perf_counter_ns() - started) / 1e6
+
+    def _discard(self, speculative: Future[tuple[ArtisticWork, float]] | None) -> None:
+        """Drop speculative work that must not be published, counting the waste."""
+        if speculative is None:
+            return
+        cancelled = speculative.cancel()
+        self._count_miss(cancelled)
+        if not cancelled:
+            speculative.add_done_callback(self._count_waste)
+
+    def _count_hit(self, spent_ms: float, started_ns: int) -> None:
+        """Tally a published speculative work that took ``spent_ms`` to compose."""
+        waited_ms = (time.perf_counter_ns() - started_ns) / 1e6
+        with self.speculation._lock:
+            self.speculation.hits += 1
+            self.speculation.overlap_ms += max(0.0, spent_ms - waited_ms)
+
+    def _count_miss(self, cancelled: bool) -> None:
+        with self.speculation._lock:
+            self.speculation.misses += 1
+            self.speculation.cancelled += cancelled
+
+    def _count_waste(self, speculative: Future[tuple[ArtisticWork, float]]) -> None:
+        if speculative.exception() is None:
+            with self.speculation._lock:
+                self.speculation.wasted_ms += speculative.result()[1]
+
+    def _reflect(self) -> str:
+        """Render the latest reflections from an incrementally kept view."""
+        if self.reflection_window is None:
+            return self.memory.weave_story(tags=("reflexão",))
+        if self._reflection is None:
+            with self._reflection_lock:
+                if self._reflection is None:
+                    self._reflection = self.memory.reflection_view(("reflexão",), window=self.reflection_window)
+        self.memory.flush()
+        return self._reflection.render()
+
+    def _interpret(self, sensory: SensoryInput, intention: str, echoes: bool = True) -> str:
         """Simplistic interpretation combining sensory input with intention."""
-        return f"Responder à intenção '{intention}' com base no texto: {sensory.raw_text}"
+        interpretation = f"Responder à intenção '{intention}' com base no texto: {sensory.raw_text}"
+        if echoes and self.related_recall > 0:
+            related = self.memory.recall_similar(sensory.raw_text, k=self.related_recall)
+            if related:
+                echoes = " | ".join(trace.content.split("\n", 1)[0] for trace in related)
+                interpretation += f" (ecos de experiências afins: {echoes})"
+        return interpretation
 
     def _log_memory(
         self,
@@ -73,8 +442,12 @@ class OrionNova:
         decision: EthicalDecision,
         artwork: ArtisticWork | None,
         outcome: ActionOutcome | None,
-    ) -> None:
-        """Persist an experience to symbolic memory for later reflection."""
+        more: Sequence[tuple[ArtisticWork, ActionOutcome]] = (),
+    ) -> MemoryTrace:
+        """Persist an experience to symbolic memory for later reflection.
+
+        ``more`` lists further renditions published in the same cycle.
+        """
 
         tags = ["reflexão", sensory.language]
         if not decision.allowed:
@@ -85,15 +458,17 @@ class OrionNova:
             f"Interpretação: {interpretation}",
             f"Ética: {decision.narrative}",
         ]
-        if artwork:
-            description_lines.append(f"Obra criada: {artwork.description}")
-        if outcome:
-            description_lines.append(f"Ação publicada em {outcome.channel} com referência {outcome.reference}")
-
-        self.memory.store(
-            MemoryTrace(
-                title=title,
-                content="\n".join(description_lines),
-                tags=tuple(tags),
-            )
+        for work, done in [(artwork, outcome), *more]:
+            if work:
+                description = work.description if self.blobs is None else self.blobs.put(work.description)
+                description_lines.append(f"Obra criada: {description}")
+            if done:
+                description_lines.append(f"Ação publicada em {done.channel} com referência {done.reference}")
+
+        trace = MemoryTrace(
+            title=title,
+            content="\n".join(description_lines),
+            tags=tuple(tags),
         )
+        self.memory.store(trace)
+        return trace
@@ -0,0 +1,165 @@
+"""Buffered, per-channel ordered publishing for the action layer."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Sequence, Tuple
+
+from .action import Publisher
+
+_Item = Tuple[memoryview, Dict[str, str], "Future[str]"]
+
+
+@dataclass
+class _ChannelLane:
+    """Pending payloads of one channel and the thread that drains them."""
+
+    items: Deque[_Item] = field(default_factory=deque)
+    ready: threading.Condition = field(default_factory=threading.Condition)
+    worker: threading.Thread | None = None
+
+
+@dataclass
+class PublishPipeline:
+    """Coalesce publications per channel into batches.
+
+    Each channel gets one worker thread, so its payloads are published in
+    submission order. A batch is flushed once ``max_batch`` payloads are
+    waiting or ``max_delay`` seconds after its first payload arrived. Failed
+    batches are retried ``retries`` times with exponential backoff starting at
+    ``backoff`` seconds; after that every future in the batch carries the
+    error. Publishers exposing ``publish_many`` get the whole batch as
+    ``memoryview`` slices and must return one reference per payload, or the
+    batch fails; others receive one ``publish`` call per payload.
+    """
+
+    publisher: Publisher
+    max_batch: int = 32
+    max_delay: float = 0.01
+    retries: int = 3
+    backoff: float = 0.05
+    _lanes: Dict[str, _ChannelLane] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def submit(self, channel: str, payload: memoryview, metadata: dict[str, str]) -> Future[str]:
+        """Queue ``payload`` for ``channel``; the future resolves to its reference."""
+
+        acknowledgement: Future[str] = Future()
+        lane = self._lane(channel)
+        with lane.ready:
+            if self._closed:
+                raise RuntimeError("PublishPipeline is closed")
+            lane.items.append((payload, metadata, acknowledgement))
+            lane.ready.notify()
+        return acknowledgement
+
+    def close(self) -> None:
+        """Flush every channel and stop the worker threads."""
+        with self._lock:
+            self._closed = True
+            lanes = list(self._lanes.values())
+        for lane in lanes:
+            with lane.ready:
+                lane.ready.notify()
+        for lane in lanes:
+            if lane.worker is not None:
+                lane.worker.join()
+
+    def __enter__(self) -> PublishPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _lane(self, channel: str) -> _ChannelLane:
+        with self._lock:
+            lane = self._lanes.get(channel)
+            if lane is None:
+                lane = self._lanes[channel] = _ChannelLane()
+                lane.worker = threading.Thread(
+                    target=self._drain,
+                    args=(channel, lane),
+                    name=f"orion-publish-{channel}",
+                    daemon=True,
+                )
+                lane.worker.start()
+            return lane
+
+    def _drain(self, channel: str, lane: _ChannelLane) -> None:
+        while True:
+            with lane.ready:
+                while not lane.items and not self._closed:
+                    lane.ready.wait()
+                if not lane.items:
+                    return
+                deadline = time.monotonic() + self.max_delay
+                while len(lane.items) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    lane.ready.wait(remaining)
+                batch = [lane.items.popleft() for _ in range(min(self.max_batch, len(lane.items)))]
+            self._flush(channel, batch)
+
+    def _flush(self, channel: str, batch: List[_Item]) -> None:
+        publish_many = getattr(self.publisher, "publish_many", None)
+        pending = batch
+        for attempt in range(self.retries + 1):
+            references: List[str] = []
+            try:
+                if publish_many is not None:
+                    references = list(
+                        publish_many(
+                            channel,
+                            [payload for payload, _, _ in pending],
+                            [metadata for _, metadata, _ in pending],
+                        )
+                    )
+                else:
+                    for payload, metadata, _ in pending:
+                        references.append(self.publisher.publish(channel, _payload_bytes(payload), metadata))
+            except Exception as error:  # noqa: BLE001 - retried, then handed to the futures
+                # Payloads published one by one before the failure are not sent again.
+                _settle(pending[:len(references)], references)
+                pending = pending[len(references):]
+                if attempt == self.retries:
+                    _settle(pending, error=error)
+                    return
+                time.sleep(self.backoff * 2**attempt)
+                continue
+            if len(references) != len(pending):
+                # The publisher may have taken part of the batch: fail it rather
+                # than guess which payloads the references belong to.
+                _settle(
+                    pending,
+                    error=RuntimeError(
+                        f"publish_many returned {len(references)} references for {len(pending)} payloads"
+                    ),
+                )
+                return
+            _settle(pending, references)
+            return
+
+
+def _payload_bytes(payload: memoryview) -> bytes:
+    """The bytes behind ``payload``, without copying when it spans a whole bytes object."""
+    source = payload.obj
+    if isinstance(source, bytes) and payload.nbytes == len(source):
+        return source
+    return payload.tobytes()
+
+
+def _settle(items: List[_Item], references: Sequence[str] = (), error: BaseException | None = None) -> None:
+    """Resolve the futures of ``items``; futures cancelled by their caller are skipped."""
+    for position, (_, _, acknowledgement) in enumerate(items):
+        if not acknowledgement.set_running_or_notify_cancel():
+            continue
+        if error is not None:
+            acknowledgement.set_exception(error)
+        else:
+            acknowledgement.set_result(references[position])
@@ -0,0 +1,113 @@
+"""Retention policies and cold tiers for long-running symbolic memory.
+
+A :class:`SymbolicMemory` given a :class:`RetentionPolicy` keeps a bounded hot
+tier: once a limit is exceeded, its oldest traces are evicted down to the
+policy's low-water mark and handed to an optional :class:`ColdTier`, either a
+:class:`JournalTier` on disk or an aggregating :class:`SummaryTier`.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, Protocol, Sequence, Tuple
+
+from .memory import _EPOCH, _MICROSECOND, MemoryTrace, _epoch_micros, _trace_size
+
+if TYPE_CHECKING:
+    from .journal import MemoryJournal
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits of the hot tier; ``None`` disables a limit.
+
+    ``max_bytes`` counts the characters of each trace's title, tags and
+    content. When a limit is exceeded, eviction continues until the hot tier is
+    back at ``low_water`` times that limit, so its cost is amortised over many
+    stores instead of being paid on each one.
+    """
+
+    max_traces: int | None = None
+    max_bytes: int | None = None
+    max_age: timedelta | None = None
+    low_water: float = 0.9
+
+    def __post_init__(self) -> None:
+        if not 0 < self.low_water <= 1:
+            raise ValueError("low_water must be in (0, 1]")
+
+
+class ColdTier(Protocol):
+    """Destination of the traces evicted from the hot tier, oldest first."""
+
+    def absorb(self, traces: Sequence[MemoryTrace]) -> None:
+        ...
+
+
+@dataclass
+class JournalTier:
+    """Cold tier appending evicted traces to a :class:`MemoryJournal`.
+
+    The archive can be browsed later with ``SymbolicMemory.open`` on the same
+    directory.
+    """
+
+    journal: MemoryJournal
+
+    def absorb(self, traces: Sequence[MemoryTrace]) -> None:
+        for trace in traces:
+            self.journal.append(trace)
+
+
+@dataclass
+class TagBucket:
+    """Aggregate of the evicted traces sharing one tag and time bucket."""
+
+    count: int = 0
+    chars: int = 0
+    first: int = 0
+    last: int = 0
+    last_title: str = ""
+
+
+@dataclass
+class SummaryTier:
+    """Cold tier keeping only per-tag counts over fixed time buckets.
+
+    Its footprint follows the number of distinct (tag, bucket) pairs, not the
+    number of evicted traces.
+    """
+
+    bucket: timedelta = timedelta(hours=1)
+    buckets: Dict[Tuple[str, int], TagBucket] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def absorb(self, traces: Sequence[MemoryTrace]) -> None:
+        width = self.bucket // _MICROSECOND
+        with self._lock:
+            for trace in traces:
+                moment = _epoch_micros(trace.created_at)
+                size = _trace_size(trace)
+                for tag in dict.fromkeys(trace.tags):
+                    aggregate = self.buckets.get((tag, moment // width))
+                    if aggregate is None:
+                        aggregate = self.buckets[(tag, moment // width)] = TagBucket(first=moment, last=moment)
+                    aggregate.count += 1
+                    aggregate.chars += size
+                    aggregate.first = min(aggregate.first, moment)
+                    if moment >= aggregate.last:
+                        aggregate.last, aggregate.last_title = moment, trace.title
+
+    def summarise(self, tag: str) -> list[str]:
+        """One line per bucket holding evicted traces tagged ``tag``, oldest first."""
+        width = self.bucket // _MICROSECOND
+        with self._lock:
+            keys = sorted(key for key in self.buckets if key[0] == tag)
+            aggregates = [(key[1], self.buckets[key]) for key in keys]
+        return [
+            f"{(_EPOCH + index * width * _MICROSECOND).isoformat()} [{tag}] — "
+            f"{aggregate.count} lembranças arquivadas, a última: {aggregate.last_title}"
+            for index, aggregate in aggregates
+        ]
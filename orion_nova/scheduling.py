@@ -0,0 +1,237 @@
+"""Admission control and fair scheduling of conscious cycles under load.
+
+:class:`CycleScheduler` sits in front of an :class:`OrionNova`. Each channel has
+its own bounded queue, and channels are served by weighted fair (stride)
+scheduling, so a noisy channel only consumes its share of the workers. A
+request may carry a deadline. Requests that can no longer meet it are shed
+before running and resolve to a :class:`CycleRejection` instead of a late
+result.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from .orchestration import ConsciousCycleResult, CycleRequest, OrionNova
+from .tracing import HistogramObserver, StageSpan
+
+
+@dataclass
+class CycleRejection:
+    """Fast answer for a request the scheduler declined to run.
+
+    ``reason`` is ``"queue_full"``, ``"deadline"`` or ``"closed"``.
+    """
+
+    request: CycleRequest
+    reason: str
+    waited_ms: float = 0.0
+
+
+ScheduledOutcome = Union[ConsciousCycleResult, CycleRejection]
+
+
+@dataclass
+class _Pending:
+    request: CycleRequest
+    future: Future
+    enqueued: float
+    deadline: float | None
+
+
+@dataclass
+class _Lane:
+    weight: float
+    queue: List[Tuple[int, int, _Pending]] = field(default_factory=list)
+    pass_value: float = 0.0
+    admitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    shed: int = 0
+
+
+@dataclass
+class CycleScheduler:
+    """Bounded per-channel queues drained by ``workers`` threads.
+
+    ``weights`` gives some channels a larger share (default ``1.0``); within a
+    channel, higher ``priority`` goes first, then arrival order. Cycle cost is
+    tracked as a moving average: a request is refused at admission when the
+    work queued ahead of it on its own channel, drained at the channel's
+    weighted share of the workers, would outlast its deadline, and shed at
+    dispatch when the remaining time is shorter than a typical cycle.
+    """
+
+    orion: OrionNova
+    workers: int = 4
+    queue_limit: int = 64
+    weights: Dict[str, float] = field(default_factory=dict)
+    waits: HistogramObserver = field(default_factory=HistogramObserver)
+    _lanes: Dict[str, _Lane] = field(default_factory=dict, init=False, repr=False)
+    _queued: int = field(default=0, init=False, repr=False)
+    _cycle_ms: float = field(default=0.0, init=False, repr=False)
+    _virtual: float = field(default=0.0, init=False, repr=False)
+    _sequence: Any = field(default_factory=itertools.count, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+    _ready: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    _threads: List[threading.Thread] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"orion-scheduler-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(
+        self,
+        audio_stream: Iterable[bytes],
+        intention: str,
+        channel: str,
+        deadline: float | None = None,
+        priority: int = 0,
+    ) -> Future[ScheduledOutcome]:
+        """Queue a cycle; ``deadline`` is in seconds from now.
+
+        The future always resolves, to the cycle result or to a rejection;
+        exceptions raised by the cycle itself are set on it as usual.
+        """
+        request = CycleRequest(list(audio_stream), intention, channel)
+        future: Future[ScheduledOutcome] = Future()
+        now = time.monotonic()
+        pending = _Pending(request, future, now, None if deadline is None else now + deadline)
+        with self._ready:
+            lane = self._lane(channel)
+            reason = None
+            if self._closed:
+                reason = "closed"
+            elif len(lane.queue) >= self.queue_limit:
+                reason = "queue_full"
+            elif deadline is not None and self._wait_ms(lane) > deadline * 1000:
+                reason = "deadline"
+            if reason is not None:
+                lane.rejected += reason == "queue_full"
+                lane.shed += reason == "deadline"
+                future.set_result(CycleRejection(request, reason))
+                return future
+            if not lane.queue:
+                # A channel returning from idle must not reclaim the turns it skipped.
+                lane.pass_value = max(lane.pass_value, self._virtual)
+            heapq.heappush(lane.queue, (-priority, next(self._sequence), pending))
+            lane.admitted += 1
+            self._queued += 1
+            self._ready.notify()
+        return future
+
+    def conscious_cycle(
+        self,
+        audio_stream: Iterable[bytes],
+        intention: str,
+        channel: str,
+        deadline: float | None = None,
+        priority: int = 0,
+    ) -> ScheduledOutcome:
+        """Submit a cycle and wait for its outcome."""
+        return self.submit(audio_stream, intention, channel, deadline, priority).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depths, counters and wait-time percentiles per channel."""
+        with self._ready:
+            channels = {
+                name: {
+                    "depth": len(lane.queue),
+                    "weight": lane.weight,
+                    "admitted": lane.admitted,
+                    "completed": lane.completed,
+                    "rejected": lane.rejected,
+                    "shed": lane.shed,
+                }
+                for name, lane in self._lanes.items()
+            }
+            queued, cycle_ms = self._queued, self._cycle_ms
+        waits = self.waits.summary()
+        for name, channel in channels.items():
+            channel["wait"] = waits.get(name, {})
+        return {"queued": queued, "cycle_ms": cycle_ms, "channels": channels}
+
+    def close(self) -> None:
+        """Stop the workers; requests still queued are rejected as ``closed``."""
+        with self._ready:
+            self._closed = True
+            leftovers = [pending for lane in self._lanes.values() for _, _, pending in lane.queue]
+            for lane in self._lanes.values():
+                lane.queue.clear()
+            self._queued = 0
+            self._ready.notify_all()
+        for pending in leftovers:
+            if pending.future.set_running_or_notify_cancel():
+                pending.future.set_result(CycleRejection(pending.request, "closed"))
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> CycleScheduler:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _lane(self, channel: str) -> _Lane:
+        lane = self._lanes.get(channel)
+        if lane is None:
+            lane = self._lanes[channel] = _Lane(weight=self.weights.get(channel, 1.0))
+        return lane
+
+    def _wait_ms(self, lane: _Lane) -> float:
+        """Expected time before a request newly queued on ``lane`` would finish.
+
+        The lane drains at its weighted share of the workers among the
+        channels with queued work, so other channels' backlogs only count
+        through the share they take, never through their depth.
+        """
+        competing = sum(other.weight for other in self._lanes.values() if other.queue or other is lane)
+        share = self.workers * lane.weight / competing
+        return (int(len(lane.queue) / share) + 1) * self._cycle_ms
+
+    def _next(self) -> _Pending | None:
+        """Pop the head of the lane with the smallest pass value (stride scheduling)."""
+        with self._ready:
+            while not self._queued and not self._closed:
+                self._ready.wait()
+            if self._closed:
+                return None
+            lane = min((lane for lane in self._lanes.values() if lane.queue), key=lambda lane: lane.pass_value)
+            self._virtual = lane.pass_value
+            lane.pass_value += 1.0 / lane.weight
+            self._queued -= 1
+            return heapq.heappop(lane.queue)[2]
+
+    def _work(self) -> None:
+        while (pending := self._next()) is not None:
+            request = pending.request
+            started = time.monotonic()
+            waited_ms = (started - pending.enqueued) * 1000
+            self.waits.on_stop(
+                StageSpan(request.channel, int(pending.enqueued * 1e9), int(waited_ms * 1e6), 0)
+            )
+            if not pending.future.set_running_or_notify_cancel():
+                continue
+            if pending.deadline is not None and started + self._cycle_ms / 1000 > pending.deadline:
+                with self._ready:
+                    self._lanes[request.channel].shed += 1
+                pending.future.set_result(CycleRejection(request, "deadline", waited_ms))
+                continue
+            try:
+                result = self.orion.conscious_cycle(request.audio_stream, request.intention, request.channel)
+            except BaseException as error:  # noqa: BLE001 - handed to the waiting caller
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(result)
+            spent_ms = (time.monotonic() - started) * 1000
+            with self._ready:
+                self._lanes[request.channel].completed += 1
+                self._cycle_ms = spent_ms if not self._cycle_ms else 0.8 * self._cycle_ms + 0.2 * spent_ms
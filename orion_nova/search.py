@@ -0,0 +1,180 @@
+"""Ranked full-text search over the traces of a symbolic memory.
+
+:class:`TextIndex` is an inverted index from accent-folded terms of a trace's
+title and content to the traces containing them, scored with BM25. It is kept
+in step with :class:`~orion_nova.memory.SymbolicMemory` by ``store`` and by
+retention evictions; see :meth:`SymbolicMemory.search`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Dict, List, Set, Tuple
+
+from .memory import MemoryTrace
+
+_WORD = re.compile(r"\w+")
+_COMBINING = re.compile(r"[\u0300-\u036f]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into case- and accent-folded words ("Ação" -> "acao")."""
+    folded = _COMBINING.sub("", unicodedata.normalize("NFKD", text.casefold()))
+    return _WORD.findall(folded)
+
+
+class TextIndex:
+    """BM25-scored inverted index, addressed by chronological position.
+
+    Documents get increasing ids as they are added. ``_docs`` maps each
+    position of the memory to its document id and moves exactly like the
+    memory's timeline; ``_where`` is the inverse, offset by ``_shift`` so that
+    evicting the oldest documents does not rewrite it. A late insertion only
+    marks the inverse stale; it is rebuilt on the next query.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._lengths = array("I")
+        self._docs = array("q")
+        self._where = array("q")
+        self._base = 0
+        self._shift = 0
+        self._stale = False
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, trace: MemoryTrace, position: int) -> None:
+        """Index ``trace``, stored by the memory at ``position``."""
+        doc = self._base + len(self._lengths)
+        counts = Counter(tokenize(trace.title))
+        counts.update(tokenize(trace.content))
+        for term, frequency in counts.items():
+            entry = self._postings.get(term)
+            if entry is None:
+                entry = self._postings[term] = (array("I"), array("I"))
+            entry[0].append(doc)
+            entry[1].append(frequency)
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+        if position == len(self._docs):
+            self._docs.append(doc)
+            self._where.append(position + self._shift)
+        else:
+            self._docs.insert(position, doc)
+            self._where.append(-1)
+            self._stale = True
+
+    def evict(self, count: int) -> None:
+        """Forget the documents at the ``count`` oldest positions."""
+        dead = set(self._docs[:count])
+        del self._docs[:count]
+        self._shift += count
+        base = self._base
+        self._total_length -= sum(self._lengths[doc - base] for doc in dead)
+        for term in list(self._postings):
+            ids, frequencies = self._postings[term]
+            kept = [i for i, doc in enumerate(ids) if doc not in dead]
+            if not kept:
+                del self._postings[term]
+            elif len(kept) < len(ids):
+                self._postings[term] = (array("I", [ids[i] for i in kept]), array("I", [frequencies[i] for i in kept]))
+        first = min(self._docs, default=base + len(self._lengths))
+        del self._lengths[:first - base]
+        del self._where[:first - base]
+        self._base = first
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        lo: int = 0,
+        hi: int | None = None,
+        allowed: Set[int] | None = None,
+    ) -> List[int]:
+        """Positions of the ``limit`` best matches for ``query``, best first.
+
+        Only positions in ``[lo, hi)`` and, if given, in ``allowed`` qualify.
+        """
+        if limit <= 0 or not self._docs:
+            return []
+        if self._stale:
+            self._reindex()
+        count = len(self._docs)
+        hi = count if hi is None else hi
+        average = self._total_length / count or 1.0
+        k1, b, base, shift, lengths, where = self.k1, self.b, self._base, self._shift, self._lengths, self._where
+
+        def qualifies(doc: int) -> bool:
+            position = where[doc - base] - shift
+            return lo <= position < hi and (allowed is None or position in allowed)
+
+        # Rarest terms first: once the best a doc could still gain from the
+        # remaining (common) terms cannot reach the current top ``limit``,
+        # those terms are only looked up for the candidates already found.
+        terms = []
+        for term in dict.fromkeys(tokenize(query)):
+            entry = self._postings.get(term)
+            if entry is not None:
+                idf = math.log(1 + (count - len(entry[0]) + 0.5) / (len(entry[0]) + 0.5))
+                terms.append((idf, entry))
+        terms.sort(key=lambda item: item[0], reverse=True)
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + terms[i][0] * (k1 + 1)
+
+        scores: Dict[int, float] = {}
+        for i, (idf, (ids, frequencies)) in enumerate(terms):
+            if i and len(scores) >= limit:
+                threshold = self._threshold(scores, limit, qualifies)
+                if threshold is not None and remaining[i] < threshold:
+                    candidates = [
+                        doc for doc, score in scores.items() if score + remaining[i] >= threshold and qualifies(doc)
+                    ]
+                    for later_idf, (later_ids, later_frequencies) in terms[i:]:
+                        for doc in candidates:
+                            k = bisect_left(later_ids, doc)
+                            if k < len(later_ids) and later_ids[k] == doc:
+                                frequency = later_frequencies[k]
+                                norm = k1 * (1 - b + b * lengths[doc - base] / average)
+                                scores[doc] += later_idf * frequency * (k1 + 1) / (frequency + norm)
+                    break
+            for doc, frequency in zip(ids, frequencies):
+                norm = k1 * (1 - b + b * lengths[doc - base] / average)
+                scores[doc] = scores.get(doc, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+        filtered = lo > 0 or hi < count or allowed is not None
+        ranked = (
+            (score, where[doc - base] - shift)
+            for doc, score in scores.items()
+            if not filtered or qualifies(doc)
+        )
+        # Ties go to the most recent trace.
+        return [position for _, position in heapq.nlargest(limit, ranked)]
+
+    @staticmethod
+    def _threshold(scores: Dict[int, float], limit: int, qualifies: Callable[[int], bool]) -> float | None:
+        """Score of the ``limit``-th best qualifying candidate, if there are enough."""
+        best = heapq.nlargest(limit, (score for doc, score in scores.items() if qualifies(doc)))
+        return best[-1] if len(best) == limit else None
+
+    def _reindex(self) -> None:
+        """Rebuild the position lookup after late insertions."""
+        where = array("q", [-1]) * len(self._lengths)
+        base = self._base
+        for position, doc in enumerate(self._docs):
+            where[doc - base] = position
+        self._where = where
+        self._shift = 0
+        self._stale = False
@@ -0,0 +1,207 @@
+"""Resident HTTP/JSON service around one long-lived Orion Nova organism.
+
+Construction (codex, memory, model, publisher) happens once when the service
+starts; each request then only runs a conscious cycle on a worker thread.
+
+Endpoints::
+
+    GET  /health  -> {"status": "ok", "traces": <int>[, "speculation": {...}][, "scheduler": {...}]}
+    POST /cycle   {"text": ..., "intention": ..., "channel": "demo"[, "deadline_ms": ..., "priority": ...]}
+                  -> the ConsciousCycleResult as JSON
+
+With a :class:`~orion_nova.scheduling.CycleScheduler`, cycles go through its
+per-channel queues and a shed request is answered with 503 at once.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+from .blobs import BlobStore
+from .orchestration import ConsciousCycleResult, OrionNova
+from .scheduling import CycleRejection, CycleScheduler, ScheduledOutcome
+
+
+def result_to_dict(result: ConsciousCycleResult, blobs: BlobStore | None = None) -> dict[str, Any]:
+    """Flatten a cycle result into JSON-serialisable primitives.
+
+    With the organism's ``blobs`` store, ``blob:`` references in the
+    reflection are expanded back into the text they stand for.
+    """
+    return {
+        "raw_text": result.sensory_input.raw_text,
+        "language": result.sensory_input.language,
+        "interpretation": result.interpretation,
+        "decision_narrative": result.decision_narrative,
+        "action_reference": result.action_reference,
+        "action_references": list(result.action_references),
+        "reflection": result.reflection if blobs is None else blobs.expand(result.reflection),
+    }
+
+
+class _PooledHTTPServer(HTTPServer):
+    """HTTP server handing each connection to a bounded worker pool."""
+
+    def __init__(self, address: tuple[str, int], service: OrionService, workers: int) -> None:
+        super().__init__(address, _CycleHandler)
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orion-service")
+
+    def process_request(self, request: Any, client_address: Any) -> None:  # type: ignore[override]
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001 - mirror socketserver's per-request handling
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+class _CycleHandler(BaseHTTPRequestHandler):
+    server: _PooledHTTPServer
+
+    def do_OPTIONS(self) -> None:  # noqa: N802 - http.server naming
+        self._reply(HTTPStatus.NO_CONTENT, None)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path != "/health":
+            self._reply(HTTPStatus.NOT_FOUND, {"error": "rota desconhecida"})
+            return
+        orion = self.server.service.orion
+        health: dict[str, Any] = {"status": "ok", "traces": len(orion.memory.traces)}
+        if orion.speculate:
+            stats = orion.speculation
+            health["speculation"] = {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "cancelled": stats.cancelled,
+                "hit_rate": stats.hit_rate,
+                "overlap_ms": stats.overlap_ms,
+                "wasted_ms": stats.wasted_ms,
+            }
+        if self.server.service.scheduler is not None:
+            health["scheduler"] = self.server.service.scheduler.stats()
+        self._reply(HTTPStatus.OK, health)
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != "/cycle":
+            self._reply(HTTPStatus.NOT_FOUND, {"error": "rota desconhecida"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            text, intention = body["text"], body["intention"]
+            if not isinstance(text, str) or not isinstance(intention, str):
+                raise TypeError("text and intention must be strings")
+            channel = body.get("channel") or "demo"
+            if not isinstance(channel, str):
+                raise TypeError("channel must be a string")
+            deadline_ms = body.get("deadline_ms")
+            deadline = None if deadline_ms is None else float(deadline_ms) / 1000
+            priority = int(body.get("priority", 0))
+        except (ValueError, KeyError, TypeError):
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": "envie JSON com 'text' e 'intention' em texto"})
+            return
+        try:
+            result = self.server.service.cycle(text, intention, channel, deadline=deadline, priority=priority)
+        except Exception as error:  # noqa: BLE001 - reported to the client
+            self._reply(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)})
+            return
+        if isinstance(result, CycleRejection):
+            self._reply(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"error": "ciclo recusado pela fila", "reason": result.reason, "waited_ms": result.waited_ms},
+            )
+            return
+        self._reply(HTTPStatus.OK, result_to_dict(result, self.server.service.orion.blobs))
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        if self.server.service.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status: HTTPStatus, payload: dict[str, Any] | None) -> None:
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        origin = self.server.service.allowed_origin
+        if origin is not None:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            if origin != "*":
+                self.send_header("Vary", "Origin")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@dataclass
+class OrionService:
+    """Long-lived wrapper serving conscious cycles over HTTP/JSON.
+
+    Cross-origin requests are refused by browsers unless ``allowed_origin``
+    names the origin (e.g. ``"http://localhost:8501"``) that may call the
+    service; ``None`` sends no CORS headers at all.
+    """
+
+    orion: OrionNova
+    host: str = "127.0.0.1"
+    port: int = 8765
+    workers: int = 8
+    verbose: bool = False
+    scheduler: CycleScheduler | None = None
+    allowed_origin: str | None = None
+    _server: _PooledHTTPServer | None = field(default=None, init=False, repr=False)
+
+    def cycle(
+        self,
+        text: str,
+        intention: str,
+        channel: str = "demo",
+        deadline: float | None = None,
+        priority: int = 0,
+    ) -> ScheduledOutcome:
+        """Run one cycle on the resident organism, through the scheduler if any.
+
+        ``deadline`` (seconds) and ``priority`` only matter with a scheduler.
+        """
+        if self.scheduler is not None:
+            return self.scheduler.conscious_cycle([text.encode("utf-8")], intention, channel, deadline, priority)
+        return self.orion.conscious_cycle(
+            audio_stream=[text.encode("utf-8")],
+            intention=intention,
+            channel=channel,
+        )
+
+    def start(self) -> tuple[str, int]:
+        """Bind the listening socket and return the actual address."""
+        self._server = _PooledHTTPServer((self.host, self.port), self, self.workers)
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def serve_forever(self) -> None:
+        """Handle requests until :meth:`stop` is called (binding first if needed)."""
+        if self._server is None:
+            self.start()
+        assert self._server is not None
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Ask a running :meth:`serve_forever` loop to return."""
+        if self._server is not None:
+            self._server.shutdown()
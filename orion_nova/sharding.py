@@ -0,0 +1,150 @@
+"""Multi-process execution with one symbolic memory shard per worker.
+
+The pure-Python parts of a cycle (interpretation, codex matching, prompt
+curation, memory logging) hold the GIL, so threads alone do not scale them
+across cores. :class:`ShardedOrionNova` instead routes each cycle by
+``channel`` to one of several single-worker processes. Each process builds
+its own organism, and so owns the memory shard for its channels. Cross-shard
+``recall`` and ``weave_story`` gather every shard's answer and merge them
+chronologically.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Callable, Iterable, List
+
+from .memory import _EMPTY_STORY, MemoryTrace, _epoch_micros
+from .orchestration import BatchItem, ConsciousCycleResult, CycleFailure, CycleRequest, OrionNova
+
+_shard_orion: OrionNova | None = None
+
+
+def _start_shard(factory: Callable[[], OrionNova]) -> None:
+    global _shard_orion
+    _shard_orion = factory()
+
+
+def _detach(trace: MemoryTrace | None) -> MemoryTrace | None:
+    """Copy a (possibly view-backed) trace into a standalone, picklable one."""
+    if trace is None:
+        return None
+    return MemoryTrace(title=trace.title, content=trace.content, tags=tuple(trace.tags), created_at=trace.created_at)
+
+
+def _shard_cycle(chunks: list[bytes], intention: str, channel: str) -> ConsciousCycleResult:
+    assert _shard_orion is not None
+    result = _shard_orion.conscious_cycle(audio_stream=chunks, intention=intention, channel=channel)
+    return replace(result, memory_trace=_detach(result.memory_trace))
+
+
+def _shard_recall(
+    tag: str | None,
+    limit: int,
+    since: datetime | None,
+    until: datetime | None,
+) -> list[MemoryTrace]:
+    assert _shard_orion is not None
+    recalled = _shard_orion.memory.recall(tag=tag, limit=limit, since=since, until=until)
+    return [_detach(trace) for trace in recalled]  # type: ignore[misc]
+
+
+def _shard_story(
+    tags: tuple[str, ...],
+    last: int | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> list[tuple[int, str]]:
+    assert _shard_orion is not None
+    return _shard_orion.memory.dated_story(tags, last=last, since=since, until=until)
+
+
+@dataclass
+class ShardedOrionNova:
+    """Coordinator spreading conscious cycles over per-channel process shards.
+
+    ``factory`` builds one organism per shard process. It must be picklable,
+    i.e. a module-level function such as ``demo_orion.build_demo_orion``. A
+    channel always maps to the same shard, so its memory stays in one place
+    and its cycles keep their order relative to each other.
+    """
+
+    factory: Callable[[], OrionNova]
+    shards: int = field(default_factory=lambda: os.cpu_count() or 1)
+    _pools: List[ProcessPoolExecutor] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._pools = [
+            ProcessPoolExecutor(max_workers=1, initializer=_start_shard, initargs=(self.factory,))
+            for _ in range(self.shards)
+        ]
+
+    def shard_of(self, channel: str) -> int:
+        """Stable shard index for ``channel`` (independent of hash seeds)."""
+        return zlib.crc32(channel.encode("utf-8")) % self.shards
+
+    def submit(self, audio_stream: Iterable[bytes], intention: str, channel: str) -> Future[ConsciousCycleResult]:
+        """Queue a cycle on the channel's shard without waiting for it."""
+        pool = self._pools[self.shard_of(channel)]
+        return pool.submit(_shard_cycle, list(audio_stream), intention, channel)
+
+    def conscious_cycle(self, audio_stream: Iterable[bytes], intention: str, channel: str) -> ConsciousCycleResult:
+        """Run one cycle on the channel's shard."""
+        return self.submit(audio_stream, intention, channel).result()
+
+    def conscious_cycles(self, batch: Iterable[BatchItem]) -> list[ConsciousCycleResult | CycleFailure]:
+        """Fan a batch out over the shards; results keep input order."""
+        requests = [item if isinstance(item, CycleRequest) else CycleRequest(*item) for item in batch]
+        futures = [self.submit(request.audio_stream, request.intention, request.channel) for request in requests]
+        results: list[ConsciousCycleResult | CycleFailure] = []
+        for request, future in zip(requests, futures):
+            try:
+                results.append(future.result())
+            except Exception as error:  # noqa: BLE001 - surfaced to the caller per item
+                results.append(CycleFailure(request=request, error=error))
+        return results
+
+    def recall(
+        self,
+        tag: str | None = None,
+        limit: int = 5,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[MemoryTrace]:
+        """Most recent traces across every shard, in chronological order."""
+        futures = [pool.submit(_shard_recall, tag, limit, since, until) for pool in self._pools]
+        merged = heapq.merge(*(future.result() for future in futures), key=lambda t: _epoch_micros(t.created_at))
+        return list(merged)[-limit:] if limit > 0 else []
+
+    def weave_story(
+        self,
+        tags: Iterable[str],
+        last: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> str:
+        """Chronologically merged narrative woven from every shard."""
+        wanted = tuple(tags)
+        futures = [pool.submit(_shard_story, wanted, last, since, until) for pool in self._pools]
+        lines = [summary for _, summary in heapq.merge(*(future.result() for future in futures))]
+        if last is not None:
+            lines = lines[-last:] if last > 0 else []
+        if not lines:
+            return _EMPTY_STORY
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Stop every shard process."""
+        for pool in self._pools:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> ShardedOrionNova:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,168 @@
+"""Per-stage instrumentation hooks for the conscious cycle.
+
+:class:`OrionNova` reports every stage (listen, interpret, ethics, compose,
+perform, log_memory, reflect) to an optional :class:`CycleObserver` as a
+:class:`StageSpan` with monotonic timings and the size of the stage's output.
+Without an observer only the per-stage breakdown attached to each
+``ConsciousCycleResult`` is collected.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, List, Protocol
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    """Timing of one stage of one cycle.
+
+    ``cycle_id`` tells apart the spans of cycles running concurrently; the
+    orchestrator numbers its cycles from 1.
+    """
+
+    stage: str
+    started_ns: int
+    duration_ns: int
+    payload_bytes: int
+    cycle_id: int = 0
+
+
+class CycleObserver(Protocol):
+    """Receiver of stage spans; must be safe to call from several threads."""
+
+    def on_start(self, stage: str) -> None:
+        ...
+
+    def on_stop(self, span: StageSpan) -> None:
+        ...
+
+
+class NullObserver:
+    """Observer that ignores everything."""
+
+    def on_start(self, stage: str) -> None:
+        pass
+
+    def on_stop(self, span: StageSpan) -> None:
+        pass
+
+
+class CycleTimer:
+    """Stopwatch used by the orchestrator for one cycle.
+
+    ``timings`` maps each stage to its duration in milliseconds. Spans are only
+    built when an observer is attached, and carry ``cycle_id``.
+    """
+
+    __slots__ = ("observer", "timings", "cycle_id")
+
+    def __init__(self, observer: CycleObserver | None, cycle_id: int = 0) -> None:
+        self.observer = observer
+        self.timings: Dict[str, float] = {}
+        self.cycle_id = cycle_id
+
+    def start(self, stage: str) -> int:
+        if self.observer is not None:
+            self.observer.on_start(stage)
+        return time.perf_counter_ns()
+
+    def stop(self, stage: str, started_ns: int, payload_bytes: int = 0) -> None:
+        duration_ns = time.perf_counter_ns() - started_ns
+        self.timings[stage] = self.timings.get(stage, 0.0) + duration_ns / 1e6
+        if self.observer is not None:
+            self.observer.on_stop(StageSpan(stage, started_ns, duration_ns, payload_bytes, self.cycle_id))
+
+
+@dataclass
+class _Histogram:
+    buckets: List[int] = field(default_factory=lambda: [0] * 40)
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    payload_bytes: int = 0
+
+
+@dataclass
+class HistogramObserver:
+    """In-process latency histograms per stage (power-of-two µs buckets)."""
+
+    _stages: Dict[str, _Histogram] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def on_start(self, stage: str) -> None:
+        pass
+
+    def on_stop(self, span: StageSpan) -> None:
+        bucket = min(39, (span.duration_ns // 1000).bit_length())
+        with self._lock:
+            histogram = self._stages.setdefault(span.stage, _Histogram())
+            histogram.buckets[bucket] += 1
+            histogram.count += 1
+            histogram.total_ns += span.duration_ns
+            histogram.max_ns = max(histogram.max_ns, span.duration_ns)
+            histogram.payload_bytes += span.payload_bytes
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, approximate p50/p95/p99 and max (ms) per stage."""
+        report: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for stage, histogram in self._stages.items():
+                report[stage] = {
+                    "count": histogram.count,
+                    "mean_ms": histogram.total_ns / histogram.count / 1e6,
+                    "p50_ms": self._quantile(histogram, 0.50),
+                    "p95_ms": self._quantile(histogram, 0.95),
+                    "p99_ms": self._quantile(histogram, 0.99),
+                    "max_ms": histogram.max_ns / 1e6,
+                    "payload_bytes": histogram.payload_bytes,
+                }
+        return report
+
+    @staticmethod
+    def _quantile(histogram: _Histogram, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile, in ms."""
+        threshold = q * histogram.count
+        seen = 0
+        for bucket, hits in enumerate(histogram.buckets):
+            seen += hits
+            if seen >= threshold:
+                return min((1 << bucket) / 1000, histogram.max_ns / 1e6)
+        return histogram.max_ns / 1e6
+
+
+@dataclass
+class JsonLinesObserver:
+    """Append one JSON object per finished stage to ``path``."""
+
+    path: Path
+    _handle: IO[str] = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._handle = open(self.path, "a", encoding="utf-8")
+
+    def on_start(self, stage: str) -> None:
+        pass
+
+    def on_stop(self, span: StageSpan) -> None:
+        line = json.dumps(
+            {
+                "cycle": span.cycle_id,
+                "stage": span.stage,
+                "started_ns": span.started_ns,
+                "duration_ns": span.duration_ns,
+                "payload_bytes": span.payload_bytes,
+                "thread": threading.get_ident(),
+            }
+        )
+        with self._lock:
+            self._handle.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
@@ -0,0 +1,17 @@
+"""Shared fixtures: the offline organism assembled by ``demo_orion``."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from demo_orion import build_demo_orion  # noqa: E402
+
+
+@pytest.fixture
+def orion():
+    return build_demo_orion()
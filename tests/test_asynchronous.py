@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from orion_nova.asynchronous import AsyncOrionNova
+from orion_nova.caching import GenerationCache
+from orion_nova.publishing import PublishPipeline
+
+
+def run_cycle(orion, intention: str, channel: str = "galeria"):
+    return asyncio.run(AsyncOrionNova.from_sync(orion).conscious_cycle([b"Ol\xc3\xa1"], intention, channel))
+
+
+def test_async_cycle_is_traced_like_the_sync_one(orion):
+    result = run_cycle(orion, "Criar fábula")
+    assert result.action_reference
+    assert {"listen", "interpret", "ethics", "compose", "perform", "log_memory", "reflect"} <= set(result.timings)
+
+
+def test_async_cycle_reuses_the_generation_cache(orion):
+    orion.artistry.cache = GenerationCache()
+    run_cycle(orion, "Criar fábula")
+    run_cycle(orion, "Criar fábula")
+    assert (orion.artistry.cache.misses, orion.artistry.cache.hits) == (1, 1)
+
+
+def test_async_cycle_publishes_every_modality(orion):
+    orion.modalities = ("text", "image", "sound")
+    result = run_cycle(orion, "Criar fábula")
+    assert len(result.action_references) == 3
+    assert result.memory_trace.content.count("Obra criada") == 3
+
+
+def test_async_cycle_speculates_and_discards_blocked_work(orion):
+    orion.speculate = True
+    run_cycle(orion, "Criar fábula")
+    blocked = run_cycle(orion, "Espalhar ódio")
+    assert blocked.action_reference is None
+    assert (orion.speculation.hits, orion.speculation.misses) == (1, 1)
+
+
+def test_async_cycle_goes_through_the_publish_pipeline(orion):
+    with PublishPipeline(orion.action_body.publisher) as pipeline:
+        orion.action_body.pipeline = pipeline
+        result = run_cycle(orion, "Criar fábula")
+    assert result.action_reference
+
+
+def test_cached_async_cycles_outnumbering_the_executor_all_finish(orion):
+    orion.artistry.cache = GenerationCache()
+    runner = AsyncOrionNova.from_sync(orion)
+
+    async def main():
+        # A tiny default executor: cache fetches must not hold its threads
+        # while the adapted model waits for one.
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        batch = [([b"Ol\xc3\xa1"], f"Criar fábula {i}", "galeria") for i in range(40)]
+        return await asyncio.wait_for(runner.conscious_cycles(batch), timeout=10)
+
+    results = asyncio.run(main())
+    assert all(result.action_reference for result in results)
+    assert orion.artistry.cache.misses == 40
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+
+from demo_orion import run_batch
+
+
+def run(tmp_path, lines, **options):
+    source = tmp_path / "pedidos.jsonl"
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    output = tmp_path / "resultados.jsonl"
+    run_batch(source, output, workers=2, **options)
+    return [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+
+
+def test_bad_lines_are_reported_and_the_batch_goes_on(tmp_path, capsys):
+    replies = run(
+        tmp_path,
+        [
+            '{"text": "Olá", "intention": "Criar fábula"}',
+            '{"text": "Olá", "intention": ',
+            "[1, 2]",
+            '{"text": "Orion", "intention": "Criar fábula"}',
+        ],
+    )
+    assert [reply["line"] for reply in replies] == [1, 2, 3, 4]
+    assert "JSON" in replies[1]["error"] and "object" in replies[2]["error"]
+    assert replies[0]["action_reference"] and replies[3]["action_reference"]
+    assert "2 falhas" in capsys.readouterr().out
+
+
+def test_record_without_an_intention_is_an_error(tmp_path):
+    replies = run(tmp_path, ['{"text": "Olá"}', '{"text": "Olá", "intention": ""}'])
+    assert all("no intention" in reply["error"] for reply in replies)
+    assert run(tmp_path, ['{"text": "Olá"}'], intention="Criar fábula")[0]["action_reference"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import resource
+
+import pytest
+
+from orion_nova.blobs import BlobStore
+
+
+@pytest.fixture
+def few_descriptors():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(soft, 128), hard))
+    yield
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
+def test_expanding_more_blobs_than_descriptors(tmp_path, few_descriptors):
+    store = BlobStore(tmp_path, map_threshold=1)
+    references = [store.put(f"obra {i}") for i in range(300)]
+    expanded = store.expand(" ".join(references))
+    assert expanded == " ".join(f"obra {i}" for i in range(300))
+    store.close()
+
+
+def test_small_blobs_are_read_without_mapping(tmp_path):
+    store = BlobStore(tmp_path)
+    reference = store.put("obra")
+    assert store.text(reference) == "obra"
+    assert store.text(store.put(b"x" * store.map_threshold)) == "x" * store.map_threshold
+    store.close()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from orion_nova import caching
+from orion_nova.caching import GenerationCache
+
+
+class CountingModel:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self, prompt: str, modality: str) -> bytes:
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"{modality}:{prompt}".encode()
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(caching.time, "time", lambda: now[0])
+    cache, model = GenerationCache(ttl=10), CountingModel()
+    assert cache.fetch("fábula", "text", model) == (b"text:f\xc3\xa1bula", False)
+    now[0] += 5
+    assert cache.fetch("fábula", "text", model)[1]
+    now[0] += 11
+    assert not cache.fetch("fábula", "text", model)[1]
+    assert model.calls == 2
+
+
+def test_disk_tier_serves_a_fresh_cache(tmp_path):
+    model = CountingModel()
+    GenerationCache(directory=tmp_path).fetch("fábula", "text", model)
+    assert GenerationCache(directory=tmp_path).fetch("fábula", "text", model) == (b"text:f\xc3\xa1bula", True)
+    assert model.calls == 1
+
+
+def test_disk_tier_keeps_under_its_limit(tmp_path):
+    cache = GenerationCache(max_entries=1, directory=tmp_path, disk_max_bytes=100)
+    model = CountingModel()
+    for number in range(20):
+        cache.fetch(f"prompt {number:02d}", "text", model)
+    assert sum(path.stat().st_size for path in tmp_path.glob("??/*")) <= 100
+    # The memory tier only holds "prompt 19"; the previous one comes from disk.
+    assert cache.fetch("prompt 18", "text", model)[1]
+    assert model.calls == 20
+
+
+def test_concurrent_misses_are_coalesced():
+    cache, model = GenerationCache(), CountingModel(delay=0.1)
+    start = threading.Barrier(4)
+    replies = []
+
+    def request() -> None:
+        start.wait()
+        replies.append(cache.fetch("fábula", "text", model))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert model.calls == 1
+    assert (cache.misses, cache.coalesced) == (1, 3)
+    assert sorted(cached for _, cached in replies) == [False, True, True, True]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gc
+
+from orion_nova.codes import CodesOfConduct, Principle, default_codex
+from orion_nova.ethics import EthicalCore
+
+
+def test_benign_actions_are_aligned():
+    aligned, narrative = default_codex().ensure_consistency(["Criar fábula sobre amizade"])
+    assert aligned
+    assert "harmonizam" in narrative
+
+
+def test_matching_ignores_case_and_accents():
+    codex = default_codex()
+    assert not codex.ensure_consistency(["espalhar ODIO"])[0]
+    assert not codex.ensure_consistency(["Espalhar Ódio"])[0]
+
+
+def test_matching_respects_word_boundaries():
+    codex = CodesOfConduct([Principle("Verdade", "não mentir", ("mentir",))])
+    assert codex.ensure_consistency(["desmentir um boato"])[0]
+    assert not codex.ensure_consistency(["mentir ao público"])[0]
+
+
+def test_every_betrayed_principle_is_reported_once_in_codex_order():
+    codex = default_codex()
+    betrayed = codex.violations(["vazar dados", "mentir e enganar", "humilhar"])
+    assert [principle.name for principle in betrayed] == ["Verdade", "Dignidade", "Privacidade"]
+
+
+def test_overlapping_expressions_betray_every_principle():
+    betrayed = default_codex().violations(["discurso de ódio"])
+    assert [principle.name for principle in betrayed] == ["Dignidade", "Não violência"]
+
+
+def test_empty_codex_allows_everything():
+    assert CodesOfConduct().ensure_consistency(["qualquer coisa"])[0]
+
+
+def test_add_principle_recompiles_and_bumps_version():
+    codex = default_codex()
+    before = codex.version
+    assert codex.ensure_consistency(["pintar um mural"])[0]
+    codex.add_principle(Principle("Silêncio", "respeitar o silêncio", ("mural",)))
+    assert codex.version != before
+    assert not codex.ensure_consistency(["pintar um mural"])[0]
+
+
+def test_decisions_are_cached():
+    core = EthicalCore(default_codex())
+    first = core.evaluate("Criar  fábula", ["Responder   à intenção"])
+    second = core.evaluate("Criar fábula", ["Responder à intenção"])
+    assert first == second
+    assert (core.cache.hits, core.cache.misses) == (1, 1)
+
+
+def test_cached_remedial_actions_are_not_shared():
+    core = EthicalCore(default_codex())
+    core.evaluate("Por quê?", ["ok"]).remedial_actions.append("intruso")
+    assert "intruso" not in core.evaluate("Por quê?", ["ok"]).remedial_actions
+
+
+def test_editing_the_codex_invalidates_cached_decisions():
+    core = EthicalCore(default_codex())
+    assert core.evaluate("x", ["pintar um mural"]).allowed
+    core.codex.add_principle(Principle("Silêncio", "respeitar o silêncio", ("mural",)))
+    assert not core.evaluate("x", ["pintar um mural"]).allowed
+
+
+def test_replacing_the_codex_never_serves_stale_decisions():
+    core = EthicalCore(CodesOfConduct([Principle("A", "a", ("mural",))]))
+    assert not core.evaluate("x", ["mural"]).allowed
+    for _ in range(50):
+        # A fresh codex may land at the address of the collected one.
+        core.codex = CodesOfConduct()
+        gc.collect()
+        assert core.evaluate("x", ["mural"]).allowed
+        core.codex = CodesOfConduct([Principle("A", "a", ("mural",))])
+        gc.collect()
+        assert not core.evaluate("x", ["mural"]).allowed
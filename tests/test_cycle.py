@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from orion_nova.orchestration import CycleFailure, CycleRequest
+
+
+def test_allowed_cycle_publishes_and_reflects(orion):
+    result = orion.conscious_cycle([b"Ol\xc3\xa1 ", b"Orion"], "Criar fábula", "jornal")
+    assert result.sensory_input.raw_text == "Olá Orion"
+    assert result.decision_narrative.startswith("Todas as ações")
+    assert result.action_reference == "mem://jornal/1"
+    assert result.action_references == ("mem://jornal/1",)
+    assert "Ciclo consciente concluído" in result.reflection
+    assert "reflexão" in result.memory_trace.tags
+    assert set(result.timings) >= {"listen", "interpret", "ethics", "compose", "perform", "reflect"}
+
+
+def test_blocked_cycle_publishes_nothing(orion):
+    result = orion.conscious_cycle([b"Ol\xc3\xa1"], "Espalhar ódio", "jornal")
+    assert result.action_reference is None
+    assert result.action_references == ()
+    assert "bloqueado" in result.memory_trace.tags
+    assert orion.memory.recall("publicação") == []
+
+
+def test_streaming_cycle_stops_listening_once_blocked(orion):
+    heard = []
+
+    def chunks():
+        for chunk in (b"vamos ", "espalhar ódio ".encode(), b"e mais", b" ainda"):
+            heard.append(chunk)
+            yield chunk
+
+    result = orion.streaming_cycle(chunks(), "Conversar", "jornal")
+    assert result.action_reference is None
+    assert len(heard) == 2
+    assert not result.decision_narrative.startswith("Todas")
+
+
+@pytest.mark.parametrize("text", ["uma mentira", "vamos mentir já", "xódio"])
+def test_streaming_decision_does_not_depend_on_the_split(orion, text):
+    # "mentir" and "ódio" are forbidden, but not inside "mentira" or "xódio".
+    expected = orion.conscious_cycle([text.encode()], "Conversar", "jornal").action_reference is not None
+    for cuts in range(1 << (len(text) - 1)):
+        chunks, start = [], 0
+        for position in range(1, len(text)):
+            if cuts >> (position - 1) & 1:
+                chunks.append(text[start:position].encode())
+                start = position
+        chunks.append(text[start:].encode())
+        result = orion.streaming_cycle(chunks, "Conversar", "jornal")
+        assert (result.action_reference is not None) == expected, chunks
+
+
+def test_streaming_cycle_matches_conscious_cycle_when_allowed(orion):
+    result = orion.streaming_cycle([b"Ol\xc3\xa1 ", b"Orion"], "Criar fábula", "jornal")
+    assert result.sensory_input.raw_text == "Olá Orion"
+    assert result.action_reference == "mem://jornal/1"
+
+
+def test_batch_keeps_order_and_isolates_failures(orion):
+    results = orion.conscious_cycles(
+        [
+            CycleRequest([b"um"], "Criar fábula", "a"),
+            ([b"\xff"], "Criar fábula", "b"),
+            ([b"tr\xc3\xaas"], "Criar fábula", "c"),
+        ],
+        max_workers=3,
+    )
+    assert results[0].sensory_input.raw_text == "um"
+    assert isinstance(results[1], CycleFailure)
+    assert isinstance(results[1].error, UnicodeDecodeError)
+    assert results[2].sensory_input.raw_text == "três"
+
+
+def test_several_modalities_are_all_published(orion):
+    orion.modalities = ("text", "image", "sound")
+    result = orion.conscious_cycle([b"Ol\xc3\xa1"], "Criar fábula", "galeria")
+    assert len(result.action_references) == 3
+    assert result.action_reference == result.action_references[0]
+    assert result.memory_trace.content.count("Obra criada") == 3
+
+
+def test_speculative_cycle_discards_blocked_work(orion):
+    orion.speculate = True
+    orion.conscious_cycle([b"Ol\xc3\xa1"], "Criar fábula", "a")
+    orion.conscious_cycle([b"Ol\xc3\xa1"], "Espalhar ódio", "a")
+    assert (orion.speculation.hits, orion.speculation.misses) == (1, 1)
+    assert len(orion.memory.recall("publicação", limit=10)) == 1
+
+
+def test_failed_modality_reports_after_logging_published_works(orion):
+    class PickyModel:
+        def generate(self, prompt: str, modality: str) -> bytes:
+            if modality == "sound":
+                raise RuntimeError("sem som")
+            return prompt.encode("utf-8")
+
+    orion.artistry.model = PickyModel()
+    orion.modalities = ("text", "image", "sound")
+    with pytest.raises(RuntimeError, match="sem som"):
+        orion.conscious_cycle([b"Ol\xc3\xa1"], "Criar fábula", "galeria")
+    [trace] = orion.memory.recall("reflexão", limit=1)
+    assert trace.content.count("Ação publicada em galeria") == 2
+
+
+def test_concurrent_first_cycles_share_one_reflection_view(orion, monkeypatch):
+    created = []
+    reflection_view = orion.memory.reflection_view
+
+    def slow_reflection_view(*args, **kwargs):
+        time.sleep(0.05)  # widen the window between checking and creating
+        created.append(reflection_view(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(orion.memory, "reflection_view", slow_reflection_view)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda n: orion.conscious_cycle([b"um"], f"Criar fábula {n}", "jornal"), range(4)))
+    assert len(created) == 1
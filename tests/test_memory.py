@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import gc
+import subprocess
+import sys
+import textwrap
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from orion_nova.journal import MemoryJournal
+from orion_nova.memory import MemoryTrace, SymbolicMemory
+from orion_nova.retention import JournalTier, RetentionPolicy, SummaryTier
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+def trace(title: str, minutes: int, *tags: str, content: str = "") -> MemoryTrace:
+    return MemoryTrace(title=title, content=content or title, tags=tags, created_at=T0 + timedelta(minutes=minutes))
+
+
+@pytest.fixture(params=[True, False], ids=["compact", "objects"])
+def memory(request):
+    return SymbolicMemory(compact=request.param)
+
+
+def titles(traces) -> list[str]:
+    return [t.title for t in traces]
+
+
+def test_traces_are_kept_in_chronological_order(memory):
+    for title, minutes in [("b", 2), ("c", 3), ("a", 1), ("d", 4)]:
+        memory.store(trace(title, minutes, "x"))
+    assert titles(memory.recall(limit=10)) == ["a", "b", "c", "d"]
+    assert titles(memory.recall("x", limit=2)) == ["c", "d"]
+
+
+def test_recall_filters_by_tag_and_time_window(memory):
+    for minutes in range(6):
+        memory.store(trace(f"t{minutes}", minutes, "par" if minutes % 2 == 0 else "ímpar"))
+    assert titles(memory.recall("par", limit=10)) == ["t0", "t2", "t4"]
+    window = memory.recall("ímpar", since=T0 + timedelta(minutes=1), until=T0 + timedelta(minutes=5))
+    assert titles(window) == ["t1", "t3"]
+    assert memory.recall("ausente") == []
+
+
+def test_stored_tags_read_back_unchanged(memory):
+    memory.store(trace("um", 1, "b", "a"))
+    memory.store(trace("dois", 2, "a", "b", "a"))
+    assert [tuple(t.tags) for t in memory.recall(limit=2)] == [("b", "a"), ("a", "b", "a")]
+    assert memory.recall(limit=1)[0].summarise() == "dois [a, b, a] — dois"
+
+
+def test_weave_story_joins_summaries_oldest_first(memory):
+    assert "Sem lembranças" in memory.weave_story(["x"])
+    memory.store(trace("b", 2, "x"))
+    memory.store(trace("a", 1, "y"))
+    memory.store(trace("c", 3, "x", "y"))
+    assert memory.weave_story(["x"]).splitlines() == ["b [x] — b", "c [x, y] — c"]
+    assert memory.weave_story(["x", "y"], last=2).splitlines() == ["b [x] — b", "c [x, y] — c"]
+
+
+def test_reflection_view_follows_later_stores(memory):
+    view = memory.reflection_view(["x"], window=2)
+    for minutes in (1, 3, 2):
+        memory.store(trace(f"t{minutes}", minutes, "x"))
+    assert list(view) == ["t2 [x] — t2", "t3 [x] — t3"]
+
+
+def test_dropped_reflection_views_are_released(memory):
+    view = memory.reflection_view(["x"])
+    del view
+    gc.collect()
+    memory.store(trace("t1", 1, "x"))
+    assert not memory._views
+
+
+def test_retention_evicts_oldest_into_cold_tier():
+    cold = SummaryTier()
+    memory = SymbolicMemory(retention=RetentionPolicy(max_traces=10, low_water=0.5), cold=cold)
+    for minutes in range(11):
+        memory.store(trace(f"t{minutes}", minutes, "x"))
+    assert titles(memory.recall("x", limit=20)) == [f"t{m}" for m in range(6, 11)]
+    assert sum(bucket.count for bucket in cold.buckets.values()) == 6
+
+
+def test_retention_archives_evictions_in_a_journal_tier(tmp_path):
+    archive = MemoryJournal(tmp_path)
+    memory = SymbolicMemory(retention=RetentionPolicy(max_traces=3, low_water=1.0), cold=JournalTier(archive))
+    for minutes in range(5):
+        memory.store(trace(f"t{minutes}", minutes, "x"))
+    archive.close()
+    assert titles(memory.recall("x", limit=10)) == ["t2", "t3", "t4"]
+    reopened = SymbolicMemory.open(tmp_path)
+    assert titles(reopened.recall("x", limit=10)) == ["t0", "t1"]
+    reopened.journal.close()
+
+
+def test_retention_by_size_counts_title_tags_and_content():
+    # Each trace is 2 + 1 + 100 = 103 characters.
+    memory = SymbolicMemory(retention=RetentionPolicy(max_bytes=350, low_water=0.6))
+    for minutes in range(4):
+        memory.store(trace(f"t{minutes}", minutes, "x", content="c" * 100))
+    assert titles(memory.recall("x", limit=10)) == ["t2", "t3"]
+
+
+def test_retention_by_age_evicts_traces_older_than_the_cutoff():
+    now = datetime.utcnow()
+    memory = SymbolicMemory(retention=RetentionPolicy(max_age=timedelta(minutes=15)))
+    for minutes in (30, 20, 10, 0):
+        memory.store(MemoryTrace(title=f"-{minutes}", content="c", tags=("x",), created_at=now - timedelta(minutes=minutes)))
+    assert titles(memory.recall("x", limit=10)) == ["-10", "-0"]
+    assert memory.enforce_retention(now=now + timedelta(minutes=12)) == 1
+    assert titles(memory.recall("x", limit=10)) == ["-0"]
+
+
+def test_reflection_view_drops_evicted_traces():
+    memory = SymbolicMemory(retention=RetentionPolicy(max_traces=3, low_water=1.0))
+    view = memory.reflection_view(["x"], window=10)
+    for minutes in range(1, 6):
+        memory.store(trace(f"t{minutes}", minutes, "x"))
+    memory.store(trace("late", 0, "x"))
+    assert list(view) == [t.summarise() for t in memory.recall("x", limit=10)]
+    assert titles(memory.recall("x", limit=10)) == ["t3", "t4", "t5"]
+
+
+def test_search_ranks_matching_traces():
+    memory = SymbolicMemory()
+    memory.store(trace("Fábula", 1, "x", content="a raposa e as uvas"))
+    memory.store(trace("Poema", 2, "x", content="o mar e a lua"))
+    memory.store(trace("Conto", 3, "y", content="a raposa, a raposa e o corvo"))
+    assert titles(memory.search("RAPOSA")) == ["Conto", "Fábula"]
+    assert titles(memory.search("raposa", tags=["x"])) == ["Fábula"]
+
+
+def test_recall_similar_prefers_related_text():
+    pytest.importorskip("numpy")
+    memory = SymbolicMemory()
+    memory.store(trace("Mar", 1, "x", content="ondas do mar azul"))
+    memory.store(trace("Serra", 2, "x", content="montanhas de pedra"))
+    assert titles(memory.recall_similar("o mar e suas ondas", k=1)) == ["Mar"]
+
+
+def test_concurrent_stores_are_all_indexed():
+    memory = SymbolicMemory()
+
+    def write(worker: int) -> None:
+        for number in range(500):
+            memory.store(trace(f"{worker}-{number}", number, "par" if number % 2 == 0 else "ímpar"))
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(memory.recall(limit=10_000)) == 2000
+    assert len(memory.recall("par", limit=10_000)) == 1000
+    stored = memory.recall(limit=10_000)
+    assert [t.created_at for t in stored] == sorted(t.created_at for t in stored)
+
+
+def test_journal_backed_memory_survives_reopening(tmp_path):
+    memory = SymbolicMemory.open(tmp_path)
+    for minutes in (2, 1, 3):
+        memory.store(trace(f"t{minutes}", minutes, "x"))
+    memory.journal.close()
+    reopened = SymbolicMemory.open(tmp_path)
+    assert titles(reopened.recall("x", limit=10)) == ["t1", "t2", "t3"]
+    reopened.journal.close()
+
+
+def test_journal_syncs_an_idle_tail_after_the_interval(tmp_path):
+    # Nothing is appended after the last records; only the interval can sync them.
+    script = textwrap.dedent(
+        f"""
+        import os, time
+        from datetime import datetime
+        from orion_nova.memory import MemoryTrace, SymbolicMemory
+
+        memory = SymbolicMemory.open({str(tmp_path)!r}, sync_every=10**6, sync_interval=0.2)
+        for i in range(3):
+            memory.store(MemoryTrace(title=f"t{{i}}", content="c", tags=("x",), created_at=datetime(2026, 1, 1, i)))
+        time.sleep(1)
+        os._exit(0)
+        """
+    )
+    root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+    reopened = SymbolicMemory.open(tmp_path)
+    assert titles(reopened.recall("x", limit=10)) == ["t0", "t1", "t2"]
+    reopened.journal.close()
+
+
+def test_journal_reopens_after_a_crash_between_commits(tmp_path):
+    # The index and the log are buffered separately; dying between commits
+    # can leave index entries pointing past the end of the log.
+    script = textwrap.dedent(
+        f"""
+        import os
+        from datetime import datetime, timedelta
+        from orion_nova.memory import MemoryTrace, SymbolicMemory
+
+        memory = SymbolicMemory.open({str(tmp_path)!r}, sync_every=10**6, sync_interval=3600)
+        for i in range(515):
+            moment = datetime(2026, 1, 1) + timedelta(seconds=i - (30 if i % 50 == 49 else 0))
+            memory.store(MemoryTrace(title=f"t{{i}}", content="c" * 100, tags=("x",), created_at=moment))
+        os._exit(0)
+        """
+    )
+    root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+
+    reopened = SymbolicMemory.open(tmp_path)
+    assert 0 < len(reopened.traces) < 515
+    recalled = reopened.recall("x", limit=len(reopened.traces))
+    assert len(recalled) == len(reopened.traces)
+    assert [t.created_at for t in recalled] == sorted(t.created_at for t in recalled)
+    reopened.store(trace("after", 10**5, "x"))
+    reopened.journal.close()
+    assert titles(SymbolicMemory.open(tmp_path).recall("x", limit=1)) == ["after"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from orion_nova.publishing import PublishPipeline
+
+
+class RecordingPublisher:
+    def __init__(self) -> None:
+        self.published: list[bytes] = []
+
+    def publish(self, channel: str, payload: bytes, metadata: dict[str, str]) -> str:
+        self.published.append(payload)
+        return f"{channel}:{len(self.published)}"
+
+
+class ShortBatchPublisher(RecordingPublisher):
+    def publish_many(self, channel, payloads, metadata):
+        return [f"{channel}:1"]
+
+
+def test_short_publish_many_reply_fails_the_whole_batch():
+    pipeline = PublishPipeline(ShortBatchPublisher(), max_delay=0.05)
+    acks = [pipeline.submit("arte", memoryview(b"obra %d" % i), {}) for i in range(3)]
+    pipeline.close()
+    for ack in acks:
+        with pytest.raises(RuntimeError, match="1 references for 3 payloads"):
+            ack.result(timeout=1)
+
+
+def test_sliced_view_publishes_only_its_bytes():
+    publisher = RecordingPublisher()
+    with PublishPipeline(publisher) as pipeline:
+        ack = pipeline.submit("arte", memoryview(b"prefixo|obra")[8:], {})
+    assert ack.result(timeout=1) == "arte:1"
+    assert publisher.published == [b"obra"]
+
+
+def test_cancelled_acknowledgement_is_not_republished():
+    publisher = RecordingPublisher()
+    pipeline = PublishPipeline(publisher, max_delay=0.05, backoff=0)
+    cancelled = pipeline.submit("arte", memoryview(b"um"), {})
+    kept = pipeline.submit("arte", memoryview(b"dois"), {})
+    assert cancelled.cancel()
+    pipeline.close()
+    assert kept.result(timeout=1) == "arte:2"
+    assert publisher.published == [b"um", b"dois"]
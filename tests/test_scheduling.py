@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from orion_nova.scheduling import CycleRejection, CycleScheduler
+
+
+class SlowOrion:
+    """Stands in for OrionNova: each cycle takes 20 ms once released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def conscious_cycle(self, audio_stream, intention, channel):
+        self.release.wait()
+        time.sleep(0.02)
+        return intention
+
+
+def test_idle_channel_is_admitted_behind_a_busy_one():
+    orion = SlowOrion()
+    orion.release.set()
+    with CycleScheduler(orion, workers=1, queue_limit=100) as scheduler:
+        assert scheduler.conscious_cycle([], "aquecer", "ruidoso") == "aquecer"
+        orion.release.clear()
+        backlog = [scheduler.submit([], f"pedido {i}", "ruidoso") for i in range(50)]
+        # 50 queued cycles of ~20 ms would outlast the deadline, but they sit
+        # on another channel; this one only waits for its share of the worker.
+        quiet = scheduler.submit([], "calmo", "tranquilo", deadline=0.2)
+        crowded = scheduler.submit([], "mais um", "ruidoso", deadline=0.2)
+        assert isinstance(crowded.result(timeout=1), CycleRejection)
+        assert not quiet.done()
+        orion.release.set()
+        assert quiet.result(timeout=5) == "calmo"
+        for future in backlog:
+            future.result(timeout=5)
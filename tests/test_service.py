@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import threading
+from urllib import error, request
+
+import pytest
+
+from demo_orion import build_demo_orion
+from orion_nova.service import OrionService
+
+
+@pytest.fixture
+def serve(orion):
+    services = []
+
+    def start(organism=None, **options):
+        service = OrionService(orion=organism or orion, port=0, **options)
+        host, port = service.start()
+        threading.Thread(target=service.serve_forever, daemon=True).start()
+        services.append(service)
+        return f"http://{host}:{port}"
+
+    yield start
+    for service in services:
+        service.stop()
+
+
+def post(url: str, body: dict):
+    data = json.dumps(body).encode("utf-8")
+    req = request.Request(url + "/cycle", data=data, headers={"Content-Type": "application/json"})
+    try:
+        with request.urlopen(req) as response:
+            return response.status, response.headers, json.loads(response.read())
+    except error.HTTPError as failure:
+        return failure.code, failure.headers, json.loads(failure.read())
+
+
+def test_cycle_sends_no_cors_headers_by_default(serve):
+    status, headers, body = post(serve(), {"text": "Olá", "intention": "Criar fábula"})
+    assert status == 200 and body["action_reference"]
+    assert headers.get("Access-Control-Allow-Origin") is None
+
+
+def test_cycle_allows_the_configured_origin_only(serve):
+    _, headers, _ = post(serve(allowed_origin="http://localhost:8501"), {"text": "Olá", "intention": "Criar fábula"})
+    assert headers["Access-Control-Allow-Origin"] == "http://localhost:8501"
+
+
+def test_non_string_text_is_a_bad_request(serve):
+    status, _, body = post(serve(), {"text": 42, "intention": "Criar fábula"})
+    assert status == 400
+    assert "error" in body
+
+
+def test_cycle_expands_blob_references(serve, tmp_path):
+    url = serve(build_demo_orion(blobs=tmp_path))
+    post(url, {"text": "Olá", "intention": "Criar fábula"})
+    _, _, body = post(url, {"text": "Olá", "intention": "Criar fábula"})
+    assert "blob:" not in body["reflection"]
+    assert "Intenção: Criar fábula" in body["reflection"]
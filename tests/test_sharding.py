@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from demo_orion import build_demo_orion
+from orion_nova.sharding import ShardedOrionNova
+
+
+def test_story_merges_both_shards_chronologically():
+    with ShardedOrionNova(factory=build_demo_orion, shards=2) as sharded:
+        channels = {sharded.shard_of(channel): channel for channel in ("galeria", "jornal", "rádio", "mural")}
+        assert len(channels) == 2
+        for number in range(4):
+            sharded.conscious_cycle([b"Ol\xc3\xa1"], f"Criar fábula {number}", channels[number % 2])
+        story = sharded.weave_story(["publicação"])
+        recalled = sharded.recall("publicação", limit=10)
+    assert [trace.tags[-1] for trace in recalled] == [channels[number % 2] for number in range(4)]
+    assert story == "\n".join(trace.summarise() for trace in recalled)
+    positions = [story.index(f"Criar fábula {number}") for number in range(4)]
+    assert positions == sorted(positions)
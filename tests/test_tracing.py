@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from orion_nova.tracing import CycleTimer, HistogramObserver, JsonLinesObserver, StageSpan
+
+
+class RecordingObserver:
+    def __init__(self) -> None:
+        self.spans: list[StageSpan] = []
+        self._lock = threading.Lock()
+
+    def on_start(self, stage: str) -> None:
+        pass
+
+    def on_stop(self, span: StageSpan) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+def test_concurrent_cycles_tag_their_spans_with_distinct_ids(orion):
+    orion.observer = RecordingObserver()
+    orion.conscious_cycles([([b"um"], "Criar fábula", "a"), ([b"dois"], "Criar fábula", "b")])
+    by_cycle: dict[int, set[str]] = {}
+    for span in orion.observer.spans:
+        by_cycle.setdefault(span.cycle_id, set()).add(span.stage)
+    assert len(by_cycle) == 2 and 0 not in by_cycle
+    assert all({"listen", "ethics", "reflect"} <= stages for stages in by_cycle.values())
+
+
+def test_histogram_summarises_each_stage():
+    histogram = HistogramObserver()
+    for duration_ns in (1_000, 3_000_000):
+        histogram.on_stop(StageSpan("compose", 0, duration_ns, 10, cycle_id=7))
+    summary = histogram.summary()["compose"]
+    assert summary["count"] == 2 and summary["payload_bytes"] == 20
+    assert summary["max_ms"] == 3.0
+    assert summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+
+
+def test_json_lines_export_one_record_per_span(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    observer = JsonLinesObserver(path)
+    timer = CycleTimer(observer, cycle_id=3)
+    timer.stop("listen", timer.start("listen"), 5)
+    timer.stop("reflect", timer.start("reflect"))
+    observer.close()
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(record["cycle"], record["stage"], record["payload_bytes"]) for record in records] == [
+        (3, "listen", 5),
+        (3, "reflect", 0),
+    ]
+    assert set(timer.timings) == {"listen", "reflect"}